@@ -1,4 +1,5 @@
-from db_client import PostgreSQLClient
+import streamlit as st
+from db_client import AbstractDBClient, PooledPostgreSQLClient
 from logger import configure_logger
 from service import ItemSalesPredictionEvaluationService, ItemSalesService, ItemService, RegionService, StoreService
 from view import build
@@ -6,10 +7,15 @@ from view import build
 logger = configure_logger(__name__)
 
 
+@st.experimental_singleton
+def get_db_client() -> AbstractDBClient:
+    return PooledPostgreSQLClient()
+
+
 def main():
     logger.info("now loading...")
     logger.info("start fun time")
-    db_client = PostgreSQLClient()
+    db_client = get_db_client()
     region_service = RegionService(db_client=db_client)
     store_service = StoreService(db_client=db_client)
     item_service = ItemService(db_client=db_client)
@@ -1,7 +1,7 @@
 from typing import Optional, Tuple
 
 import click
-from src.infrastructure.database import PostgreSQLClient
+from src.infrastructure.database import PooledPostgreSQLClient
 from src.middleware.logger import configure_logger
 from src.service.item_service import ItemService
 from src.service.store_service import StoreService
@@ -53,7 +53,7 @@ item_sales_records_path: {item_sales_records_path}
 latest_week_only: {latest_week_only}
     """
     )
-    db_client = PostgreSQLClient()
+    db_client = PooledPostgreSQLClient()
 
     table_service = TableService(db_client=db_client)
     store_service = StoreService(db_client=db_client)
@@ -1,5 +1,5 @@
 from datetime import date
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 import pandas as pd
 import psycopg2
@@ -39,25 +39,18 @@ class DBDataManager(object):
         region: Optional[str] = None,
     ) -> pd.DataFrame:
         item_sales: List[ItemSales] = []
-        limit = 10000
-        offset = 0
-        while True:
-            records = self.select_item_sales(
-                date_from=date_from,
-                date_to=date_to,
-                day_of_week=day_of_week,
-                item=item,
-                store=store,
-                region=region,
-                limit=limit,
-                offset=offset,
-            )
-            if len(records) == 0:
-                logger.info(f"done loading {len(item_sales)} records")
-                break
-            item_sales.extend(records)
-            offset += limit
-            logger.info(f"found {len(item_sales)} records...")
+        for record in self.stream_item_sales(
+            date_from=date_from,
+            date_to=date_to,
+            day_of_week=day_of_week,
+            item=item,
+            store=store,
+            region=region,
+        ):
+            item_sales.append(record)
+            if len(item_sales) % 10000 == 0:
+                logger.info(f"found {len(item_sales)} records...")
+        logger.info(f"done loading {len(item_sales)} records")
 
         df = pd.DataFrame([d.dict() for d in item_sales])
         df = BASE_SCHEMA.validate(df)
@@ -75,6 +68,20 @@ class DBDataManager(object):
                 rows = cursor.fetchall()
         return rows
 
+    def execute_select_query_stream(
+        self,
+        query: str,
+        parameters: Optional[Tuple] = None,
+        itersize: int = 10000,
+    ) -> Iterator[Dict[str, Any]]:
+        logger.debug(f"stream select query: {query}, parameters: {parameters}")
+        with self.db_client.get_connection() as conn:
+            with conn.cursor(name=f"stream_{get_uuid()}", cursor_factory=DictCursor) as cursor:
+                cursor.itersize = itersize
+                cursor.execute(query, parameters)
+                for row in cursor:
+                    yield row
+
     def execute_insert_or_update_query(
         self,
         query: str,
@@ -90,7 +97,7 @@ class DBDataManager(object):
                 conn.rollback()
                 raise e
 
-    def select_item_sales(
+    def __make_item_sales_query(
         self,
         date_from: Optional[date] = None,
         date_to: Optional[date] = None,
@@ -98,9 +105,7 @@ class DBDataManager(object):
         item: Optional[str] = None,
         store: Optional[str] = None,
         region: Optional[str] = None,
-        limit: int = 10000,
-        offset: int = 0,
-    ) -> List[ItemSales]:
+    ) -> Tuple[str, Tuple]:
         query = f"""
 SELECT
     {TABLES.ITEM_SALES_RECORDS.value}.date,
@@ -164,6 +169,27 @@ ON
             where += f"{prefix} {TABLES.REGIONS.value}.name = %s "
             parameters.append(region)
         query += where
+        return query, tuple(parameters)
+
+    def select_item_sales(
+        self,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        day_of_week: Optional[str] = None,
+        item: Optional[str] = None,
+        store: Optional[str] = None,
+        region: Optional[str] = None,
+        limit: int = 10000,
+        offset: int = 0,
+    ) -> List[ItemSales]:
+        query, parameters = self.__make_item_sales_query(
+            date_from=date_from,
+            date_to=date_to,
+            day_of_week=day_of_week,
+            item=item,
+            store=store,
+            region=region,
+        )
         query += f"""
 LIMIT 
     {limit}
@@ -173,11 +199,36 @@ OFFSET
 
         records = self.execute_select_query(
             query=query,
-            parameters=tuple(parameters),
+            parameters=parameters,
         )
         data = [ItemSales(**r) for r in records]
         return data
 
+    def stream_item_sales(
+        self,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        day_of_week: Optional[str] = None,
+        item: Optional[str] = None,
+        store: Optional[str] = None,
+        region: Optional[str] = None,
+        itersize: int = 10000,
+    ) -> Iterator[ItemSales]:
+        query, parameters = self.__make_item_sales_query(
+            date_from=date_from,
+            date_to=date_to,
+            day_of_week=day_of_week,
+            item=item,
+            store=store,
+            region=region,
+        )
+        for record in self.execute_select_query_stream(
+            query=query,
+            parameters=parameters,
+            itersize=itersize,
+        ):
+            yield ItemSales(**record)
+
     def select_earliest_day_item_sales(self) -> List[ItemSales]:
         query = f"""
 SELECT
@@ -11,7 +11,7 @@ from src.jobs.predict import Predictor
 from src.jobs.register import DataRegister
 from src.jobs.retrieve import DataRetriever
 from src.jobs.train import Trainer
-from src.middleware.db_client import PostgreSQLClient
+from src.middleware.db_client import PooledPostgreSQLClient
 from src.middleware.logger import configure_logger
 from src.models.models import MODELS
 from src.models.preprocess import DataPreprocessPipeline
@@ -37,7 +37,7 @@ def main(cfg: DictConfig):
     mlflow.set_tracking_uri(os.getenv("MLFLOW_TRACKING_URI", "http://mlflow:5000"))
     mlflow.set_experiment(cfg.name)
     with mlflow.start_run(run_name=run_name) as run:
-        db_client = PostgreSQLClient()
+        db_client = PooledPostgreSQLClient()
         db_data_manager = DBDataManager(db_client=db_client)
         data_retriever = DataRetriever(db_data_manager=db_data_manager)
 
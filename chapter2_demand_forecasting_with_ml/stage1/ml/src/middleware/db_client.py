@@ -1,11 +1,26 @@
 import os
+import threading
+import time
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
 
 import psycopg2
+from prometheus_client import Histogram
+from psycopg2.pool import PoolError, ThreadedConnectionPool
 from src.middleware.logger import configure_logger
 
 logger = configure_logger(__name__)
 
+POSTGRES_POOL_WAIT_SECONDS = Histogram(
+    "postgres_pool_wait_seconds",
+    "Seconds waited for a pooled postgres connection",
+)
+POSTGRES_POOL_CHECKOUT_SECONDS = Histogram(
+    "postgres_pool_checkout_seconds",
+    "Seconds a pooled postgres connection is held",
+)
+
 
 class AbstractDBClient(ABC):
     def __init__(self):
@@ -27,3 +42,123 @@ class PostgreSQLClient(AbstractDBClient):
 
     def get_connection(self):
         return psycopg2.connect(self.__connection_string)
+
+
+class PooledPostgreSQLClient(AbstractDBClient):
+    def __init__(self):
+        self.__postgresql_user = os.getenv("POSTGRES_USER")
+        self.__postgresql_password = os.getenv("POSTGRES_PASSWORD")
+        self.__postgresql_port = int(os.getenv("POSTGRES_PORT", 5432))
+        self.__postgresql_dbname = os.getenv("POSTGRES_DBNAME")
+        self.__postgresql_host = os.getenv("POSTGRES_HOST")
+        self.__connection_string = f"host={self.__postgresql_host} port={self.__postgresql_port} dbname={self.__postgresql_dbname} user={self.__postgresql_user} password={self.__postgresql_password}"
+        self.min_size = int(os.getenv("POSTGRES_POOL_MIN_SIZE", 1))
+        self.max_size = int(os.getenv("POSTGRES_POOL_MAX_SIZE", 10))
+        self.max_lifetime_second = float(os.getenv("POSTGRES_POOL_MAX_LIFETIME_SECOND", 60 * 30))
+        self.wait_timeout_second = float(os.getenv("POSTGRES_POOL_WAIT_TIMEOUT_SECOND", 30))
+        self.health_check_interval_second = float(os.getenv("POSTGRES_POOL_HEALTH_CHECK_INTERVAL_SECOND", 30))
+
+        self.__lock = threading.Lock()
+        self.__pid: Optional[int] = None
+        self.__pool: Optional[ThreadedConnectionPool] = None
+        self.__semaphore: Optional[threading.BoundedSemaphore] = None
+        self.__created_at: Dict[int, float] = {}
+        self.__used_at: Dict[int, float] = {}
+        self.__inherited_pools: List[ThreadedConnectionPool] = []
+
+    def __get_pool(self) -> Tuple[ThreadedConnectionPool, threading.BoundedSemaphore]:
+        with self.__lock:
+            pid = os.getpid()
+            if self.__pool is None or self.__pid != pid:
+                if self.__pool is not None:
+                    # connections inherited through fork belong to the parent; closing them here would end its sessions
+                    self.__inherited_pools.append(self.__pool)
+                self.__pool = ThreadedConnectionPool(
+                    minconn=self.min_size,
+                    maxconn=self.max_size,
+                    dsn=self.__connection_string,
+                )
+                self.__semaphore = threading.BoundedSemaphore(self.max_size)
+                self.__pid = pid
+                self.__created_at = {}
+                self.__used_at = {}
+            return self.__pool, self.__semaphore
+
+    def __is_healthy(
+        self,
+        connection,
+    ) -> bool:
+        if connection.closed:
+            return False
+        now = time.monotonic()
+        key = id(connection)
+        with self.__lock:
+            created_at = self.__created_at.setdefault(key, now)
+            used_at = self.__used_at.get(key, now)
+        if now - created_at > self.max_lifetime_second:
+            return False
+        if now - used_at < self.health_check_interval_second:
+            return True
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            connection.rollback()
+            return True
+        except psycopg2.Error:
+            return False
+
+    def __discard(
+        self,
+        pool: ThreadedConnectionPool,
+        connection,
+    ):
+        with self.__lock:
+            self.__created_at.pop(id(connection), None)
+            self.__used_at.pop(id(connection), None)
+        pool.putconn(connection, close=True)
+
+    def __checkout(
+        self,
+        pool: ThreadedConnectionPool,
+    ):
+        while True:
+            connection = pool.getconn()
+            if self.__is_healthy(connection=connection):
+                return connection
+            self.__discard(
+                pool=pool,
+                connection=connection,
+            )
+
+    @contextmanager
+    def get_connection(self) -> Iterator:
+        pool, semaphore = self.__get_pool()
+        waited_from = time.perf_counter()
+        if not semaphore.acquire(timeout=self.wait_timeout_second):
+            raise PoolError(f"no postgres connection available within {self.wait_timeout_second} seconds")
+        checked_out_at = time.perf_counter()
+        POSTGRES_POOL_WAIT_SECONDS.observe(checked_out_at - waited_from)
+        connection = None
+        try:
+            connection = self.__checkout(pool=pool)
+            with connection:
+                yield connection
+        finally:
+            if connection is not None:
+                if connection.closed:
+                    self.__discard(
+                        pool=pool,
+                        connection=connection,
+                    )
+                else:
+                    with self.__lock:
+                        self.__used_at[id(connection)] = time.monotonic()
+                    pool.putconn(connection)
+            semaphore.release()
+            POSTGRES_POOL_CHECKOUT_SECONDS.observe(time.perf_counter() - checked_out_at)
+
+    def close(self):
+        with self.__lock:
+            if self.__pool is not None and self.__pid == os.getpid():
+                self.__pool.closeall()
+                self.__pool = None
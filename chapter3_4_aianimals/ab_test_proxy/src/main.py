@@ -3,6 +3,7 @@ from logging import getLogger
 from fastapi import FastAPI
 from src.configurations import Configurations
 from src.proxy import proxy
+from src.registry.container import container
 
 logger = getLogger(__name__)
 
@@ -18,6 +19,12 @@ app = FastAPI(
     redoc_url=f"{base_prefix}/redoc",
 )
 
+
+@app.on_event("shutdown")
+async def shutdown():
+    await container.close()
+
+
 app.include_router(
     proxy.router,
     prefix=f"{base_prefix}/proxy",
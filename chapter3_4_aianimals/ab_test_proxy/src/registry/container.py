@@ -19,6 +19,10 @@ class ABTestConfiguration(BaseModel):
     animal_ab_test_animal_ids: Optional[AnimalIDs] = None
     timeout: float = 10.0
     retries: int = 2
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 60.0
+    http2: bool = True
 
 
 class Container(object):
@@ -57,6 +61,10 @@ class Container(object):
             animal_ab_test_animal_ids=animal_ab_test_animal_ids,
             timeout=d.get("timeout", 10.0),
             retries=d.get("retries", 2),
+            max_connections=d.get("max_connections", 100),
+            max_keepalive_connections=d.get("max_keepalive_connections", 20),
+            keepalive_expiry=d.get("keepalive_expiry", 60.0),
+            http2=d.get("http2", True),
         )
         logger.info(
             f"""
@@ -74,28 +82,44 @@ AB TEST CONFIGURATION
                 random_distribution=self.ab_test_configuration.random_ab_test_random_distribution,
                 timeout=self.ab_test_configuration.timeout,
                 retries=self.ab_test_configuration.retries,
+                max_connections=self.ab_test_configuration.max_connections,
+                max_keepalive_connections=self.ab_test_configuration.max_keepalive_connections,
+                keepalive_expiry=self.ab_test_configuration.keepalive_expiry,
+                http2=self.ab_test_configuration.http2,
             )
             logger.info("Initialized as RANDOM AB TEST")
         elif self.ab_test_configuration.ab_test_type == ABTestType.USER:
             if self.ab_test_configuration.user_ab_test_user_ids is None:
                 raise ValueError
             self.test_service = UserTestService(
-                user_ab_test_user_ids=self.ab_test_configuration.user_ab_test_user_ids,
+                user_ids=self.ab_test_configuration.user_ab_test_user_ids,
                 timeout=self.ab_test_configuration.timeout,
                 retries=self.ab_test_configuration.retries,
+                max_connections=self.ab_test_configuration.max_connections,
+                max_keepalive_connections=self.ab_test_configuration.max_keepalive_connections,
+                keepalive_expiry=self.ab_test_configuration.keepalive_expiry,
+                http2=self.ab_test_configuration.http2,
             )
             logger.info("Initialized as USER AB TEST")
         elif self.ab_test_configuration.ab_test_type == ABTestType.ANIMAL:
             if self.ab_test_configuration.animal_ab_test_animal_ids is None:
                 raise ValueError
             self.test_service = AnimalTestService(
-                animal_ab_test_animal_ids=self.ab_test_configuration.animal_ab_test_animal_ids,
+                animal_ids=self.ab_test_configuration.animal_ab_test_animal_ids,
                 timeout=self.ab_test_configuration.timeout,
                 retries=self.ab_test_configuration.retries,
+                max_connections=self.ab_test_configuration.max_connections,
+                max_keepalive_connections=self.ab_test_configuration.max_keepalive_connections,
+                keepalive_expiry=self.ab_test_configuration.keepalive_expiry,
+                http2=self.ab_test_configuration.http2,
             )
             logger.info("Initialized as ANIMAL AB TEST")
         else:
             raise ValueError
 
+    async def close(self):
+        if self.test_service is not None:
+            await self.test_service.close()
+
 
 container = Container(ab_test_configuration_path=Configurations.ab_test_configuration)
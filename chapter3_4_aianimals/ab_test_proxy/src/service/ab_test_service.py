@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
 from enum import Enum
+from importlib.util import find_spec
 from logging import getLogger
 from typing import Dict, List, Optional
 
@@ -43,11 +44,26 @@ class AbstractTestService(ABC):
         self,
         timeout: float = 10.0,
         retries: int = 2,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 60.0,
+        http2: bool = True,
     ):
         self.timeout = timeout
         self.retries = retries
+        self.http2 = http2 and find_spec("h2") is not None
         self.transport = httpx.AsyncHTTPTransport(
             retries=self.retries,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+            ),
+            http2=self.http2,
+        )
+        self.client = httpx.AsyncClient(
+            timeout=self.timeout,
+            transport=self.transport,
         )
         self.post_header: Dict[str, str] = {
             "accept": "application/json",
@@ -67,3 +83,6 @@ class AbstractTestService(ABC):
         request: Request,
     ) -> Response:
         raise NotImplementedError
+
+    async def close(self):
+        await self.client.aclose()
@@ -22,10 +22,18 @@ class AbstractAnimalTestService(AbstractTestService, ABC):
         self,
         timeout: float = 10.0,
         retries: int = 2,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 60.0,
+        http2: bool = True,
     ):
         super().__init__(
             timeout=timeout,
             retries=retries,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+            http2=http2,
         )
 
     @abstractmethod
@@ -49,10 +57,18 @@ class AnimalTestService(AbstractAnimalTestService):
         animal_ids: AnimalIDs,
         timeout: float = 10,
         retries: int = 2,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 60.0,
+        http2: bool = True,
     ):
         super().__init__(
             timeout=timeout,
             retries=retries,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+            http2=http2,
         )
         self.animal_ids = animal_ids
         logger.info(f"initialized user ab test: {self.animal_ids}")
@@ -84,22 +100,18 @@ class AnimalTestService(AbstractAnimalTestService):
         request: BaseAnimalRequest,
         endpoint: Endpoint,
     ) -> BaseAnimalResponse:
-        async with httpx.AsyncClient(
-            timeout=self.timeout,
-            transport=self.transport,
-        ) as client:
-            res = await client.post(
-                url=endpoint.endpoint,
-                headers=self.post_header,
-                data=json.dumps(request.request, default=json_serial),
-            )
-            try:
-                res.raise_for_status()
-            except httpx.HTTPStatusError as e:
-                logger.error(e)
-            data = res.json()
-            response = BaseAnimalResponse(
-                endpoint=endpoint.endpoint,
-                response=data,
-            )
-            return response
+        res = await self.client.post(
+            url=endpoint.endpoint,
+            headers=self.post_header,
+            data=json.dumps(request.request, default=json_serial),
+        )
+        try:
+            res.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            logger.error(e)
+        data = res.json()
+        response = BaseAnimalResponse(
+            endpoint=endpoint.endpoint,
+            response=data,
+        )
+        return response
@@ -35,10 +35,18 @@ class AbstractRandomABTestService(AbstractTestService, ABC):
         self,
         timeout: float = 10.0,
         retries: int = 2,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 60.0,
+        http2: bool = True,
     ):
         super().__init__(
             timeout=timeout,
             retries=retries,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+            http2=http2,
         )
 
     @abstractmethod
@@ -76,10 +84,18 @@ class RandomABTestService(AbstractRandomABTestService):
         random_distribution: RandomDistribution,
         timeout: float = 10.0,
         retries: int = 2,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 60.0,
+        http2: bool = True,
     ):
         super().__init__(
             timeout=timeout,
             retries=retries,
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+            http2=http2,
         )
         self.random_distribution = random_distribution
         logger.info(f"initialized random distribution: {self.random_distribution}")
@@ -129,22 +145,18 @@ class RandomABTestService(AbstractRandomABTestService):
         request: BaseRandomABTestRequest,
         endpoint: Endpoint,
     ) -> BaseRandomABTestResponse:
-        async with httpx.AsyncClient(
-            timeout=self.timeout,
-            transport=self.transport,
-        ) as client:
-            res = await client.post(
-                url=endpoint.endpoint,
-                headers=self.post_header,
-                data=json.dumps(request.request, default=json_serial),
-            )
-            try:
-                res.raise_for_status()
-            except httpx.HTTPStatusError as e:
-                logger.error(e)
-            data = res.json()
-            response = BaseRandomABTestResponse(
-                endpoint=endpoint.endpoint,
-                response=data,
-            )
-            return response
+        res = await self.client.post(
+            url=endpoint.endpoint,
+            headers=self.post_header,
+            data=json.dumps(request.request, default=json_serial),
+        )
+        try:
+            res.raise_for_status()
+        except httpx.HTTPStatusError as e:
+            logger.error(e)
+        data = res.json()
+        response = BaseRandomABTestResponse(
+            endpoint=endpoint.endpoint,
+            response=data,
+        )
+        return response
@@ -20,7 +20,26 @@ class Configurations:
         if k.startswith("ANIMAL_VIOLATION_QUEUE_"):
             animal_violation_queues.append(v)
 
+    async_mode = bool(int(os.getenv("ASYNC_MODE", "0")))
+    async_database_pool_size = int(os.getenv("ASYNC_DATABASE_POOL_SIZE", 10))
+    async_database_max_overflow = int(os.getenv("ASYNC_DATABASE_MAX_OVERFLOW", 20))
+
+    search_prefetch_similar_words = bool(int(os.getenv("SEARCH_PREFETCH_SIMILAR_WORDS", "0")))
+
     learn_to_rank_url = os.getenv("LEARN_TO_RANK_URL", None)
     learn_to_rank_ab_test = bool(int(os.getenv("LEARN_TO_RANK_AB_TEST", "0")))
 
     similar_image_search_url = os.getenv("SIMILAR_IMAGE_SEARCH_URL", None)
+
+    http_timeout = float(os.getenv("HTTP_TIMEOUT", 10.0))
+    http_retries = int(os.getenv("HTTP_RETRIES", 3))
+    http_max_connections = int(os.getenv("HTTP_MAX_CONNECTIONS", 100))
+    http_max_keepalive_connections = int(os.getenv("HTTP_MAX_KEEPALIVE_CONNECTIONS", 20))
+    http_keepalive_expiry = float(os.getenv("HTTP_KEEPALIVE_EXPIRY", 60.0))
+    http2 = bool(int(os.getenv("HTTP2", "1")))
+
+    token_cache_enabled = bool(int(os.getenv("TOKEN_CACHE_ENABLED", "1")))
+    token_cache_ttl_second = int(os.getenv("TOKEN_CACHE_TTL_SECOND", 60))
+    token_cache_max_size = int(os.getenv("TOKEN_CACHE_MAX_SIZE", 10000))
+    token_cache_redis_enabled = bool(int(os.getenv("TOKEN_CACHE_REDIS_ENABLED", "0")))
+    token_cache_redis_ttl_second = int(os.getenv("TOKEN_CACHE_REDIS_TTL_SECOND", 600))
@@ -1,9 +1,10 @@
 import os
 from abc import ABC, abstractmethod
 from logging import getLogger
-from typing import Optional, Union
+from typing import List, Optional, Union
 
 import redis
+import redis.asyncio as aioredis
 
 logger = getLogger(__name__)
 
@@ -28,6 +29,20 @@ class AbstractCache(ABC):
     ) -> Optional[Union[str, int, float, bool, bytes]]:
         raise NotImplementedError
 
+    @abstractmethod
+    def mget(
+        self,
+        keys: List[str],
+    ) -> List[Optional[Union[str, int, float, bool, bytes]]]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def delete(
+        self,
+        key: str,
+    ):
+        raise NotImplementedError
+
 
 class RedisCache(AbstractCache):
     def __init__(self):
@@ -61,3 +76,109 @@ class RedisCache(AbstractCache):
     ) -> Optional[Union[str, int, float, bool, bytes]]:
         value = self.redis_client.get(key)
         return value
+
+    def mget(
+        self,
+        keys: List[str],
+    ) -> List[Optional[Union[str, int, float, bool, bytes]]]:
+        if len(keys) == 0:
+            return []
+        values = self.redis_client.mget(keys)
+        return values
+
+    def delete(
+        self,
+        key: str,
+    ):
+        self.redis_client.delete(key)
+
+
+class AbstractAsyncCache(ABC):
+    def __init__(self):
+        pass
+
+    @abstractmethod
+    async def set(
+        self,
+        key: str,
+        value: Union[str, int, float, bool, bytes],
+        expire_second: int = 600,
+    ):
+        raise NotImplementedError
+
+    @abstractmethod
+    async def get(
+        self,
+        key: str,
+    ) -> Optional[Union[str, int, float, bool, bytes]]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def mget(
+        self,
+        keys: List[str],
+    ) -> List[Optional[Union[str, int, float, bool, bytes]]]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def delete(
+        self,
+        key: str,
+    ):
+        raise NotImplementedError
+
+    @abstractmethod
+    async def close(self):
+        raise NotImplementedError
+
+
+class AsyncRedisCache(AbstractAsyncCache):
+    def __init__(self):
+        super().__init__()
+        self.__redis_host = os.environ["REDIS_HOST"]
+        self.__redis_port = os.getenv("REDIS_PORT", 6379)
+        self.__redis_db = int(os.getenv("REDIS_DB", 0))
+
+        self.redis_client = aioredis.Redis(
+            host=self.__redis_host,
+            port=self.__redis_port,
+            db=self.__redis_db,
+            decode_responses=True,
+        )
+
+    async def set(
+        self,
+        key: str,
+        value: Union[str, int, float, bool, bytes],
+        expire_second: int = 600,
+    ):
+        await self.redis_client.set(
+            name=key,
+            value=value,
+            ex=expire_second,
+        )
+
+    async def get(
+        self,
+        key: str,
+    ) -> Optional[Union[str, int, float, bool, bytes]]:
+        value = await self.redis_client.get(key)
+        return value
+
+    async def mget(
+        self,
+        keys: List[str],
+    ) -> List[Optional[Union[str, int, float, bool, bytes]]]:
+        if len(keys) == 0:
+            return []
+        values = await self.redis_client.mget(keys)
+        return values
+
+    async def delete(
+        self,
+        key: str,
+    ):
+        await self.redis_client.delete(key)
+
+    async def close(self):
+        await self.redis_client.close()
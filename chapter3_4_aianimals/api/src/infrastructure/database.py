@@ -4,6 +4,7 @@ from logging import getLogger
 
 from sqlalchemy import create_engine
 from sqlalchemy.engine import Engine
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 from sqlalchemy.orm import sessionmaker
 
 logger = getLogger(__name__)
@@ -51,3 +52,61 @@ class PostgreSQLDatabase(AbstractDatabase):
             db.rollback()
         finally:
             db.close()
+
+
+class AbstractAsyncDatabase(ABC):
+    def __init__(self):
+        self.engine: AsyncEngine
+
+    @abstractmethod
+    async def get_session(self):
+        raise NotImplementedError
+
+    @abstractmethod
+    async def close(self):
+        raise NotImplementedError
+
+
+class AsyncPostgreSQLDatabase(AbstractAsyncDatabase):
+    def __init__(
+        self,
+        pool_size: int = 10,
+        max_overflow: int = 20,
+    ):
+        super().__init__()
+
+        self.__postgres_username = os.getenv("POSTGRES_USER")
+        self.__postgres_password = os.getenv("POSTGRES_PASSWORD")
+        self.__postgres_port = int(os.getenv("POSTGRES_PORT", 5432))
+        self.__postgres_db = os.getenv("POSTGRES_DB")
+        self.__postgres_server = os.getenv("POSTGRES_HOST")
+
+        self.__sql_alchemy_database_url = f"postgresql+asyncpg://{self.__postgres_username}:{self.__postgres_password}@{self.__postgres_server}:{self.__postgres_port}/{self.__postgres_db}"
+
+        self.engine: AsyncEngine = create_async_engine(
+            self.__sql_alchemy_database_url,
+            pool_size=pool_size,
+            max_overflow=max_overflow,
+            pool_recycle=3600,
+            echo=False,
+        )
+
+        self.session_local = sessionmaker(
+            autocommit=False,
+            autoflush=False,
+            expire_on_commit=False,
+            bind=self.engine,
+            class_=AsyncSession,
+        )
+
+    async def get_session(self):
+        db = self.session_local()
+        try:
+            yield db
+        except:
+            await db.rollback()
+        finally:
+            await db.close()
+
+    async def close(self):
+        await self.engine.dispose()
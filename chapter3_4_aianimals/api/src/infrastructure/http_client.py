@@ -0,0 +1,59 @@
+from abc import ABC, abstractmethod
+from importlib.util import find_spec
+from logging import getLogger
+
+import httpx
+
+logger = getLogger(__name__)
+
+
+class AbstractHTTPClient(ABC):
+    def __init__(self):
+        self.client: httpx.Client
+        self.async_client: httpx.AsyncClient
+
+    @abstractmethod
+    async def close(self):
+        raise NotImplementedError
+
+
+class PooledHTTPClient(AbstractHTTPClient):
+    def __init__(
+        self,
+        timeout: float = 10.0,
+        retries: int = 3,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 60.0,
+        http2: bool = True,
+    ):
+        super().__init__()
+        self.http2 = http2 and find_spec("h2") is not None
+        if http2 and not self.http2:
+            logger.info("h2 is not installed; falling back to HTTP/1.1")
+        limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.client = httpx.Client(
+            timeout=timeout,
+            transport=httpx.HTTPTransport(
+                retries=retries,
+                limits=limits,
+                http2=self.http2,
+            ),
+        )
+        self.async_client = httpx.AsyncClient(
+            timeout=timeout,
+            transport=httpx.AsyncHTTPTransport(
+                retries=retries,
+                limits=limits,
+                http2=self.http2,
+            ),
+        )
+        logger.info(f"initialized pooled http client: {limits}, http2: {self.http2}")
+
+    async def close(self):
+        self.client.close()
+        await self.async_client.aclose()
@@ -1,47 +1,18 @@
 import os
 from abc import ABC, abstractmethod
 from logging import getLogger
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 
-from elasticsearch import Elasticsearch
+from elasticsearch import AsyncElasticsearch, Elasticsearch
 from src.entities.animal import AnimalSearchQuery, AnimalSearchResult, AnimalSearchResults, AnimalSearchSortKey
 
 logger = getLogger(__name__)
 
 
-class AbstractSearch(ABC):
+class ElasticsearchQueryBuilder(object):
     def __init__(self):
         pass
 
-    @abstractmethod
-    def search(
-        self,
-        index: str,
-        query: AnimalSearchQuery,
-        from_: int = 0,
-        size: int = 100,
-    ) -> AnimalSearchResults:
-        raise NotImplementedError
-
-
-class ElasticsearchClient(AbstractSearch):
-    def __init__(self):
-        super().__init__()
-        self.__es_host = os.getenv("ES_HOST", "http://es:9200")
-        self.__es_verify_certs = bool(int(os.getenv("ES_VERIFY_CERTS", 0)))
-        self.__es_user = os.getenv("ES_USER", None)
-        self.__es_password = os.getenv("ES_PASSWORD", None)
-        self.__basic_auth = (
-            (self.__es_user, self.__es_password)
-            if self.__es_user is not None and self.__es_password is not None
-            else None
-        )
-        self.es_client = Elasticsearch(
-            hosts=[self.__es_host],
-            verify_certs=self.__es_verify_certs,
-            basic_auth=self.__basic_auth,
-        )
-
     def __add_must(
         self,
         key: str,
@@ -108,13 +79,10 @@ class ElasticsearchClient(AbstractSearch):
                 )
         return sort
 
-    def search(
+    def make_query(
         self,
-        index: str,
         query: AnimalSearchQuery,
-        from_: int = 0,
-        size: int = 100,
-    ) -> AnimalSearchResults:
+    ) -> Tuple[Dict, List[Union[str, Dict]]]:
         q: Dict[str, Dict] = {"bool": {}}
         musts = []
         shoulds = []
@@ -163,13 +131,14 @@ class ElasticsearchClient(AbstractSearch):
         if len(q["bool"]) == 0:
             q = {"match_all": {}}
         sort = self.__make_sort(key=query.sort_by if query is not None else None)
-        searched = self.es_client.search(
-            index=index,
-            query=q,
-            sort=sort,
-            from_=from_,
-            size=size,
-        )
+        return q, sort
+
+    def make_results(
+        self,
+        searched: Dict,
+        from_: int = 0,
+        size: int = 100,
+    ) -> AnimalSearchResults:
         if searched["hits"]["total"]["value"] == 0:
             return AnimalSearchResults(
                 hits=0,
@@ -201,3 +170,122 @@ class ElasticsearchClient(AbstractSearch):
                 ),
             )
         return results
+
+
+class AbstractSearch(ABC):
+    def __init__(self):
+        pass
+
+    @abstractmethod
+    def search(
+        self,
+        index: str,
+        query: AnimalSearchQuery,
+        from_: int = 0,
+        size: int = 100,
+    ) -> AnimalSearchResults:
+        raise NotImplementedError
+
+
+class ElasticsearchClient(AbstractSearch):
+    def __init__(self):
+        super().__init__()
+        self.__es_host = os.getenv("ES_HOST", "http://es:9200")
+        self.__es_verify_certs = bool(int(os.getenv("ES_VERIFY_CERTS", 0)))
+        self.__es_user = os.getenv("ES_USER", None)
+        self.__es_password = os.getenv("ES_PASSWORD", None)
+        self.__basic_auth = (
+            (self.__es_user, self.__es_password)
+            if self.__es_user is not None and self.__es_password is not None
+            else None
+        )
+        self.es_client = Elasticsearch(
+            hosts=[self.__es_host],
+            verify_certs=self.__es_verify_certs,
+            basic_auth=self.__basic_auth,
+        )
+        self.query_builder = ElasticsearchQueryBuilder()
+
+    def search(
+        self,
+        index: str,
+        query: AnimalSearchQuery,
+        from_: int = 0,
+        size: int = 100,
+    ) -> AnimalSearchResults:
+        q, sort = self.query_builder.make_query(query=query)
+        searched = self.es_client.search(
+            index=index,
+            query=q,
+            sort=sort,
+            from_=from_,
+            size=size,
+        )
+        return self.query_builder.make_results(
+            searched=searched,
+            from_=from_,
+            size=size,
+        )
+
+
+class AbstractAsyncSearch(ABC):
+    def __init__(self):
+        pass
+
+    @abstractmethod
+    async def search(
+        self,
+        index: str,
+        query: AnimalSearchQuery,
+        from_: int = 0,
+        size: int = 100,
+    ) -> AnimalSearchResults:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def close(self):
+        raise NotImplementedError
+
+
+class AsyncElasticsearchClient(AbstractAsyncSearch):
+    def __init__(self):
+        super().__init__()
+        self.__es_host = os.getenv("ES_HOST", "http://es:9200")
+        self.__es_verify_certs = bool(int(os.getenv("ES_VERIFY_CERTS", 0)))
+        self.__es_user = os.getenv("ES_USER", None)
+        self.__es_password = os.getenv("ES_PASSWORD", None)
+        self.__basic_auth = (
+            (self.__es_user, self.__es_password)
+            if self.__es_user is not None and self.__es_password is not None
+            else None
+        )
+        self.es_client = AsyncElasticsearch(
+            hosts=[self.__es_host],
+            verify_certs=self.__es_verify_certs,
+            basic_auth=self.__basic_auth,
+        )
+        self.query_builder = ElasticsearchQueryBuilder()
+
+    async def search(
+        self,
+        index: str,
+        query: AnimalSearchQuery,
+        from_: int = 0,
+        size: int = 100,
+    ) -> AnimalSearchResults:
+        q, sort = self.query_builder.make_query(query=query)
+        searched = await self.es_client.search(
+            index=index,
+            query=q,
+            sort=sort,
+            from_=from_,
+            size=size,
+        )
+        return self.query_builder.make_results(
+            searched=searched,
+            from_=from_,
+            size=size,
+        )
+
+    async def close(self):
+        await self.es_client.close()
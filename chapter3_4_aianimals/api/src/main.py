@@ -2,9 +2,11 @@ from logging import getLogger
 
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
+from prometheus_client import make_asgi_app
 from src.api import access_log, animal, animal_category, health_check, like, metadata, user, violation
 from src.configurations import Configurations
 from src.exceptions.custom_exceptions import APINotAllowedException, DatabaseException, StorageClientException
+from src.registry.container import container
 
 logger = getLogger(__name__)
 
@@ -21,6 +23,11 @@ app = FastAPI(
 )
 
 
+@app.on_event("shutdown")
+async def shutdown():
+    await container.close()
+
+
 @app.exception_handler(DatabaseException)
 async def database_exception_handler(
     request: Request,
@@ -75,8 +82,15 @@ app.include_router(
     tags=["user"],
 )
 
+if Configurations.async_mode:
+    from src.api import async_animal
+
+    animal_router = async_animal.router
+else:
+    animal_router = animal.router
+
 app.include_router(
-    animal.router,
+    animal_router,
     prefix=f"{base_prefix}/animal",
     tags=["animal"],
 )
@@ -104,3 +118,5 @@ app.include_router(
     prefix=f"{base_prefix}/metadata",
     tags=["metadata"],
 )
+
+app.mount("/metrics", make_asgi_app())
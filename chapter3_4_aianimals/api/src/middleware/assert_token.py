@@ -1,6 +1,7 @@
-from typing import Tuple
+from typing import Tuple, Union
 
 from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from src.constants import CONSTANTS
 from src.entities.user import UserLoginQuery
@@ -10,8 +11,12 @@ from starlette.status import HTTP_403_FORBIDDEN
 
 async def token_assertion(
     token: str,
-    session: Session,
+    session: Union[Session, AsyncSession],
 ) -> Tuple[bool, str]:
+    cached_user_id = container.token_cache.get(token=token)
+    if cached_user_id is not None:
+        return True, cached_user_id
+
     try:
         raw_token = container.crypt.decrypt(enc_text=token)
     except Exception:
@@ -31,13 +36,23 @@ async def token_assertion(
         handle_name=handle_name,
         password=password,
     )
-    login_assertion = container.user_repository.assert_login(
-        session=session,
-        login_query=login_query,
-    )
+    if isinstance(session, AsyncSession):
+        login_assertion = await session.run_sync(
+            container.user_repository.assert_login,
+            login_query=login_query,
+        )
+    else:
+        login_assertion = container.user_repository.assert_login(
+            session=session,
+            login_query=login_query,
+        )
     if login_assertion is None:
         raise HTTPException(
             status_code=HTTP_403_FORBIDDEN,
             detail="authorization failure",
         )
+    container.token_cache.set(
+        token=token,
+        user_id=user_id,
+    )
     return True, user_id
@@ -0,0 +1,40 @@
+import time
+from contextlib import contextmanager
+from logging import getLogger
+from typing import Dict, Iterator
+
+from prometheus_client import Histogram
+
+logger = getLogger(__name__)
+
+STAGE_SECONDS = Histogram(
+    "request_stage_seconds",
+    "Elapsed seconds per stage of a request",
+    ["name", "stage"],
+)
+
+
+class StageTimer(object):
+    def __init__(
+        self,
+        name: str,
+    ):
+        self.name = name
+        self.durations: Dict[str, float] = {}
+
+    @contextmanager
+    def measure(
+        self,
+        stage: str,
+    ) -> Iterator[None]:
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self.durations[stage] = elapsed
+            STAGE_SECONDS.labels(name=self.name, stage=stage).observe(elapsed)
+
+    def log(self):
+        durations = ", ".join([f"{k}: {v * 1000:.2f}ms" for k, v in self.durations.items()])
+        logger.info(f"{self.name} stages: {durations}")
@@ -1,11 +1,18 @@
 from logging import getLogger
+from typing import Optional
 
 from src.configurations import Configurations
 from src.constants import RUN_ENVIRONMENT
-from src.infrastructure.cache import AbstractCache, RedisCache
-from src.infrastructure.database import AbstractDatabase, PostgreSQLDatabase
+from src.infrastructure.cache import AbstractAsyncCache, AbstractCache, AsyncRedisCache, RedisCache
+from src.infrastructure.database import (
+    AbstractAsyncDatabase,
+    AbstractDatabase,
+    AsyncPostgreSQLDatabase,
+    PostgreSQLDatabase,
+)
+from src.infrastructure.http_client import AbstractHTTPClient, PooledHTTPClient
 from src.infrastructure.messaging import AbstractMessaging, RabbitmqMessaging
-from src.infrastructure.search import AbstractSearch, ElasticsearchClient
+from src.infrastructure.search import AbstractAsyncSearch, AbstractSearch, AsyncElasticsearchClient, ElasticsearchClient
 from src.infrastructure.storage import AbstractStorage, LocalStorage
 from src.middleware.crypt import AbstractCrypt, Crypt
 from src.repository.access_log_repository import AbstractAccessLogRepository, AccessLogRepository
@@ -26,10 +33,12 @@ from src.service.similar_image_search import (
     PseudoSimilarImageSearchService,
     SimilarImageSearchService,
 )
+from src.service.token_cache import AbstractTokenCache, NoTokenCache, TokenCache
 from src.usecase.access_log_usecase import AbstractAccessLogUsecase, AccessLogUsecase
 from src.usecase.animal_category_usecase import AbstractAnimalCategoryUsecase, AnimalCategoryUsecase
 from src.usecase.animal_subcategory_usecase import AbstractAnimalSubcategoryUsecase, AnimalSubcategoryUsecase
 from src.usecase.animal_usecase import AbstractAnimalUsecase, AnimalUsecase
+from src.usecase.async_animal_usecase import AbstractAsyncAnimalUsecase, AsyncAnimalUsecase
 from src.usecase.like_usecase import AbstractLikeUsecase, LikeUsecase
 from src.usecase.metadata_usecase import AbstractMetadataUsecase, MetadataUsecase
 from src.usecase.user_usecase import AbstractUserUsecase, UserUsecase
@@ -50,6 +59,11 @@ class Container(object):
         crypt: AbstractCrypt,
         learn_to_rank: AbstractLearnToRankService,
         similar_image_search: AbstractSimilarImageSearchService,
+        token_cache: AbstractTokenCache,
+        http_client: AbstractHTTPClient,
+        async_database: Optional[AbstractAsyncDatabase] = None,
+        async_cache: Optional[AbstractAsyncCache] = None,
+        async_search_client: Optional[AbstractAsyncSearch] = None,
     ):
         self.database = database
         self.storage_client = storage_client
@@ -60,6 +74,11 @@ class Container(object):
         for q in Configurations.animal_violation_queues:
             self.messaging.create_queue(queue_name=q)
         self.crypt = crypt
+        self.token_cache = token_cache
+        self.http_client = http_client
+        self.async_database = async_database
+        self.async_cache = async_cache
+        self.async_search_client = async_search_client
 
         self.animal_category_repository: AbstractAnimalCategoryRepository = AnimalCategoryRepository()
         self.animal_subcategory_repository: AbstractAnimalSubcategoryRepository = AnimalSubcategoryRepository()
@@ -100,6 +119,17 @@ class Container(object):
             messaging=self.messaging,
             local_cache=self.local_cache,
         )
+        self.async_animal_usecase: Optional[AbstractAsyncAnimalUsecase] = None
+        if self.async_cache is not None and self.async_search_client is not None:
+            self.async_animal_usecase = AsyncAnimalUsecase(
+                animal_repository=self.animal_repository,
+                like_repository=self.like_repository,
+                learn_to_rank=self.learn_to_rank,
+                similar_image_search=self.similar_image_search,
+                cache=self.async_cache,
+                search_client=self.async_search_client,
+                local_cache=self.local_cache,
+            )
         self.like_usecase: AbstractLikeUsecase = LikeUsecase(
             like_repository=self.like_repository,
             cache=self.cache,
@@ -119,21 +149,67 @@ class Container(object):
             animal_subcategory_repository=self.animal_subcategory_repository,
         )
 
+    async def close(self):
+        await self.http_client.close()
+        if self.async_database is not None:
+            await self.async_database.close()
+        if self.async_cache is not None:
+            await self.async_cache.close()
+        if self.async_search_client is not None:
+            await self.async_search_client.close()
+
+
+http_client: AbstractHTTPClient = PooledHTTPClient(
+    timeout=Configurations.http_timeout,
+    retries=Configurations.http_retries,
+    max_connections=Configurations.http_max_connections,
+    max_keepalive_connections=Configurations.http_max_keepalive_connections,
+    keepalive_expiry=Configurations.http_keepalive_expiry,
+    http2=Configurations.http2,
+)
 
 if Configurations.run_environment == RUN_ENVIRONMENT.LOCAL.value:
     learn_to_rank: AbstractLearnToRankService = PseudoLearnToRankService()
     similar_image_search: AbstractSimilarImageSearchService = PseudoSimilarImageSearchService()
 elif Configurations.run_environment == RUN_ENVIRONMENT.CLOUD.value:
-    learn_to_rank = LearnToRankService()
-    similar_image_search = SimilarImageSearchService()
+    learn_to_rank = LearnToRankService(http_client=http_client)
+    similar_image_search = SimilarImageSearchService(http_client=http_client)
+
+cache: AbstractCache = RedisCache()
+
+if Configurations.token_cache_enabled:
+    token_cache: AbstractTokenCache = TokenCache(
+        ttl_second=Configurations.token_cache_ttl_second,
+        max_size=Configurations.token_cache_max_size,
+        cache=cache if Configurations.token_cache_redis_enabled else None,
+        cache_ttl_second=Configurations.token_cache_redis_ttl_second,
+    )
+else:
+    token_cache = NoTokenCache()
+
+async_database: Optional[AbstractAsyncDatabase] = None
+async_cache: Optional[AbstractAsyncCache] = None
+async_search_client: Optional[AbstractAsyncSearch] = None
+if Configurations.async_mode:
+    async_database = AsyncPostgreSQLDatabase(
+        pool_size=Configurations.async_database_pool_size,
+        max_overflow=Configurations.async_database_max_overflow,
+    )
+    async_cache = AsyncRedisCache()
+    async_search_client = AsyncElasticsearchClient()
 
 container = Container(
     storage_client=LocalStorage(),
     database=PostgreSQLDatabase(),
-    cache=RedisCache(),
+    cache=cache,
     search_client=ElasticsearchClient(),
     messaging=RabbitmqMessaging(),
     crypt=Crypt(key_file_path=Configurations.key_file_path),
     learn_to_rank=learn_to_rank,
     similar_image_search=similar_image_search,
+    token_cache=token_cache,
+    http_client=http_client,
+    async_database=async_database,
+    async_cache=async_cache,
+    async_search_client=async_search_client,
 )
@@ -6,6 +6,7 @@ from typing import Dict, List, Optional
 import httpx
 from pydantic import BaseModel, Extra
 from src.configurations import Configurations
+from src.infrastructure.http_client import AbstractHTTPClient
 
 logger = getLogger(__name__)
 
@@ -54,6 +55,13 @@ class AbstractLearnToRankService(ABC):
     ) -> LearnToRankResponse:
         raise NotImplementedError
 
+    @abstractmethod
+    async def reorder_async(
+        self,
+        request: LearnToRankRequest,
+    ) -> LearnToRankResponse:
+        raise NotImplementedError
+
 
 class PseudoLearnToRankService(AbstractLearnToRankService):
     def __init__(self):
@@ -71,17 +79,19 @@ class PseudoLearnToRankService(AbstractLearnToRankService):
         logger.info(f"response from learn to rank: {response}")
         return response
 
+    async def reorder_async(
+        self,
+        request: LearnToRankRequest,
+    ) -> LearnToRankResponse:
+        return self.reorder(request=request)
+
 
 class LearnToRankService(AbstractLearnToRankService):
     def __init__(
         self,
-        timeout: float = 10.0,
-        retries: int = 3,
+        http_client: AbstractHTTPClient,
     ):
-        self.timeout = timeout
-        self.transport = httpx.HTTPTransport(
-            retries=retries,
-        )
+        self.http_client = http_client
         self.url = Configurations.learn_to_rank_url
         self.post_header: Dict[str, str] = {
             "accept": "application/json",
@@ -93,27 +103,55 @@ class LearnToRankService(AbstractLearnToRankService):
         request: LearnToRankRequest,
     ) -> LearnToRankResponse:
         logger.info(f"request for learn to rank: {request}")
-        _ids = request.ids
         if self.url is None:
             logger.info(f"skip request learn to rank")
-            return LearnToRankResponse(ids=_ids)
+            return LearnToRankResponse(ids=request.ids)
+        res = self.http_client.client.post(
+            url=self.url,
+            data=self.__make_request_body(request=request),
+            headers=self.post_header,
+        )
+        return self.__make_response(
+            request=request,
+            res=res,
+        )
+
+    async def reorder_async(
+        self,
+        request: LearnToRankRequest,
+    ) -> LearnToRankResponse:
+        logger.info(f"request for learn to rank: {request}")
+        if self.url is None:
+            logger.info(f"skip request learn to rank")
+            return LearnToRankResponse(ids=request.ids)
+        res = await self.http_client.async_client.post(
+            url=self.url,
+            content=self.__make_request_body(request=request),
+            headers=self.post_header,
+        )
+        return self.__make_response(
+            request=request,
+            res=res,
+        )
+
+    def __make_request_body(
+        self,
+        request: LearnToRankRequest,
+    ) -> str:
         if Configurations.learn_to_rank_ab_test:
             _request = LearnToRankABTestRequest(request=request)
         else:
             _request = request
-        with httpx.Client(
-            timeout=self.timeout,
-            transport=self.transport,
-        ) as client:
-            req = _request.dict()
-            res = client.post(
-                url=self.url,
-                data=json.dumps(req),
-                headers=self.post_header,
-            )
+        return json.dumps(_request.dict())
+
+    def __make_response(
+        self,
+        request: LearnToRankRequest,
+        res: httpx.Response,
+    ) -> LearnToRankResponse:
         if res.status_code != 200:
             logger.error(f"failed to request learn to rank: {res}")
-            return LearnToRankResponse(ids=_ids)
+            return LearnToRankResponse(ids=request.ids)
         res_json = res.json()
         if Configurations.learn_to_rank_ab_test:
             response = LearnToRankServiceABTestResponse(**res_json["response"]).response
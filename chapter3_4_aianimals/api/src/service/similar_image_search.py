@@ -6,6 +6,7 @@ from typing import Dict, List, Optional
 import httpx
 from pydantic import BaseModel, Extra
 from src.configurations import Configurations
+from src.infrastructure.http_client import AbstractHTTPClient
 
 logger = getLogger(__name__)
 
@@ -36,6 +37,13 @@ class AbstractSimilarImageSearchService(ABC):
     ) -> SimilarImageSearchResponse:
         raise NotImplementedError
 
+    @abstractmethod
+    async def search_async(
+        self,
+        request: SimilarImageSearchRequest,
+    ) -> SimilarImageSearchResponse:
+        raise NotImplementedError
+
 
 class PseudoSimilarImageSearchService(AbstractSimilarImageSearchService):
     def __init__(self):
@@ -59,17 +67,19 @@ class PseudoSimilarImageSearchService(AbstractSimilarImageSearchService):
         logger.info(f"response from similar image search: {response}")
         return response
 
+    async def search_async(
+        self,
+        request: SimilarImageSearchRequest,
+    ) -> SimilarImageSearchResponse:
+        return self.search(request=request)
+
 
 class SimilarImageSearchService(AbstractSimilarImageSearchService):
     def __init__(
         self,
-        timeout: float = 10.0,
-        retries: int = 3,
+        http_client: AbstractHTTPClient,
     ):
-        self.timeout = timeout
-        self.transport = httpx.HTTPTransport(
-            retries=retries,
-        )
+        self.http_client = http_client
         self.url = Configurations.similar_image_search_url
         self.post_header: Dict[str, str] = {
             "accept": "application/json",
@@ -83,22 +93,46 @@ class SimilarImageSearchService(AbstractSimilarImageSearchService):
         logger.info(f"request for similar image: {request}")
         if self.url is None:
             logger.info(f"skip request similar image search")
-            return SimilarImageSearchResponse(ids=[id])
-
-        with httpx.Client(
-            timeout=self.timeout,
-            transport=self.transport,
-        ) as client:
-            req = request.dict()
-            res = client.post(
-                url=self.url,
-                data=json.dumps(req),
-                headers=self.post_header,
-            )
+            return SimilarImageSearchResponse(ids=[request.id])
+
+        res = self.http_client.client.post(
+            url=self.url,
+            data=json.dumps(request.dict()),
+            headers=self.post_header,
+        )
+        return self.__make_response(
+            request=request,
+            res=res,
+        )
+
+    async def search_async(
+        self,
+        request: SimilarImageSearchRequest,
+    ) -> SimilarImageSearchResponse:
+        logger.info(f"request for similar image: {request}")
+        if self.url is None:
+            logger.info(f"skip request similar image search")
+            return SimilarImageSearchResponse(ids=[request.id])
+
+        res = await self.http_client.async_client.post(
+            url=self.url,
+            content=json.dumps(request.dict()),
+            headers=self.post_header,
+        )
+        return self.__make_response(
+            request=request,
+            res=res,
+        )
+
+    def __make_response(
+        self,
+        request: SimilarImageSearchRequest,
+        res: httpx.Response,
+    ) -> SimilarImageSearchResponse:
         if res.status_code != 200:
             logger.error(f"failed to request similar image search: {res}")
             return SimilarImageSearchResponse(
-                ids=[id],
+                ids=[request.id],
                 model_name=None,
             )
         res_json = res.json()
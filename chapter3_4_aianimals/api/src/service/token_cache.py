@@ -0,0 +1,282 @@
+import hashlib
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from logging import getLogger
+from threading import Lock
+from typing import Dict, Optional, Set, Tuple
+
+from prometheus_client import Counter
+from src.constants import CONSTANTS
+from src.infrastructure.cache import AbstractCache
+
+logger = getLogger(__name__)
+
+TOKEN_CACHE_REQUESTS = Counter(
+    "token_cache_requests_total",
+    "Token verification cache lookups",
+    ["tier", "result"],
+)
+
+
+class AbstractTokenCache(ABC):
+    def __init__(
+        self,
+        ttl_second: int = 60,
+        max_size: int = 10000,
+        cache: Optional[AbstractCache] = None,
+        cache_ttl_second: int = 600,
+    ):
+        self.ttl_second = ttl_second
+        self.max_size = max_size
+        self.cache = cache
+        self.cache_ttl_second = cache_ttl_second
+
+    @abstractmethod
+    def get(
+        self,
+        token: str,
+    ) -> Optional[str]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def set(
+        self,
+        token: str,
+        user_id: str,
+    ):
+        raise NotImplementedError
+
+    @abstractmethod
+    def invalidate_user(
+        self,
+        user_id: str,
+    ):
+        raise NotImplementedError
+
+    @abstractmethod
+    def stats(self) -> Dict[str, int]:
+        raise NotImplementedError
+
+
+class NoTokenCache(AbstractTokenCache):
+    def __init__(self):
+        super().__init__(
+            ttl_second=0,
+            max_size=0,
+            cache=None,
+        )
+
+    def get(
+        self,
+        token: str,
+    ) -> Optional[str]:
+        return None
+
+    def set(
+        self,
+        token: str,
+        user_id: str,
+    ):
+        pass
+
+    def invalidate_user(
+        self,
+        user_id: str,
+    ):
+        pass
+
+    def stats(self) -> Dict[str, int]:
+        return {}
+
+
+class TokenCache(AbstractTokenCache):
+    def __init__(
+        self,
+        ttl_second: int = 60,
+        max_size: int = 10000,
+        cache: Optional[AbstractCache] = None,
+        cache_ttl_second: int = 600,
+    ):
+        super().__init__(
+            ttl_second=ttl_second,
+            max_size=max_size,
+            cache=cache,
+            cache_ttl_second=cache_ttl_second,
+        )
+        self.__lock = Lock()
+        self.__entries: "OrderedDict[str, Tuple[str, float]]" = OrderedDict()
+        self.__user_keys: Dict[str, Set[str]] = {}
+        self.__counts: Dict[str, int] = {
+            "local_hit": 0,
+            "local_miss": 0,
+            "cache_hit": 0,
+            "cache_miss": 0,
+            "eviction": 0,
+            "invalidation": 0,
+        }
+
+    def __make_key(
+        self,
+        token: str,
+    ) -> str:
+        return hashlib.sha256(token.encode()).hexdigest()
+
+    def __make_cache_key(
+        self,
+        key: str,
+    ) -> str:
+        return f"{CONSTANTS.TOKEN_CACHE_PREFIX}_{key}"
+
+    def __make_revoked_cache_key(
+        self,
+        user_id: str,
+    ) -> str:
+        return f"{CONSTANTS.TOKEN_REVOKED_CACHE_PREFIX}_{user_id}"
+
+    def __count(
+        self,
+        tier: str,
+        result: str,
+    ):
+        self.__counts[f"{tier}_{result}"] += 1
+        TOKEN_CACHE_REQUESTS.labels(tier=tier, result=result).inc()
+
+    def __remove_local(
+        self,
+        key: str,
+    ):
+        entry = self.__entries.pop(key, None)
+        if entry is None:
+            return
+        user_keys = self.__user_keys.get(entry[0])
+        if user_keys is not None:
+            user_keys.discard(key)
+            if len(user_keys) == 0:
+                self.__user_keys.pop(entry[0], None)
+
+    def __set_local(
+        self,
+        key: str,
+        user_id: str,
+    ):
+        with self.__lock:
+            self.__remove_local(key=key)
+            self.__entries[key] = (user_id, time.monotonic() + self.ttl_second)
+            self.__user_keys.setdefault(user_id, set()).add(key)
+            while len(self.__entries) > self.max_size:
+                oldest_key = next(iter(self.__entries))
+                self.__remove_local(key=oldest_key)
+                self.__counts["eviction"] += 1
+
+    def __get_local(
+        self,
+        key: str,
+    ) -> Optional[str]:
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is None:
+                return None
+            user_id, expires_at = entry
+            if expires_at < time.monotonic():
+                self.__remove_local(key=key)
+                return None
+            self.__entries.move_to_end(key)
+            return user_id
+
+    def __get_cache(
+        self,
+        key: str,
+    ) -> Optional[str]:
+        if self.cache is None:
+            return None
+        cache_key = self.__make_cache_key(key=key)
+        try:
+            cached = self.cache.get(key=cache_key)
+            if cached is None or not isinstance(cached, str):
+                return None
+            user_id, verified_at = cached.split(CONSTANTS.SPLITTER)
+            revoked_at = self.cache.get(key=self.__make_revoked_cache_key(user_id=user_id))
+            if revoked_at is not None and float(revoked_at) >= float(verified_at):
+                self.cache.delete(key=cache_key)
+                return None
+            return user_id
+        except Exception as e:
+            logger.error(f"failed to get token cache: {e}")
+            return None
+
+    def get(
+        self,
+        token: str,
+    ) -> Optional[str]:
+        key = self.__make_key(token=token)
+        user_id = self.__get_local(key=key)
+        if user_id is not None:
+            self.__count(tier="local", result="hit")
+            return user_id
+        self.__count(tier="local", result="miss")
+
+        if self.cache is None:
+            return None
+        user_id = self.__get_cache(key=key)
+        if user_id is not None:
+            self.__count(tier="cache", result="hit")
+            self.__set_local(
+                key=key,
+                user_id=user_id,
+            )
+            return user_id
+        self.__count(tier="cache", result="miss")
+        return None
+
+    def set(
+        self,
+        token: str,
+        user_id: str,
+    ):
+        key = self.__make_key(token=token)
+        self.__set_local(
+            key=key,
+            user_id=user_id,
+        )
+        if self.cache is None:
+            return
+        try:
+            self.cache.set(
+                key=self.__make_cache_key(key=key),
+                value=f"{user_id}{CONSTANTS.SPLITTER}{time.time()}",
+                expire_second=self.cache_ttl_second,
+            )
+        except Exception as e:
+            logger.error(f"failed to set token cache: {e}")
+
+    def invalidate_user(
+        self,
+        user_id: str,
+    ):
+        with self.__lock:
+            keys = list(self.__user_keys.get(user_id, set()))
+            for key in keys:
+                self.__remove_local(key=key)
+            self.__counts["invalidation"] += 1
+        logger.info(f"invalidated {len(keys)} cached tokens for user {user_id}")
+        if self.cache is None:
+            return
+        try:
+            for key in keys:
+                self.cache.delete(key=self.__make_cache_key(key=key))
+            self.cache.set(
+                key=self.__make_revoked_cache_key(user_id=user_id),
+                value=str(time.time()),
+                expire_second=self.cache_ttl_second,
+            )
+        except Exception as e:
+            logger.error(f"failed to invalidate token cache: {e}")
+
+    def stats(self) -> Dict[str, int]:
+        with self.__lock:
+            return {
+                **self.__counts,
+                "size": len(self.__entries),
+                "max_size": self.max_size,
+            }
@@ -1,7 +1,7 @@
 import json
 from abc import ABC, abstractmethod
 from logging import getLogger
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Union
 
 from fastapi import BackgroundTasks
 from sqlalchemy.orm import Session
@@ -11,15 +11,18 @@ from src.entities.animal import (
     ANIMAL_INDEX,
     AnimalCreate,
     AnimalIDs,
+    AnimalModel,
     AnimalQuery,
     AnimalSearchQuery,
     AnimalSearchSortKey,
 )
+from src.entities.common import Count
 from src.infrastructure.cache import AbstractCache
 from src.infrastructure.messaging import AbstractMessaging
 from src.infrastructure.search import AbstractSearch
 from src.infrastructure.storage import AbstractStorage
 from src.middleware.json import json_serial
+from src.middleware.stage_timer import StageTimer
 from src.middleware.strings import get_uuid
 from src.repository.animal_repository import AbstractAnimalRepository
 from src.repository.like_repository import AbstractLikeRepository
@@ -44,6 +47,112 @@ from src.service.similar_image_search import AbstractSimilarImageSearchService,
 logger = getLogger(__name__)
 
 
+class AnimalSearchMixin(object):
+    local_cache: AbstractLocalCache
+
+    def _make_search_key(
+        self,
+        query: AnimalSearchQuery,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> str:
+        key = f"{CONSTANTS.ANIMAL_SEARCH_CACHE_PREFIX}_"
+        key += f"{query.animal_category_name_en}_"
+        key += f"{query.animal_category_name_ja}_"
+        key += f"{query.animal_subcategory_name_en}_"
+        key += f"{query.animal_subcategory_name_ja}_"
+        key += f"{'_'.join(sorted(query.phrases))}_"
+        key += f"{limit}_"
+        key += f"{offset}_"
+        key += query.sort_by.value
+        return key
+
+    def _make_similar_word_cache_key(
+        self,
+        word: str,
+    ) -> str:
+        return f"SIMILAR_WORD_{word}"
+
+    def _extract_similar_word_value(
+        self,
+        similar_words: str,
+    ) -> Dict[str, float]:
+        values = similar_words.split(f"{CONSTANTS.SPLITTER}{CONSTANTS.SPLITTER}")
+        extracted = {}
+        for kv in values:
+            k, v = kv.split(CONSTANTS.SPLITTER)
+            extracted[k] = float(v)
+        return extracted
+
+    def _extract_similar_words(
+        self,
+        cached_similar_words: List[Optional[Union[str, int, float, bool, bytes]]],
+    ) -> List[str]:
+        similar_words: List[str] = []
+        for cached in cached_similar_words:
+            if cached is not None and isinstance(cached, str):
+                _similar_words = self._extract_similar_word_value(similar_words=cached)
+                similar_words.extend(list(_similar_words.keys()))
+        return list(set(similar_words))
+
+    def _make_learn_to_rank_request(
+        self,
+        query: AnimalSearchQuery,
+        ids: List[str],
+    ) -> LearnToRankRequest:
+        learn_to_rank_request = LearnToRankRequest(
+            ids=ids,
+            query_phrases=query.phrases,
+        )
+        if query.animal_category_name_en is not None:
+            animal_category_id = self.local_cache.get_animal_category_id_by_name(name=query.animal_category_name_en)
+            learn_to_rank_request.query_animal_category_id = animal_category_id
+        if query.animal_category_name_ja is not None:
+            animal_category_id = self.local_cache.get_animal_category_id_by_name(name=query.animal_category_name_ja)
+            learn_to_rank_request.query_animal_category_id = animal_category_id
+        if query.animal_subcategory_name_en is not None:
+            animal_subcategory_id = self.local_cache.get_animal_subcategory_id_by_name(
+                name=query.animal_subcategory_name_en
+            )
+            learn_to_rank_request.query_animal_subcategory_id = animal_subcategory_id
+        if query.animal_subcategory_name_ja is not None:
+            animal_subcategory_id = self.local_cache.get_animal_subcategory_id_by_name(
+                name=query.animal_subcategory_name_ja
+            )
+            learn_to_rank_request.query_animal_subcategory_id = animal_subcategory_id
+        return learn_to_rank_request
+
+    def _make_similar_animal_search_responses(
+        self,
+        animals: List[AnimalModel],
+        likes: Dict[str, Count],
+        search_id: str,
+        model_name: Optional[str] = None,
+    ) -> SimilarAnimalSearchResponses:
+        responses = [
+            SimilarAnimalSearchResponse(
+                id=a.id,
+                name=a.name,
+                description=a.description,
+                photo_url=a.photo_url,
+                animal_category_name_en=a.animal_category_name_en,
+                animal_category_name_ja=a.animal_category_name_ja,
+                animal_subcategory_name_en=a.animal_subcategory_name_en,
+                animal_subcategory_name_ja=a.animal_subcategory_name_ja,
+                user_handle_name=a.user_handle_name,
+                like=likes[a.id].count,
+                created_at=a.created_at,
+            )
+            for a in animals
+        ]
+        return SimilarAnimalSearchResponses(
+            results=responses,
+            search_id=search_id,
+            sort_by="image_similarity",
+            model_name=model_name,
+        )
+
+
 class AbstractAnimalUsecase(ABC):
     def __init__(
         self,
@@ -116,7 +225,7 @@ class AbstractAnimalUsecase(ABC):
         raise NotImplementedError
 
 
-class AnimalUsecase(AbstractAnimalUsecase):
+class AnimalUsecase(AnimalSearchMixin, AbstractAnimalUsecase):
     def __init__(
         self,
         animal_repository: AbstractAnimalRepository,
@@ -224,23 +333,6 @@ class AnimalUsecase(AbstractAnimalUsecase):
             return response
         return None
 
-    def __make_search_key(
-        self,
-        query: AnimalSearchQuery,
-        limit: int = 100,
-        offset: int = 0,
-    ) -> str:
-        key = f"{CONSTANTS.ANIMAL_SEARCH_CACHE_PREFIX}_"
-        key += f"{query.animal_category_name_en}_"
-        key += f"{query.animal_category_name_ja}_"
-        key += f"{query.animal_subcategory_name_en}_"
-        key += f"{query.animal_subcategory_name_ja}_"
-        key += f"{'_'.join(sorted(query.phrases))}_"
-        key += f"{limit}_"
-        key += f"{offset}_"
-        key += query.sort_by.value
-        return key
-
     def __set_search_cache(
         self,
         key: str,
@@ -253,23 +345,6 @@ class AnimalUsecase(AbstractAnimalUsecase):
             expire_second=60 * 10,
         )
 
-    def __make_similar_word_cache_key(
-        self,
-        word: str,
-    ) -> str:
-        return f"SIMILAR_WORD_{word}"
-
-    def __extract_similar_word_value(
-        self,
-        similar_words: str,
-    ) -> Dict[str, float]:
-        values = similar_words.split(f"{CONSTANTS.SPLITTER}{CONSTANTS.SPLITTER}")
-        extracted = {}
-        for kv in values:
-            k, v = kv.split(CONSTANTS.SPLITTER)
-            extracted[k] = float(v)
-        return extracted
-
     def search(
         self,
         request: AnimalSearchRequest,
@@ -289,62 +364,57 @@ class AnimalUsecase(AbstractAnimalUsecase):
             sort_by=sort_by,
         )
         logger.info(f"search query: {query}")
-        key = self.__make_search_key(
+        timer = StageTimer(name="animal_search")
+        key = self._make_search_key(
             query=query,
             limit=limit,
             offset=offset,
         )
-        cached = self.cache.get(key=key)
+        similar_words_keys = [self._make_similar_word_cache_key(word=phrase) for phrase in request.phrases]
+        cached_similar_words: Optional[List[Optional[Union[str, int, float, bool, bytes]]]] = None
+        with timer.measure(stage="cache"):
+            if Configurations.search_prefetch_similar_words:
+                cached_values = self.cache.mget(keys=[key, *similar_words_keys])
+                cached = cached_values[0]
+                cached_similar_words = cached_values[1:]
+            else:
+                cached = self.cache.get(key=key)
         if cached is not None and isinstance(cached, str):
             cache = json.loads(cached)
             logger.info(f"hit cache: {key}")
             searched = AnimalSearchResponses(**cache)
             searched.search_id = search_id
+            timer.log()
             logger.info(f"request: {request}; response: {searched}")
             return searched
 
         logger.info(f"no cache for {key}")
 
-        similar_words: List[str] = []
-        for phrase in request.phrases:
-            similar_words_key = self.__make_similar_word_cache_key(word=phrase)
-            cached_similar_words = self.cache.get(key=similar_words_key)
-            if cached_similar_words is not None and isinstance(cached_similar_words, str):
-                _similar_words = self.__extract_similar_word_value(similar_words=cached_similar_words)
-                similar_words.extend(list(_similar_words.keys()))
-        similar_words = list(set(similar_words))
-        logger.info(f"similar words: {similar_words}")
-        AnimalSearchQuery.similar_words = similar_words
+        if cached_similar_words is None:
+            with timer.measure(stage="similar_words"):
+                cached_similar_words = self.cache.mget(keys=similar_words_keys)
+        query.similar_words = self._extract_similar_words(cached_similar_words=cached_similar_words)
+        logger.info(f"similar words: {query.similar_words}")
 
-        results = self.search_client.search(
-            index=ANIMAL_INDEX,
-            query=query,
-            from_=offset,
-            size=limit,
-        )
+        learn_to_rank_request: Optional[LearnToRankRequest] = None
         if query.sort_by == AnimalSearchSortKey.LEARN_TO_RANK:
-            _ids = {r.id: r for r in results.results}
-            learn_to_rank_request = LearnToRankRequest(
-                ids=list(_ids.keys()),
-                query_phrases=query.phrases,
+            learn_to_rank_request = self._make_learn_to_rank_request(
+                query=query,
+                ids=[],
             )
-            if query.animal_category_name_en is not None:
-                animal_category_id = self.local_cache.get_animal_category_id_by_name(name=query.animal_category_name_en)
-                learn_to_rank_request.query_animal_category_id = animal_category_id
-            if query.animal_category_name_ja is not None:
-                animal_category_id = self.local_cache.get_animal_category_id_by_name(name=query.animal_category_name_ja)
-                learn_to_rank_request.query_animal_category_id = animal_category_id
-            if query.animal_subcategory_name_en is not None:
-                animal_subcategory_id = self.local_cache.get_animal_subcategory_id_by_name(
-                    name=query.animal_subcategory_name_en
-                )
-                learn_to_rank_request.query_animal_subcategory_id = animal_subcategory_id
-            if query.animal_subcategory_name_ja is not None:
-                animal_subcategory_id = self.local_cache.get_animal_subcategory_id_by_name(
-                    name=query.animal_subcategory_name_ja
-                )
-                learn_to_rank_request.query_animal_subcategory_id = animal_subcategory_id
-            ranked_ids = self.learn_to_rank.reorder(request=learn_to_rank_request)
+
+        with timer.measure(stage="search"):
+            results = self.search_client.search(
+                index=ANIMAL_INDEX,
+                query=query,
+                from_=offset,
+                size=limit,
+            )
+        if learn_to_rank_request is not None:
+            _ids = {r.id: r for r in results.results}
+            learn_to_rank_request.ids = list(_ids.keys())
+            with timer.measure(stage="learn_to_rank"):
+                ranked_ids = self.learn_to_rank.reorder(request=learn_to_rank_request)
             model_name = ranked_ids.model_name
             _results = [_ids[i] for i in ranked_ids.ids]
             results.results = _results
@@ -364,6 +434,7 @@ class AnimalUsecase(AbstractAnimalUsecase):
                 key,
                 searched,
             )
+        timer.log()
         logger.info(f"request: {request}; response: {searched}")
         return searched
 
@@ -384,26 +455,10 @@ class AnimalUsecase(AbstractAnimalUsecase):
             session=session,
             animal_ids=[a.id for a in animals],
         )
-        responses = [
-            SimilarAnimalSearchResponse(
-                id=a.id,
-                name=a.name,
-                description=a.description,
-                photo_url=a.photo_url,
-                animal_category_name_en=a.animal_category_name_en,
-                animal_category_name_ja=a.animal_category_name_ja,
-                animal_subcategory_name_en=a.animal_subcategory_name_en,
-                animal_subcategory_name_ja=a.animal_subcategory_name_ja,
-                user_handle_name=a.user_handle_name,
-                like=likes[a.id].count,
-                created_at=a.created_at,
-            )
-            for a in animals
-        ]
-        searched = SimilarAnimalSearchResponses(
-            results=responses,
+        searched = self._make_similar_animal_search_responses(
+            animals=animals,
+            likes=likes,
             search_id=search_id,
-            sort_by="image_similarity",
             model_name=response.model_name,
         )
         logger.info(f"request: {request}; response: {searched}")
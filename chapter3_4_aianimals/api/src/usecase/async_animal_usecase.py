@@ -0,0 +1,284 @@
+import json
+from abc import ABC, abstractmethod
+from logging import getLogger
+from typing import List, Optional, Union
+
+from fastapi import BackgroundTasks
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.configurations import Configurations
+from src.entities.animal import ANIMAL_INDEX, AnimalIDs, AnimalQuery, AnimalSearchQuery, AnimalSearchSortKey
+from src.infrastructure.cache import AbstractAsyncCache
+from src.infrastructure.search import AbstractAsyncSearch
+from src.middleware.json import json_serial
+from src.middleware.stage_timer import StageTimer
+from src.middleware.strings import get_uuid
+from src.repository.animal_repository import AbstractAnimalRepository
+from src.repository.like_repository import AbstractLikeRepository
+from src.request_object.animal import AnimalRequest, AnimalSearchRequest, SimilarAnimalSearchRequest
+from src.response_object.animal import (
+    AnimalResponse,
+    AnimalSearchResponse,
+    AnimalSearchResponses,
+    SimilarAnimalSearchResponses,
+)
+from src.response_object.user import UserResponse
+from src.service.learn_to_rank import AbstractLearnToRankService, LearnToRankRequest
+from src.service.local_cache import AbstractLocalCache
+from src.service.similar_image_search import AbstractSimilarImageSearchService, SimilarImageSearchRequest
+from src.usecase.animal_usecase import AnimalSearchMixin
+
+logger = getLogger(__name__)
+
+
+class AbstractAsyncAnimalUsecase(ABC):
+    def __init__(
+        self,
+        animal_repository: AbstractAnimalRepository,
+        like_repository: AbstractLikeRepository,
+        learn_to_rank: AbstractLearnToRankService,
+        similar_image_search: AbstractSimilarImageSearchService,
+        cache: AbstractAsyncCache,
+        search_client: AbstractAsyncSearch,
+        local_cache: AbstractLocalCache,
+    ):
+        self.animal_repository = animal_repository
+        self.like_repository = like_repository
+        self.learn_to_rank = learn_to_rank
+        self.similar_image_search = similar_image_search
+        self.cache = cache
+        self.search_client = search_client
+        self.local_cache = local_cache
+
+    @abstractmethod
+    async def retrieve(
+        self,
+        session: AsyncSession,
+        request: Optional[AnimalRequest] = None,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> List[AnimalResponse]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def liked_by(
+        self,
+        session: AsyncSession,
+        animal_id: str,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> List[UserResponse]:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def search(
+        self,
+        request: AnimalSearchRequest,
+        background_tasks: BackgroundTasks,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> AnimalSearchResponses:
+        raise NotImplementedError
+
+    @abstractmethod
+    async def search_similar_image(
+        self,
+        session: AsyncSession,
+        request: SimilarAnimalSearchRequest,
+    ) -> SimilarAnimalSearchResponses:
+        raise NotImplementedError
+
+
+class AsyncAnimalUsecase(AnimalSearchMixin, AbstractAsyncAnimalUsecase):
+    def __init__(
+        self,
+        animal_repository: AbstractAnimalRepository,
+        like_repository: AbstractLikeRepository,
+        learn_to_rank: AbstractLearnToRankService,
+        similar_image_search: AbstractSimilarImageSearchService,
+        cache: AbstractAsyncCache,
+        search_client: AbstractAsyncSearch,
+        local_cache: AbstractLocalCache,
+    ):
+        super().__init__(
+            animal_repository=animal_repository,
+            like_repository=like_repository,
+            learn_to_rank=learn_to_rank,
+            similar_image_search=similar_image_search,
+            cache=cache,
+            search_client=search_client,
+            local_cache=local_cache,
+        )
+
+    async def retrieve(
+        self,
+        session: AsyncSession,
+        request: Optional[AnimalRequest] = None,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> List[AnimalResponse]:
+        if limit > 200:
+            raise ValueError
+        query: Optional[AnimalQuery] = None
+        if request is not None:
+            query = AnimalQuery(**request.dict())
+        data = await session.run_sync(
+            self.animal_repository.select,
+            query=query,
+            limit=limit,
+            offset=offset,
+        )
+        like = await session.run_sync(
+            self.like_repository.count,
+            animal_ids=[a.id for a in data],
+        )
+        response = [AnimalResponse(like=like[d.id].count, **d.dict()) for d in data]
+        return response
+
+    async def liked_by(
+        self,
+        session: AsyncSession,
+        animal_id: str,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> List[UserResponse]:
+        if limit > 200:
+            raise ValueError
+        data = await session.run_sync(
+            self.animal_repository.liked_by,
+            animal_id=animal_id,
+            limit=limit,
+            offset=offset,
+        )
+        response = [UserResponse(**d.dict()) for d in data]
+        return response
+
+    async def __set_search_cache(
+        self,
+        key: str,
+        result: AnimalSearchResponses,
+    ):
+        logger.info(f"save cache: {key}")
+        await self.cache.set(
+            key=key,
+            value=json.dumps(result.dict(), default=json_serial),
+            expire_second=60 * 10,
+        )
+
+    async def search(
+        self,
+        request: AnimalSearchRequest,
+        background_tasks: BackgroundTasks,
+        limit: int = 100,
+        offset: int = 0,
+    ) -> AnimalSearchResponses:
+        search_id = get_uuid()
+        model_name = None
+        sort_by = AnimalSearchSortKey.value_to_key(value=request.sort_by)
+        query = AnimalSearchQuery(
+            animal_category_name_en=request.animal_category_name_en,
+            animal_category_name_ja=request.animal_category_name_ja,
+            animal_subcategory_name_en=request.animal_subcategory_name_en,
+            animal_subcategory_name_ja=request.animal_subcategory_name_ja,
+            phrases=request.phrases,
+            sort_by=sort_by,
+        )
+        logger.info(f"search query: {query}")
+        timer = StageTimer(name="animal_search")
+        key = self._make_search_key(
+            query=query,
+            limit=limit,
+            offset=offset,
+        )
+        similar_words_keys = [self._make_similar_word_cache_key(word=phrase) for phrase in request.phrases]
+        cached_similar_words: Optional[List[Optional[Union[str, int, float, bool, bytes]]]] = None
+        with timer.measure(stage="cache"):
+            if Configurations.search_prefetch_similar_words:
+                cached_values = await self.cache.mget(keys=[key, *similar_words_keys])
+                cached = cached_values[0]
+                cached_similar_words = cached_values[1:]
+            else:
+                cached = await self.cache.get(key=key)
+        if cached is not None and isinstance(cached, str):
+            cache = json.loads(cached)
+            logger.info(f"hit cache: {key}")
+            searched = AnimalSearchResponses(**cache)
+            searched.search_id = search_id
+            timer.log()
+            logger.info(f"request: {request}; response: {searched}")
+            return searched
+
+        logger.info(f"no cache for {key}")
+
+        if cached_similar_words is None:
+            with timer.measure(stage="similar_words"):
+                cached_similar_words = await self.cache.mget(keys=similar_words_keys)
+        query.similar_words = self._extract_similar_words(cached_similar_words=cached_similar_words)
+        logger.info(f"similar words: {query.similar_words}")
+
+        learn_to_rank_request: Optional[LearnToRankRequest] = None
+        if query.sort_by == AnimalSearchSortKey.LEARN_TO_RANK:
+            learn_to_rank_request = self._make_learn_to_rank_request(
+                query=query,
+                ids=[],
+            )
+
+        with timer.measure(stage="search"):
+            results = await self.search_client.search(
+                index=ANIMAL_INDEX,
+                query=query,
+                from_=offset,
+                size=limit,
+            )
+        if learn_to_rank_request is not None:
+            _ids = {r.id: r for r in results.results}
+            learn_to_rank_request.ids = list(_ids.keys())
+            with timer.measure(stage="learn_to_rank"):
+                ranked_ids = await self.learn_to_rank.reorder_async(request=learn_to_rank_request)
+            model_name = ranked_ids.model_name
+            _results = [_ids[i] for i in ranked_ids.ids]
+            results.results = _results
+
+        searched = AnimalSearchResponses(
+            hits=results.hits,
+            max_score=results.max_score,
+            results=[AnimalSearchResponse(**r.dict()) for r in results.results],
+            offset=results.offset,
+            search_id=search_id,
+            sort_by=sort_by.value,
+            model_name=model_name,
+        )
+        if query.sort_by != AnimalSearchSortKey.LEARN_TO_RANK:
+            background_tasks.add_task(
+                self.__set_search_cache,
+                key,
+                searched,
+            )
+        timer.log()
+        logger.info(f"request: {request}; response: {searched}")
+        return searched
+
+    async def search_similar_image(
+        self,
+        session: AsyncSession,
+        request: SimilarAnimalSearchRequest,
+    ) -> SimilarAnimalSearchResponses:
+        search_id = get_uuid()
+        search_request = SimilarImageSearchRequest(id=request.id)
+        response = await self.similar_image_search.search_async(request=search_request)
+        query = AnimalIDs(ids=response.ids)
+        animals = await session.run_sync(
+            self.animal_repository.select_by_ids,
+            query=query,
+        )
+        likes = await session.run_sync(
+            self.like_repository.count,
+            animal_ids=[a.id for a in animals],
+        )
+        searched = self._make_similar_animal_search_responses(
+            animals=animals,
+            likes=likes,
+            search_id=search_id,
+            model_name=response.model_name,
+        )
+        logger.info(f"request: {request}; response: {searched}")
+        return searched
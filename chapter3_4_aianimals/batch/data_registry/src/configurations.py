@@ -35,6 +35,8 @@ class Configurations:
     )
 
     animal_registry_queue = os.getenv("ANIMAL_REGISTRY_QUEUE", "animal")
+    animal_registry_batch_size = int(os.getenv("ANIMAL_REGISTRY_BATCH_SIZE", 1))
+    animal_registry_batch_linger_ms = int(os.getenv("ANIMAL_REGISTRY_BATCH_LINGER_MS", 1000))
 
     animal_violation_queues = []
     for k, v in os.environ.items():
@@ -1,9 +1,9 @@
 import logging
 import os
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Union
+from typing import Any, Dict, List, Union
 
-from elasticsearch import Elasticsearch
+from elasticsearch import Elasticsearch, helpers
 
 
 class AbstractSearch(ABC):
@@ -62,6 +62,14 @@ class AbstractSearch(ABC):
     ) -> bool:
         raise NotImplementedError
 
+    @abstractmethod
+    def bulk_index_documents(
+        self,
+        index: str,
+        documents: Dict[str, Dict],
+    ) -> List[str]:
+        raise NotImplementedError
+
 
 class ElasticsearchClient(AbstractSearch):
     def __init__(self):
@@ -148,3 +156,30 @@ class ElasticsearchClient(AbstractSearch):
         )
         self.logger.info(f"exists: {exists}")
         return exists
+
+    def bulk_index_documents(
+        self,
+        index: str,
+        documents: Dict[str, Dict],
+    ) -> List[str]:
+        self.logger.info(f"bulk index {len(documents)} documents in index {index}")
+        actions = [
+            {
+                "_op_type": "index",
+                "_index": index,
+                "_id": id,
+                "_source": body,
+            }
+            for id, body in documents.items()
+        ]
+        _, errors = helpers.bulk(
+            self.es_client,
+            actions,
+            raise_on_error=False,
+            raise_on_exception=False,
+            refresh=False,
+        )
+        failed_ids = [str(list(e.values())[0].get("_id")) for e in errors]
+        if len(failed_ids) > 0:
+            self.logger.error(f"failed to bulk index {len(failed_ids)} documents: {errors}")
+        return failed_ids
@@ -36,8 +36,15 @@ class AnimalToSearchJob(AbstractJob):
         try:
             self.messaging.init_channel()
             self.messaging.create_queue(queue_name=Configurations.animal_registry_queue)
-            self.messaging.channel.basic_qos(prefetch_count=1)
-            self.animal_usecase.register_document_from_queue()
+            if Configurations.animal_registry_batch_size > 1:
+                self.messaging.channel.basic_qos(prefetch_count=Configurations.animal_registry_batch_size)
+                self.animal_usecase.register_documents_from_queue(
+                    batch_size=Configurations.animal_registry_batch_size,
+                    linger_ms=Configurations.animal_registry_batch_linger_ms,
+                )
+            else:
+                self.messaging.channel.basic_qos(prefetch_count=1)
+                self.animal_usecase.register_document_from_queue()
         except Exception as e:
             self.logger.exception(e)
             raise e
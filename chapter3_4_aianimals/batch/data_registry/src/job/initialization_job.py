@@ -17,6 +17,7 @@ from src.request_object.violation_type import ViolationTypeCreateRequest
 from src.schema.access_log import AccessLog
 from src.schema.animal import Animal
 from src.schema.animal_category import AnimalCategory
+from src.schema.animal_like_count import AnimalLikeCount
 from src.schema.animal_subcategory import AnimalSubcategory
 from src.schema.base import Base
 from src.schema.like import Like
@@ -69,6 +70,7 @@ class InitializationJob(AbstractJob):
             User,
             Animal,
             Like,
+            AnimalLikeCount,
             ViolationType,
             Violation,
             AccessLog,
@@ -351,6 +353,7 @@ class InitializationJob(AbstractJob):
         self.logger.info("run initialize database")
         self.__create_table()
         self.__create_indices()
+        self.table_usecase.create_like_count_trigger(engine=self.database.engine)
         self.__register_violation_type(file_path=Configurations.violation_type_file)
         self.__register_animal_category(file_path=Configurations.animal_category_file)
         self.__register_animal_subcategory(file_path=Configurations.animal_subcategory_file)
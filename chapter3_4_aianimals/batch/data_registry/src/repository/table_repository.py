@@ -1,9 +1,10 @@
 import logging
 from abc import ABC, abstractmethod
 
-from sqlalchemy import Column, Index
+from sqlalchemy import Column, Index, text
 from sqlalchemy.engine import Engine
 from src.schema.base import Base
+from src.schema.table import TABLES
 
 
 class AbstractTableRepository(ABC):
@@ -30,6 +31,13 @@ class AbstractTableRepository(ABC):
     ) -> Index:
         raise NotImplementedError
 
+    @abstractmethod
+    def create_like_count_trigger(
+        self,
+        engine: Engine,
+    ):
+        raise NotImplementedError
+
 
 class TableRepository(AbstractTableRepository):
     def __init__(self):
@@ -70,3 +78,51 @@ class TableRepository(AbstractTableRepository):
         )
         self.logger.info(f"done create index: {index_name}")
         return index
+
+    def create_like_count_trigger(
+        self,
+        engine: Engine,
+    ):
+        like_table = TABLES.LIKE.value
+        like_count_table = TABLES.ANIMAL_LIKE_COUNT.value
+        function_name = f"{like_count_table}_update"
+        trigger_name = f"{like_table}_{like_count_table}_trigger"
+        function_query = f"""
+CREATE OR REPLACE FUNCTION {function_name}() RETURNS TRIGGER AS $$
+BEGIN
+    IF (TG_OP = 'INSERT') THEN
+        INSERT INTO {like_count_table} (animal_id, likes, updated_at)
+        VALUES (NEW.animal_id, 1, NOW())
+        ON CONFLICT (animal_id)
+        DO UPDATE SET likes = {like_count_table}.likes + 1, updated_at = NOW();
+        RETURN NEW;
+    ELSIF (TG_OP = 'DELETE') THEN
+        UPDATE {like_count_table}
+        SET likes = GREATEST({like_count_table}.likes - 1, 0), updated_at = NOW()
+        WHERE animal_id = OLD.animal_id;
+        RETURN OLD;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql;
+"""
+        trigger_query = f"""
+CREATE TRIGGER {trigger_name}
+AFTER INSERT OR DELETE ON {like_table}
+FOR EACH ROW EXECUTE FUNCTION {function_name}();
+"""
+        backfill_query = f"""
+INSERT INTO {like_count_table} (animal_id, likes, updated_at)
+SELECT animal_id, COUNT(id), NOW()
+FROM {like_table}
+GROUP BY animal_id
+ON CONFLICT (animal_id)
+DO UPDATE SET likes = EXCLUDED.likes, updated_at = NOW();
+"""
+        self.logger.info(f"create trigger: {trigger_name}")
+        with engine.begin() as connection:
+            connection.execute(text(function_query))
+            connection.execute(text(f"DROP TRIGGER IF EXISTS {trigger_name} ON {like_table};"))
+            connection.execute(text(trigger_query))
+            connection.execute(text(backfill_query))
+        self.logger.info(f"done create trigger: {trigger_name}")
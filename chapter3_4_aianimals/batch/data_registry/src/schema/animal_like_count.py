@@ -0,0 +1,25 @@
+from sqlalchemy import Column, DateTime, ForeignKey, String
+from sqlalchemy.sql.functions import current_timestamp
+from sqlalchemy.sql.sqltypes import INT
+from src.schema.base import Base
+from src.schema.table import TABLES
+
+
+class AnimalLikeCount(Base):
+    __tablename__ = TABLES.ANIMAL_LIKE_COUNT.value
+    animal_id = Column(
+        String(32),
+        ForeignKey(f"{TABLES.ANIMAL.value}.id"),
+        primary_key=True,
+    )
+    likes = Column(
+        INT,
+        nullable=False,
+        default=0,
+        server_default="0",
+    )
+    updated_at = Column(
+        DateTime(timezone=True),
+        server_default=current_timestamp(),
+        nullable=False,
+    )
@@ -8,6 +8,7 @@ class TABLES(Enum):
     ANIMAL = "animals"
     USER = "users"
     LIKE = "likes"
+    ANIMAL_LIKE_COUNT = "animal_like_counts"
     VIOLATION_TYPE = "violation_types"
     VIOLATION = "violations"
     ACCESS_LOG = "access_logs"
@@ -1,11 +1,12 @@
 import json
 import logging
+import time
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 
 from src.configurations import Configurations
-from src.entities.animal import AnimalCreate, AnimalQuery
+from src.entities.animal import AnimalCreate, AnimalModel, AnimalQuery
 from src.entities.animal_search import ANIMAL_MAPPING, ANIMAL_MAPPING_NAME, AnimalDocument
 from src.infrastructure.cache import AbstractCache
 from src.infrastructure.messaging import RabbitmqMessaging
@@ -71,10 +72,25 @@ class AbstractAnimalUsecase(ABC):
     ):
         raise NotImplementedError
 
+    @abstractmethod
+    def register_documents(
+        self,
+        animal_ids: List[str],
+    ) -> List[str]:
+        raise NotImplementedError
+
     @abstractmethod
     def register_document_from_queue(self):
         raise NotImplementedError
 
+    @abstractmethod
+    def register_documents_from_queue(
+        self,
+        batch_size: int = 100,
+        linger_ms: int = 1000,
+    ):
+        raise NotImplementedError
+
     @abstractmethod
     def bulk_register(
         self,
@@ -180,6 +196,24 @@ class AnimalUsecase(AbstractAnimalUsecase):
     def index_exists(self) -> bool:
         return self.search.index_exists(index=ANIMAL_MAPPING_NAME)
 
+    def __make_document(
+        self,
+        animal: AnimalModel,
+        like: int,
+    ) -> AnimalDocument:
+        return AnimalDocument(
+            name=animal.name,
+            description=animal.description,
+            animal_category_name_en=animal.animal_category_name_en,
+            animal_category_name_ja=animal.animal_category_name_ja,
+            animal_subcategory_name_en=animal.animal_subcategory_name_en,
+            animal_subcategory_name_ja=animal.animal_subcategory_name_ja,
+            photo_url=animal.photo_url,
+            user_handle_name=animal.user_handle_name,
+            like=like,
+            created_at=animal.created_at,
+        )
+
     def register_document(
         self,
         animal_id: str,
@@ -200,17 +234,9 @@ class AnimalUsecase(AbstractAnimalUsecase):
 
         like = self.like_repository.count(animal_ids=[animal.id])
 
-        document = AnimalDocument(
-            name=animal.name,
-            description=animal.description,
-            animal_category_name_en=animal.animal_category_name_en,
-            animal_category_name_ja=animal.animal_category_name_ja,
-            animal_subcategory_name_en=animal.animal_subcategory_name_en,
-            animal_subcategory_name_ja=animal.animal_subcategory_name_ja,
-            photo_url=animal.photo_url,
-            user_handle_name=animal.user_handle_name,
+        document = self.__make_document(
+            animal=animal,
             like=like[animal.id].count,
-            created_at=animal.created_at,
         )
 
         if self.search.is_document_exist(
@@ -230,6 +256,37 @@ class AnimalUsecase(AbstractAnimalUsecase):
             )
         self.logger.info(f"registered: {animal_id}")
 
+    def register_documents(
+        self,
+        animal_ids: List[str],
+    ) -> List[str]:
+        query = AnimalQuery(
+            ids=animal_ids,
+            deactivated=False,
+        )
+        animals = self.animal_repository.select(
+            query=query,
+            limit=len(animal_ids),
+            offset=0,
+        )
+        if len(animals) == 0:
+            return []
+
+        likes = self.like_repository.count(animal_ids=[a.id for a in animals])
+        documents = {
+            animal.id: self.__make_document(
+                animal=animal,
+                like=likes[animal.id].count,
+            ).dict()
+            for animal in animals
+        }
+        failed_ids = self.search.bulk_index_documents(
+            index=ANIMAL_MAPPING_NAME,
+            documents=documents,
+        )
+        self.logger.info(f"registered: {len(documents) - len(failed_ids)} documents")
+        return failed_ids
+
     def register_document_from_queue(self):
         def callback(ch, method, properties, body):
             data = json.loads(body)
@@ -251,6 +308,69 @@ class AnimalUsecase(AbstractAnimalUsecase):
         self.logger.info(f"Waiting for {Configurations.animal_registry_queue} queue...")
         self.messaging.channel.start_consuming()
 
+    def __flush_documents(
+        self,
+        messages: List[Tuple[int, str]],
+    ):
+        start = time.perf_counter()
+        animal_ids = list(dict.fromkeys([animal_id for _, animal_id in messages]))
+        try:
+            failed_ids = set(self.register_documents(animal_ids=animal_ids))
+        except Exception as e:
+            self.logger.error(f"failed to register documents: {e}")
+            failed_ids = set(animal_ids)
+
+        if len(failed_ids) == 0:
+            self.messaging.channel.basic_ack(
+                delivery_tag=messages[-1][0],
+                multiple=True,
+            )
+        else:
+            for delivery_tag, animal_id in messages:
+                if animal_id in failed_ids:
+                    self.messaging.channel.basic_reject(
+                        delivery_tag=delivery_tag,
+                        requeue=True,
+                    )
+                else:
+                    self.messaging.channel.basic_ack(delivery_tag=delivery_tag)
+        elapsed = time.perf_counter() - start
+        self.logger.info(
+            f"consumed {len(messages)} messages for {len(animal_ids)} animals in {elapsed:.3f}s; "
+            f"failed: {len(failed_ids)}; {len(messages) / max(elapsed, 1e-6):.1f} messages/s"
+        )
+
+    def register_documents_from_queue(
+        self,
+        batch_size: int = 100,
+        linger_ms: int = 1000,
+    ):
+        linger_second = linger_ms / 1000
+        messages: List[Tuple[int, str]] = []
+        deadline = 0.0
+        self.logger.info(f"Waiting for {Configurations.animal_registry_queue} queue in batch of {batch_size}...")
+        for method, _, body in self.messaging.channel.consume(
+            queue=Configurations.animal_registry_queue,
+            inactivity_timeout=linger_second,
+        ):
+            if method is not None:
+                try:
+                    data = json.loads(body)
+                    animal_id = data["id"]
+                except Exception as e:
+                    self.logger.error(f"failed to parse message {body}: {e}")
+                    self.messaging.channel.basic_reject(
+                        delivery_tag=method.delivery_tag,
+                        requeue=False,
+                    )
+                    continue
+                if len(messages) == 0:
+                    deadline = time.monotonic() + linger_second
+                messages.append((method.delivery_tag, animal_id))
+            if len(messages) > 0 and (len(messages) >= batch_size or time.monotonic() >= deadline):
+                self.__flush_documents(messages=messages)
+                messages = []
+
     def bulk_register(
         self,
         requests: List[AnimalCreateRequest],
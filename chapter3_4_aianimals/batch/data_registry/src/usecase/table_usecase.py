@@ -35,6 +35,13 @@ class AbstractTableUsecase(ABC):
     ) -> Index:
         raise NotImplementedError
 
+    @abstractmethod
+    def create_like_count_trigger(
+        self,
+        engine: Engine,
+    ):
+        raise NotImplementedError
+
 
 class TableUsecase(AbstractTableUsecase):
     def __init__(
@@ -70,3 +77,9 @@ class TableUsecase(AbstractTableUsecase):
             checkfirst=checkfirst,
             unique=unique,
         )
+
+    def create_like_count_trigger(
+        self,
+        engine: Engine,
+    ):
+        self.table_repository.create_like_count_trigger(engine=engine)
@@ -0,0 +1,103 @@
+import json
+import os
+import time
+from typing import List, Optional, Tuple
+
+import click
+from src.middleware.logger import configure_logger
+from src.service.feature_processing import DescriptionTokenizer, NameTokenizer
+
+logger = configure_logger(__name__)
+
+
+def load_texts(
+    animal_file: str,
+    limit: Optional[int] = None,
+) -> Tuple[List[str], List[str]]:
+    with open(animal_file, "r") as f:
+        data = json.load(f)
+    animals = list(data.values())
+    if limit is not None:
+        animals = animals[:limit]
+    names = [a["name"] for a in animals]
+    descriptions = [a["description"] for a in animals]
+    return names, descriptions
+
+
+def measure(
+    tokenizer,
+    X: List[str],
+    repeat: int,
+) -> Tuple[float, List[str]]:
+    best = float("inf")
+    y: List[str] = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        y = tokenizer.transform(X=X).tolist()
+        best = min(best, time.perf_counter() - start)
+    return best, y
+
+
+@click.command()
+@click.option(
+    "--animal_file",
+    type=str,
+    default=os.path.join(os.getenv("DATA_DIRECTORY", "/opt/dataset/data/"), "animal.json"),
+    help="animal.json of the dataset (https://storage.googleapis.com/aianimals/data/animal.json)",
+)
+@click.option(
+    "--n_jobs",
+    type=int,
+    multiple=True,
+    default=[2, 4, os.cpu_count() or 1],
+)
+@click.option(
+    "--repeat",
+    type=int,
+    default=3,
+)
+@click.option(
+    "--limit",
+    type=int,
+    required=False,
+)
+def main(
+    animal_file: str,
+    n_jobs: List[int],
+    repeat: int,
+    limit: Optional[int] = None,
+):
+    names, descriptions = load_texts(
+        animal_file=animal_file,
+        limit=limit,
+    )
+    logger.info(f"loaded {len(names)} animals from {animal_file}")
+
+    for tokenizer_class, X in ((NameTokenizer, names), (DescriptionTokenizer, descriptions)):
+        serial_second, expected = measure(
+            tokenizer=tokenizer_class(n_jobs=1),
+            X=X,
+            repeat=repeat,
+        )
+        logger.info(f"{tokenizer_class.__name__} n_jobs=1: {serial_second:.3f}s, {len(X) / serial_second:.1f} texts/s")
+        for n in sorted(set(n_jobs)):
+            if n <= 1:
+                continue
+            second, y = measure(
+                tokenizer=tokenizer_class(
+                    n_jobs=n,
+                    parallel_threshold=0,
+                ),
+                X=X,
+                repeat=repeat,
+            )
+            if y != expected:
+                raise ValueError(f"{tokenizer_class.__name__} n_jobs={n} output differs from serial tokenization")
+            logger.info(
+                f"{tokenizer_class.__name__} n_jobs={n}: {second:.3f}s, {len(X) / second:.1f} texts/s, "
+                f"speedup x{serial_second / second:.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -37,7 +37,19 @@ class Configurations:
     registry_mlflow_run_id = os.getenv("REGISTRY_MLFLOW_RUN_ID", _registry_mlflow_run_id)
 
     animal_feature_registry_queue = os.getenv("ANIMAL_FEATURE_REGISTRY_QUEUE", "animal_feature")
+    animal_feature_registry_batch_size = int(os.getenv("ANIMAL_FEATURE_REGISTRY_BATCH_SIZE", 1))
+    animal_feature_registry_batch_linger_ms = int(os.getenv("ANIMAL_FEATURE_REGISTRY_BATCH_LINGER_MS", 1000))
 
     empty_run = bool(int(os.getenv("EMPTY_RUN", "0")))
 
+    tokenizer_n_jobs = int(os.getenv("TOKENIZER_N_JOBS", 1))
+    tokenizer_parallel_threshold = int(os.getenv("TOKENIZER_PARALLEL_THRESHOLD", 2000))
+    token_cache_enabled = bool(int(os.getenv("TOKEN_CACHE_ENABLED", "1")))
+    token_cache_ttl = int(os.getenv("TOKEN_CACHE_TTL", 60 * 60 * 24 * 30))
+
+    feature_refit_interval_days = int(os.getenv("FEATURE_REFIT_INTERVAL_DAYS", 7))
+    feature_refit_oov_drift_threshold = float(os.getenv("FEATURE_REFIT_OOV_DRIFT_THRESHOLD", 0.1))
+    feature_refit_min_samples = int(os.getenv("FEATURE_REFIT_MIN_SAMPLES", 100))
+
     feature_cache_ttl = int(os.getenv("FEATURE_CACHE_TTL", 60 * 60 * 24 * 7))
+    feature_cache_encoding = os.getenv("FEATURE_CACHE_ENCODING", "binary")
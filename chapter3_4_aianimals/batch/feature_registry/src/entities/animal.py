@@ -6,11 +6,13 @@ from pydantic import BaseModel, Extra
 
 class AnimalQuery(BaseModel):
     id: Optional[str]
+    ids: Optional[List[str]]
     name: Optional[str]
     animal_category_id: Optional[int]
     animal_subcategory_id: Optional[int]
     user_id: Optional[str]
     deactivated: Optional[bool]
+    updated_from: Optional[datetime]
 
     class Config:
         extra = Extra.forbid
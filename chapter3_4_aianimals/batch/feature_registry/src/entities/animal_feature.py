@@ -0,0 +1,14 @@
+from datetime import datetime
+from typing import Optional
+
+from pydantic import BaseModel, Extra
+
+
+class AnimalFeatureState(BaseModel):
+    fitted_at: datetime
+    watermark: Optional[datetime]
+    description_oov_rate: float
+    name_oov_rate: float
+
+    class Config:
+        extra = Extra.forbid
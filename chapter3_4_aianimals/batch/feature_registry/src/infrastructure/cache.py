@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import Optional, Union
+from typing import Dict, List, Optional, Union
 
 
 class AbstractCache(ABC):
@@ -21,3 +21,36 @@ class AbstractCache(ABC):
         key: str,
     ) -> Optional[Union[str, int, float, bool, bytes]]:
         raise NotImplementedError
+
+    @abstractmethod
+    def mset(
+        self,
+        mapping: Dict[str, Union[str, int, float, bool, bytes]],
+        expire_second: int = 600,
+    ):
+        raise NotImplementedError
+
+    @abstractmethod
+    def hmget(
+        self,
+        name: str,
+        keys: List[str],
+    ) -> List[Optional[Union[str, int, float, bool, bytes]]]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def hset(
+        self,
+        name: str,
+        mapping: Dict[str, Union[str, int, float, bool, bytes]],
+        expire_second: int = 600,
+    ):
+        raise NotImplementedError
+
+    @abstractmethod
+    def expire_many(
+        self,
+        keys: List[str],
+        expire_second: int = 600,
+    ):
+        raise NotImplementedError
@@ -1,5 +1,5 @@
 import os
-from typing import Optional, Union
+from typing import Dict, List, Optional, Union
 
 import redis
 from src.infrastructure.cache import AbstractCache
@@ -40,3 +40,49 @@ class RedisCache(AbstractCache):
     ) -> Optional[Union[str, int, float, bool, bytes]]:
         value = self.redis_client.get(key)
         return value
+
+    def mset(
+        self,
+        mapping: Dict[str, Union[str, int, float, bool, bytes]],
+        expire_second: int = 600,
+    ):
+        pipeline = self.redis_client.pipeline(transaction=False)
+        for key, value in mapping.items():
+            pipeline.set(
+                name=key,
+                value=value,
+                ex=expire_second,
+            )
+        pipeline.execute()
+
+    def hmget(
+        self,
+        name: str,
+        keys: List[str],
+    ) -> List[Optional[Union[str, int, float, bool, bytes]]]:
+        if len(keys) == 0:
+            return []
+        return self.redis_client.hmget(name, keys)
+
+    def hset(
+        self,
+        name: str,
+        mapping: Dict[str, Union[str, int, float, bool, bytes]],
+        expire_second: int = 600,
+    ):
+        if len(mapping) == 0:
+            return
+        pipeline = self.redis_client.pipeline(transaction=False)
+        pipeline.hset(name=name, mapping=mapping)
+        pipeline.expire(name=name, time=expire_second)
+        pipeline.execute()
+
+    def expire_many(
+        self,
+        keys: List[str],
+        expire_second: int = 600,
+    ):
+        pipeline = self.redis_client.pipeline(transaction=False)
+        for key in keys:
+            pipeline.expire(name=key, time=expire_second)
+        pipeline.execute()
@@ -27,13 +27,20 @@ class AnimalFeatureRegistrationJob(AbstractJob):
         try:
             self.messaging.init_channel()
             self.messaging.create_queue(queue_name=Configurations.animal_feature_registry_queue)
-            self.messaging.channel.basic_qos(prefetch_count=1)
-            self.animal_feature_usecase.register_animal_feature(
-                request=AnimalFeatureRegistrationRequest(
-                    mlflow_experiment_id=mlflow_experiment_id,
-                    mlflow_run_id=mlflow_run_id,
-                ),
+            request = AnimalFeatureRegistrationRequest(
+                mlflow_experiment_id=mlflow_experiment_id,
+                mlflow_run_id=mlflow_run_id,
             )
+            if Configurations.animal_feature_registry_batch_size > 1:
+                self.messaging.channel.basic_qos(prefetch_count=Configurations.animal_feature_registry_batch_size)
+                self.animal_feature_usecase.register_animal_features_from_queue(
+                    request=request,
+                    batch_size=Configurations.animal_feature_registry_batch_size,
+                    linger_ms=Configurations.animal_feature_registry_batch_linger_ms,
+                )
+            else:
+                self.messaging.channel.basic_qos(prefetch_count=1)
+                self.animal_feature_usecase.register_animal_feature(request=request)
         except Exception as e:
             logger.exception(e)
             raise e
@@ -0,0 +1,31 @@
+from src.job.abstract_job import AbstractJob
+from src.middleware.logger import configure_logger
+from src.request_object.animal_feature import AnimalFeatureUpdateRequest
+from src.response_object.animal_feature import AnimalFeatureUpdateResponse
+from src.usecase.animal_feature_usecase import AbstractAnimalFeatureUsecase
+
+logger = configure_logger(__name__)
+
+
+class AnimalFeatureUpdateJob(AbstractJob):
+    def __init__(
+        self,
+        animal_feature_usecase: AbstractAnimalFeatureUsecase,
+    ):
+        super().__init__()
+        self.animal_feature_usecase = animal_feature_usecase
+
+    def run(
+        self,
+        mlflow_experiment_id: int,
+        mlflow_run_id: str,
+    ) -> AnimalFeatureUpdateResponse:
+        logger.info("run animal feature update job")
+        response = self.animal_feature_usecase.update_animal_feature(
+            request=AnimalFeatureUpdateRequest(
+                mlflow_experiment_id=mlflow_experiment_id,
+                mlflow_run_id=mlflow_run_id,
+            )
+        )
+        logger.info(f"updated {len(response.animal_ids)} animal features; refit required: {response.refit_required}")
+        return response
@@ -11,6 +11,7 @@ class Job(BaseModel):
 class JOBS(Enum):
     ANIMAL_FEATURE_INITIALIZATION_JOB = Job(name="animal_feature_initialization_job")
     ANIMAL_FEATURE_REGISTRATION_JOB = Job(name="animal_feature_registration_job")
+    ANIMAL_FEATURE_UPDATE_JOB = Job(name="animal_feature_update_job")
 
     @staticmethod
     def has_name(name: str) -> bool:
@@ -2,10 +2,12 @@ import json
 import os
 from datetime import datetime
 from time import sleep
+from typing import Tuple
 
 import cloudpickle
 import hydra
 import mlflow
+from mlflow.entities import Run
 from mlflow.tracking import MlflowClient
 from omegaconf import DictConfig
 from src.configurations import Configurations
@@ -22,10 +24,136 @@ from src.service.feature_processing import (
     NameTokenizer,
     NameVectorizer,
 )
+from src.service.token_cache import AbstractTokenCache, NoTokenCache, TokenCache
 
 logger = configure_logger(__name__)
 
 
+def initialize(
+    cfg: DictConfig,
+    cwd: str,
+    cache: RedisCache,
+    token_cache: AbstractTokenCache,
+):
+    container = Container(
+        database=PostgreSQLDatabase(),
+        messaging=RabbitmqMessaging(),
+        cache=cache,
+        animal_category_vectorizer=CategoricalVectorizer(
+            sparse=cfg.jobs.animal_category.one_hot_encoding.sparse,
+            handle_unknown=cfg.jobs.animal_category.one_hot_encoding.handle_unknown,
+        ),
+        animal_subcategory_vectorizer=CategoricalVectorizer(
+            sparse=cfg.jobs.animal_subcategory.one_hot_encoding.sparse,
+            handle_unknown=cfg.jobs.animal_subcategory.one_hot_encoding.handle_unknown,
+        ),
+        description_tokenizer=DescriptionTokenizer(
+            n_jobs=Configurations.tokenizer_n_jobs,
+            parallel_threshold=Configurations.tokenizer_parallel_threshold,
+            token_cache=token_cache,
+        ),
+        name_tokenizer=NameTokenizer(
+            n_jobs=Configurations.tokenizer_n_jobs,
+            parallel_threshold=Configurations.tokenizer_parallel_threshold,
+            token_cache=token_cache,
+        ),
+        description_vectorizer=DescriptionVectorizer(
+            max_features=cfg.jobs.description.vectorizer.max_features,
+        ),
+        name_vectorizer=NameVectorizer(
+            max_features=cfg.jobs.name.vectorizer.max_features,
+        ),
+    )
+
+    now = datetime.now().strftime("%Y%m%d_%H%M%S")
+    run_name = f"{cfg.task_name}_{now}"
+    logger.info(f"experiment_name: {Configurations.mlflow_experiment_name}")
+    logger.info(f"run_name: {run_name}")
+    logger.info("START...")
+
+    mlflow.set_tracking_uri(os.getenv("MLFLOW_TRACKING_URI", "http://mlflow:5000"))
+    mlflow.set_experiment(experiment_name=Configurations.mlflow_experiment_name)
+    with mlflow.start_run(run_name=run_name) as run:
+        container.animal_feature_initialization_job.run(
+            mlflow_experiment_id=run.info.experiment_id,
+            mlflow_run_id=run.info.run_id,
+        )
+        mlflow.log_artifacts(os.path.join(cwd, ".hydra/"), "hydra")
+
+        mlflow_params = dict(
+            mlflow_experiment_id=run.info.experiment_id,
+            mlflow_run_id=run.info.run_id,
+        )
+        logger.info(f"mlflow params: {mlflow_params}")
+        with open("/tmp/output.json", "w") as f:
+            json.dump(mlflow_params, f)
+
+
+def load_registered_container(
+    cache: RedisCache,
+    token_cache: AbstractTokenCache,
+) -> Tuple[Container, Run]:
+    mlflow_client = MlflowClient()
+    mlflow.set_tracking_uri(os.getenv("MLFLOW_TRACKING_URI", "http://mlflow:5000"))
+    mlflow.set_experiment(experiment_id=Configurations.registry_mlflow_experiment_id)
+    run = mlflow_client.get_run(run_id=Configurations.registry_mlflow_run_id)
+
+    def download_model(
+        run_id: str,
+        save_as: str,
+    ) -> str:
+        model_path = mlflow_client.download_artifacts(
+            run_id=run_id,
+            path=save_as,
+        )
+        return os.path.join(model_path, os.listdir(model_path)[0])
+
+    animal_category_vectorizer_path = download_model(
+        run_id=run.info.run_id,
+        save_as="animal_category_vectorizer",
+    )
+    animal_subcategory_vectorizer_path = download_model(
+        run_id=run.info.run_id,
+        save_as="animal_subcategory_vectorizer",
+    )
+    description_vectorizer_path = download_model(
+        run_id=run.info.run_id,
+        save_as="description_vectorizer",
+    )
+    name_vectorizer_path = download_model(
+        run_id=run.info.run_id,
+        save_as="name_vectorizer",
+    )
+    with open(animal_category_vectorizer_path, "rb") as f:
+        animal_category_vectorizer: CategoricalVectorizer = cloudpickle.load(f)
+    with open(animal_subcategory_vectorizer_path, "rb") as f:
+        animal_subcategory_vectorizer: CategoricalVectorizer = cloudpickle.load(f)
+    with open(description_vectorizer_path, "rb") as f:
+        description_vectorizer: DescriptionTokenizer = cloudpickle.load(f)
+    with open(name_vectorizer_path, "rb") as f:
+        name_vectorizer: NameVectorizer = cloudpickle.load(f)
+    container = Container(
+        database=PostgreSQLDatabase(),
+        messaging=RabbitmqMessaging(),
+        cache=cache,
+        animal_category_vectorizer=animal_category_vectorizer,
+        animal_subcategory_vectorizer=animal_subcategory_vectorizer,
+        description_tokenizer=DescriptionTokenizer(
+            n_jobs=Configurations.tokenizer_n_jobs,
+            parallel_threshold=Configurations.tokenizer_parallel_threshold,
+            token_cache=token_cache,
+        ),
+        name_tokenizer=NameTokenizer(
+            n_jobs=Configurations.tokenizer_n_jobs,
+            parallel_threshold=Configurations.tokenizer_parallel_threshold,
+            token_cache=token_cache,
+        ),
+        description_vectorizer=description_vectorizer,
+        name_vectorizer=name_vectorizer,
+    )
+    return container, run
+
+
 @hydra.main(
     config_path="../hydra",
     config_name=os.getenv("MODEL_CONFIG", "animal_feature"),
@@ -36,111 +164,63 @@ def main(cfg: DictConfig):
 
     logger.info(f"current working directory: {cwd}")
 
-    if Configurations.job == JOBS.ANIMAL_FEATURE_INITIALIZATION_JOB.value.name:
-        container = Container(
-            database=PostgreSQLDatabase(),
-            messaging=RabbitmqMessaging(),
-            cache=RedisCache(),
-            animal_category_vectorizer=CategoricalVectorizer(
-                sparse=cfg.jobs.animal_category.one_hot_encoding.sparse,
-                handle_unknown=cfg.jobs.animal_category.one_hot_encoding.handle_unknown,
-            ),
-            animal_subcategory_vectorizer=CategoricalVectorizer(
-                sparse=cfg.jobs.animal_subcategory.one_hot_encoding.sparse,
-                handle_unknown=cfg.jobs.animal_subcategory.one_hot_encoding.handle_unknown,
-            ),
-            description_tokenizer=DescriptionTokenizer(),
-            name_tokenizer=NameTokenizer(),
-            description_vectorizer=DescriptionVectorizer(
-                max_features=cfg.jobs.description.vectorizer.max_features,
-            ),
-            name_vectorizer=NameVectorizer(
-                max_features=cfg.jobs.name.vectorizer.max_features,
-            ),
+    cache = RedisCache()
+    token_cache: AbstractTokenCache = (
+        TokenCache(
+            cache=cache,
+            expire_second=Configurations.token_cache_ttl,
         )
+        if Configurations.token_cache_enabled
+        else NoTokenCache()
+    )
 
-        now = datetime.now().strftime("%Y%m%d_%H%M%S")
-        run_name = f"{cfg.task_name}_{now}"
-        logger.info(f"experiment_name: {Configurations.mlflow_experiment_name}")
-        logger.info(f"run_name: {run_name}")
-        logger.info("START...")
-
-        mlflow.set_tracking_uri(os.getenv("MLFLOW_TRACKING_URI", "http://mlflow:5000"))
-        mlflow.set_experiment(experiment_name=Configurations.mlflow_experiment_name)
-        with mlflow.start_run(run_name=run_name) as run:
-            container.animal_feature_initialization_job.run(
-                mlflow_experiment_id=run.info.experiment_id,
-                mlflow_run_id=run.info.run_id,
-            )
-            mlflow.log_artifacts(os.path.join(cwd, ".hydra/"), "hydra")
-
-            mlflow_params = dict(
-                mlflow_experiment_id=run.info.experiment_id,
-                mlflow_run_id=run.info.run_id,
-            )
-            logger.info(f"mlflow params: {mlflow_params}")
-            with open("/tmp/output.json", "w") as f:
-                json.dump(mlflow_params, f)
+    if Configurations.job == JOBS.ANIMAL_FEATURE_INITIALIZATION_JOB.value.name:
+        initialize(
+            cfg=cfg,
+            cwd=cwd,
+            cache=cache,
+            token_cache=token_cache,
+        )
 
     elif Configurations.job == JOBS.ANIMAL_FEATURE_REGISTRATION_JOB.value.name:
         if Configurations.empty_run:
             while True:
                 sleep(10)
                 logger.info("empty run...")
-        mlflow_client = MlflowClient()
-        mlflow.set_tracking_uri(os.getenv("MLFLOW_TRACKING_URI", "http://mlflow:5000"))
-        mlflow.set_experiment(experiment_id=Configurations.registry_mlflow_experiment_id)
-        run = mlflow_client.get_run(run_id=Configurations.registry_mlflow_run_id)
-
-        def download_model(
-            run_id: str,
-            save_as: str,
-        ) -> str:
-            model_path = mlflow_client.download_artifacts(
-                run_id=run_id,
-                path=save_as,
-            )
-            return os.path.join(model_path, os.listdir(model_path)[0])
-
-        animal_category_vectorizer_path = download_model(
-            run_id=run.info.run_id,
-            save_as="animal_category_vectorizer",
+        container, run = load_registered_container(
+            cache=cache,
+            token_cache=token_cache,
         )
-        animal_subcategory_vectorizer_path = download_model(
-            run_id=run.info.run_id,
-            save_as="animal_subcategory_vectorizer",
-        )
-        description_vectorizer_path = download_model(
-            run_id=run.info.run_id,
-            save_as="description_vectorizer",
-        )
-        name_vectorizer_path = download_model(
-            run_id=run.info.run_id,
-            save_as="name_vectorizer",
+        container.animal_feature_registration_job.run(
+            mlflow_experiment_id=run.info.experiment_id,
+            mlflow_run_id=run.info.run_id,
         )
-        with open(animal_category_vectorizer_path, "rb") as f:
-            animal_category_vectorizer: CategoricalVectorizer = cloudpickle.load(f)
-        with open(animal_subcategory_vectorizer_path, "rb") as f:
-            animal_subcategory_vectorizer: CategoricalVectorizer = cloudpickle.load(f)
-        with open(description_vectorizer_path, "rb") as f:
-            description_vectorizer: DescriptionTokenizer = cloudpickle.load(f)
-        with open(name_vectorizer_path, "rb") as f:
-            name_vectorizer: NameVectorizer = cloudpickle.load(f)
-        container = Container(
-            database=PostgreSQLDatabase(),
-            messaging=RabbitmqMessaging(),
-            cache=RedisCache(),
-            animal_category_vectorizer=animal_category_vectorizer,
-            animal_subcategory_vectorizer=animal_subcategory_vectorizer,
-            description_tokenizer=DescriptionTokenizer(),
-            name_tokenizer=NameTokenizer(),
-            description_vectorizer=description_vectorizer,
-            name_vectorizer=name_vectorizer,
+
+    elif Configurations.job == JOBS.ANIMAL_FEATURE_UPDATE_JOB.value.name:
+        container, run = load_registered_container(
+            cache=cache,
+            token_cache=token_cache,
         )
-        container.animal_feature_registration_job.run(
+        response = container.animal_feature_update_job.run(
             mlflow_experiment_id=run.info.experiment_id,
             mlflow_run_id=run.info.run_id,
         )
+        if response.refit_required:
+            logger.info(f"run full refit: {response.reason}")
+            initialize(
+                cfg=cfg,
+                cwd=cwd,
+                cache=cache,
+                token_cache=token_cache,
+            )
+        else:
+            mlflow_params = dict(
+                mlflow_experiment_id=run.info.experiment_id,
+                mlflow_run_id=run.info.run_id,
+            )
+            logger.info(f"mlflow params: {mlflow_params}")
+            with open("/tmp/output.json", "w") as f:
+                json.dump(mlflow_params, f)
 
     else:
         raise ValueError
@@ -4,6 +4,7 @@ from src.infrastructure.client.rabbitmq_messaging import RabbitmqMessaging
 from src.infrastructure.database import AbstractDatabase
 from src.job.animal_feature_initialization_job import AnimalFeatureInitializationJob
 from src.job.animal_feature_registration_job import AnimalFeatureRegistrationJob
+from src.job.animal_feature_update_job import AnimalFeatureUpdateJob
 from src.middleware.logger import configure_logger
 from src.repository.animal_repository import AbstractAnimalRepository, AnimalRepository
 from src.service.feature_processing import (
@@ -13,6 +14,7 @@ from src.service.feature_processing import (
     NameTokenizer,
     NameVectorizer,
 )
+from src.service.refit_policy import RefitPolicy
 from src.usecase.animal_feature_usecase import AbstractAnimalFeatureUsecase, AnimalFeatureUsecase
 
 logger = configure_logger(__name__)
@@ -43,6 +45,11 @@ class Container(object):
         self.name_tokenizer = name_tokenizer
         self.description_vectorizer = description_vectorizer
         self.name_vectorizer = name_vectorizer
+        self.refit_policy = RefitPolicy(
+            refit_interval_days=Configurations.feature_refit_interval_days,
+            oov_drift_threshold=Configurations.feature_refit_oov_drift_threshold,
+            min_samples=Configurations.feature_refit_min_samples,
+        )
 
         self.animal_repository: AbstractAnimalRepository = AnimalRepository(database=self.database)
 
@@ -56,6 +63,7 @@ class Container(object):
             name_tokenizer=self.name_tokenizer,
             description_vectorizer=self.description_vectorizer,
             name_vectorizer=self.name_vectorizer,
+            refit_policy=self.refit_policy,
         )
 
         self.animal_feature_initialization_job: AnimalFeatureInitializationJob = AnimalFeatureInitializationJob(
@@ -65,3 +73,6 @@ class Container(object):
             animal_feature_usecase=self.animal_feature_usecase,
             messaging=self.messaging,
         )
+        self.animal_feature_update_job: AnimalFeatureUpdateJob = AnimalFeatureUpdateJob(
+            animal_feature_usecase=self.animal_feature_usecase,
+        )
@@ -1,7 +1,9 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
 from sqlalchemy import and_
+from sqlalchemy.orm import Query, Session
+from sqlalchemy.sql.functions import current_timestamp
 from src.entities.animal import AnimalCreate, AnimalModel, AnimalQuery, AnimalUpdate
 from src.infrastructure.database import AbstractDatabase
 from src.middleware.logger import configure_logger
@@ -26,6 +28,21 @@ class AbstractAnimalRepository(ABC):
     ) -> List[AnimalModel]:
         raise NotImplementedError
 
+    @abstractmethod
+    def stream(
+        self,
+        query: Optional[AnimalQuery],
+        batch_size: int = 1000,
+    ) -> Iterator[AnimalModel]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def select_ids(
+        self,
+        query: Optional[AnimalQuery],
+    ) -> List[str]:
+        raise NotImplementedError
+
     @abstractmethod
     def insert(
         self,
@@ -54,6 +71,92 @@ class AnimalRepository(AbstractAnimalRepository):
     def __init__(self, database: AbstractDatabase) -> None:
         super().__init__(database=database)
 
+    def __make_filters(
+        self,
+        query: Optional[AnimalQuery],
+    ) -> List:
+        filters = []
+        if query is not None:
+            if query.id is not None:
+                filters.append(Animal.id == query.id)
+            if query.ids is not None:
+                filters.append(Animal.id.in_(query.ids))
+            if query.name is not None:
+                filters.append(Animal.name == query.name)
+            if query.animal_category_id is not None:
+                filters.append(Animal.animal_category_id == query.animal_category_id)
+            if query.animal_subcategory_id is not None:
+                filters.append(Animal.animal_subcategory_id == query.animal_subcategory_id)
+            if query.user_id is not None:
+                filters.append(Animal.user_id == query.user_id)
+            if query.deactivated is not None:
+                filters.append(Animal.deactivated == query.deactivated)
+            if query.updated_from is not None:
+                filters.append(Animal.updated_at >= query.updated_from)
+        return filters
+
+    def __make_query(
+        self,
+        session: Session,
+        query: Optional[AnimalQuery],
+    ) -> Query:
+        filters = self.__make_filters(query=query)
+        return (
+            session.query(
+                Animal.id.label("id"),
+                AnimalCategory.id.label("animal_category_id"),
+                AnimalCategory.name_en.label("animal_category_name_en"),
+                AnimalCategory.name_ja.label("animal_category_name_ja"),
+                AnimalSubcategory.id.label("animal_subcategory_id"),
+                AnimalSubcategory.name_en.label("animal_subcategory_name_en"),
+                AnimalSubcategory.name_ja.label("animal_subcategory_name_ja"),
+                Animal.name.label("name"),
+                Animal.description.label("description"),
+                Animal.photo_url.label("photo_url"),
+                Animal.deactivated.label("deactivated"),
+                User.id.label("user_id"),
+                User.handle_name.label("user_handle_name"),
+                Animal.created_at.label("created_at"),
+                Animal.updated_at.label("updated_at"),
+            )
+            .join(
+                AnimalCategory,
+                AnimalCategory.id == Animal.animal_category_id,
+                isouter=True,
+            )
+            .join(
+                AnimalSubcategory,
+                AnimalSubcategory.id == Animal.animal_subcategory_id,
+                isouter=True,
+            )
+            .join(
+                User,
+                User.id == Animal.user_id,
+                isouter=True,
+            )
+            .filter(and_(*filters))
+            .order_by(Animal.id)
+        )
+
+    def __to_model(self, d) -> AnimalModel:
+        return AnimalModel(
+            id=d[0],
+            animal_category_id=d[1],
+            animal_category_name_en=d[2],
+            animal_category_name_ja=d[3],
+            animal_subcategory_id=d[4],
+            animal_subcategory_name_en=d[5],
+            animal_subcategory_name_ja=d[6],
+            name=d[7],
+            description=d[8],
+            photo_url=d[9],
+            deactivated=d[10],
+            user_id=d[11],
+            user_handle_name=d[12],
+            created_at=d[13],
+            updated_at=d[14],
+        )
+
     def select(
         self,
         query: Optional[AnimalQuery],
@@ -62,84 +165,57 @@ class AnimalRepository(AbstractAnimalRepository):
     ) -> List[AnimalModel]:
         session = self.database.get_session().__next__()
         try:
-            filters = []
-            if query is not None:
-                if query.id is not None:
-                    filters.append(Animal.id == query.id)
-                if query.name is not None:
-                    filters.append(Animal.name == query.name)
-                if query.animal_category_id is not None:
-                    filters.append(Animal.animal_category_id == query.animal_category_id)
-                if query.animal_subcategory_id is not None:
-                    filters.append(Animal.animal_subcategory_id == query.animal_subcategory_id)
-                if query.user_id is not None:
-                    filters.append(Animal.id == query.user_id)
-                if query.deactivated is not None:
-                    filters.append(Animal.deactivated == query.deactivated)
             results = (
-                session.query(
-                    Animal.id.label("id"),
-                    AnimalCategory.id.label("animal_category_id"),
-                    AnimalCategory.name_en.label("animal_category_name_en"),
-                    AnimalCategory.name_ja.label("animal_category_name_ja"),
-                    AnimalSubcategory.id.label("animal_subcategory_id"),
-                    AnimalSubcategory.name_en.label("animal_subcategory_name_en"),
-                    AnimalSubcategory.name_ja.label("animal_subcategory_name_ja"),
-                    Animal.name.label("name"),
-                    Animal.description.label("description"),
-                    Animal.photo_url.label("photo_url"),
-                    Animal.deactivated.label("deactivated"),
-                    User.id.label("user_id"),
-                    User.handle_name.label("user_handle_name"),
-                    Animal.created_at.label("created_at"),
-                    Animal.updated_at.label("updated_at"),
-                )
-                .join(
-                    AnimalCategory,
-                    AnimalCategory.id == Animal.animal_category_id,
-                    isouter=True,
-                )
-                .join(
-                    AnimalSubcategory,
-                    AnimalSubcategory.id == Animal.animal_subcategory_id,
-                    isouter=True,
+                self.__make_query(
+                    session=session,
+                    query=query,
                 )
-                .join(
-                    User,
-                    User.id == Animal.user_id,
-                    isouter=True,
-                )
-                .filter(and_(*filters))
-                .order_by(Animal.id)
                 .limit(limit)
                 .offset(offset)
             )
-            data = [
-                AnimalModel(
-                    id=d[0],
-                    animal_category_id=d[1],
-                    animal_category_name_en=d[2],
-                    animal_category_name_ja=d[3],
-                    animal_subcategory_id=d[4],
-                    animal_subcategory_name_en=d[5],
-                    animal_subcategory_name_ja=d[6],
-                    name=d[7],
-                    description=d[8],
-                    photo_url=d[9],
-                    deactivated=d[10],
-                    user_id=d[11],
-                    user_handle_name=d[12],
-                    created_at=d[13],
-                    updated_at=d[14],
-                )
-                for d in results
-            ]
+            data = [self.__to_model(d=d) for d in results]
             return data
         except Exception as e:
             raise e
         finally:
             session.close()
 
+    def stream(
+        self,
+        query: Optional[AnimalQuery],
+        batch_size: int = 1000,
+    ) -> Iterator[AnimalModel]:
+        session = self.database.get_session().__next__()
+        try:
+            results = (
+                self.__make_query(
+                    session=session,
+                    query=query,
+                )
+                .execution_options(stream_results=True)
+                .yield_per(batch_size)
+            )
+            for d in results:
+                yield self.__to_model(d=d)
+        except Exception as e:
+            raise e
+        finally:
+            session.close()
+
+    def select_ids(
+        self,
+        query: Optional[AnimalQuery],
+    ) -> List[str]:
+        session = self.database.get_session().__next__()
+        try:
+            filters = self.__make_filters(query=query)
+            results = session.query(Animal.id).filter(and_(*filters)).order_by(Animal.id)
+            return [d[0] for d in results]
+        except Exception as e:
+            raise e
+        finally:
+            session.close()
+
     def insert(
         self,
         record: AnimalCreate,
@@ -186,6 +262,7 @@ class AnimalRepository(AbstractAnimalRepository):
                 updates["photo_url"] = record.photo_url
             if record.deactivated is not None:
                 updates["deactivated"] = record.deactivated
+            updates["updated_at"] = current_timestamp()
             session.query(Animal).filter(Animal.id == record.id).update(updates)
             session.commit()
         except Exception as e:
@@ -17,3 +17,11 @@ class AnimalFeatureRegistrationRequest(BaseModel):
 
     class Config:
         extra = Extra.forbid
+
+
+class AnimalFeatureUpdateRequest(BaseModel):
+    mlflow_experiment_id: int
+    mlflow_run_id: str
+
+    class Config:
+        extra = Extra.forbid
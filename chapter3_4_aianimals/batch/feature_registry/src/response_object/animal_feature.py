@@ -1,4 +1,5 @@
-from typing import List
+from datetime import datetime
+from typing import List, Optional
 
 from pydantic import BaseModel, Extra
 
@@ -12,3 +13,13 @@ class AnimalFeatureInitializeResponse(BaseModel):
 
     class Config:
         extra = Extra.forbid
+
+
+class AnimalFeatureUpdateResponse(BaseModel):
+    refit_required: bool
+    reason: Optional[str]
+    animal_ids: List[str]
+    watermark: Optional[datetime]
+
+    class Config:
+        extra = Extra.forbid
@@ -1,5 +1,7 @@
+import os
 import sys
-from typing import List
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, List, Optional
 
 import cloudpickle
 import MeCab
@@ -11,11 +13,117 @@ from sklearn.pipeline import Pipeline
 from sklearn.preprocessing import OneHotEncoder
 from src.constants import STOP_WORDS
 from src.middleware.logger import configure_logger
+from src.service.token_cache import AbstractTokenCache
 
 logger = configure_logger(__name__)
 
 cloudpickle.register_pickle_by_value(sys.modules[__name__])
 
+_TAGGER: Optional[MeCab.Tagger] = None
+
+
+def get_tagger() -> MeCab.Tagger:
+    global _TAGGER
+    if _TAGGER is None:
+        _TAGGER = MeCab.Tagger()
+    return _TAGGER
+
+
+def parse_description(
+    tagger: MeCab.Tagger,
+    text: str,
+    stop_words: List[str] = [],
+) -> List[str]:
+    ts = tagger.parse(text)
+    ts = ts.split("\n")
+    tokens = []
+    for t in ts:
+        if t == "EOS":
+            break
+        s = t.split("\t")
+        r = s[1].split(",")
+        w = ""
+        if r[0] == "名詞":
+            w = s[0]
+        elif r[0] in ("動詞", "形容詞"):
+            w = r[6]
+        if w == "":
+            continue
+        if w in stop_words:
+            continue
+        tokens.append(w)
+    return tokens
+
+
+def parse_name(
+    tagger: MeCab.Tagger,
+    text: str,
+    stop_words: List[str] = [],
+) -> List[str]:
+    ts = tagger.parse(text)
+    ts = ts.split("\n")
+    tokens = []
+    for t in ts:
+        if t == "EOS":
+            break
+        s = t.split("\t")
+        r = s[1].split(",")
+        w = s[0]
+        if r[0] in ("助詞"):
+            continue
+        if w == "":
+            continue
+        if w in stop_words:
+            continue
+        tokens.append(w)
+    return tokens
+
+
+def tokenize_descriptions(
+    X: List[str],
+    stop_words: List[str] = [],
+) -> List[str]:
+    tagger = get_tagger()
+    return [" ".join(parse_description(tagger=tagger, text=x, stop_words=stop_words)) for x in X]
+
+
+def tokenize_names(
+    X: List[str],
+    stop_words: List[str] = [],
+) -> List[str]:
+    tagger = get_tagger()
+    return [" ".join(parse_name(tagger=tagger, text=x, stop_words=stop_words)) for x in X]
+
+
+def tokenize_in_parallel(
+    tokenize: Callable[[List[str], List[str]], List[str]],
+    X: List[str],
+    stop_words: List[str],
+    n_jobs: int,
+    chunk_size: int = 500,
+) -> List[str]:
+    chunks = [X[i : i + chunk_size] for i in range(0, len(X), chunk_size)]
+    max_workers = min(n_jobs, len(chunks))
+    logger.info(f"tokenize {len(X)} texts in {len(chunks)} chunks with {max_workers} processes")
+    y: List[str] = []
+    with ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=get_tagger,
+    ) as executor:
+        for tokens in executor.map(
+            tokenize,
+            chunks,
+            [stop_words] * len(chunks),
+        ):
+            y.extend(tokens)
+    return y
+
+
+def resolve_n_jobs(n_jobs: int) -> int:
+    if n_jobs < 0:
+        return max(1, (os.cpu_count() or 1) + 1 + n_jobs)
+    return max(1, n_jobs)
+
 
 class CategoricalVectorizer(BaseEstimator, TransformerMixin):
     def __init__(
@@ -76,8 +184,16 @@ class DescriptionTokenizer(BaseEstimator, TransformerMixin):
     def __init__(
         self,
         stop_words=STOP_WORDS,
+        n_jobs: int = 1,
+        parallel_threshold: int = 2000,
+        chunk_size: int = 500,
+        token_cache: Optional[AbstractTokenCache] = None,
     ):
         self.stop_words = stop_words
+        self.n_jobs = n_jobs
+        self.parallel_threshold = parallel_threshold
+        self.chunk_size = chunk_size
+        self.token_cache = token_cache
         self.tokenizer = MeCab.Tagger()
 
     def tokenize_description(
@@ -85,30 +201,26 @@ class DescriptionTokenizer(BaseEstimator, TransformerMixin):
         text: str,
         stop_words: List[str] = [],
     ) -> List[str]:
-        ts = self.tokenizer.parse(text)
-        ts = ts.split("\n")
-        tokens = []
-        for t in ts:
-            if t == "EOS":
-                break
-            s = t.split("\t")
-            r = s[1].split(",")
-            w = ""
-            if r[0] == "名詞":
-                w = s[0]
-            elif r[0] in ("動詞", "形容詞"):
-                w = r[6]
-            if w == "":
-                continue
-            if w in stop_words:
-                continue
-            tokens.append(w)
-        return tokens
+        return parse_description(
+            tagger=self.tokenizer,
+            text=text,
+            stop_words=stop_words,
+        )
 
-    def transform(
+    def __tokenize(
         self,
         X: List[str],
-    ) -> np.ndarray:
+    ) -> List[str]:
+        n_jobs = resolve_n_jobs(n_jobs=self.n_jobs)
+        if n_jobs > 1 and len(X) >= self.parallel_threshold:
+            return tokenize_in_parallel(
+                tokenize=tokenize_descriptions,
+                X=X,
+                stop_words=self.stop_words,
+                n_jobs=n_jobs,
+                chunk_size=self.chunk_size,
+            )
+
         y = []
         for x in X:
             ts = self.tokenize_description(
@@ -117,6 +229,33 @@ class DescriptionTokenizer(BaseEstimator, TransformerMixin):
             )
             ts = " ".join(ts)
             y.append(ts)
+        return y
+
+    def transform(
+        self,
+        X: List[str],
+    ) -> np.ndarray:
+        X = list(X)
+        if self.token_cache is None:
+            return np.array(self.__tokenize(X=X))
+
+        y = self.token_cache.get(
+            kind="description",
+            stop_words=self.stop_words,
+            texts=X,
+        )
+        missing = [i for i, v in enumerate(y) if v is None]
+        if len(missing) > 0:
+            texts = [X[i] for i in missing]
+            tokens = self.__tokenize(X=texts)
+            self.token_cache.set(
+                kind="description",
+                stop_words=self.stop_words,
+                texts=texts,
+                tokens=tokens,
+            )
+            for i, token in zip(missing, tokens):
+                y[i] = token
         return np.array(y)
 
     def fit(
@@ -139,8 +278,16 @@ class NameTokenizer(BaseEstimator, TransformerMixin):
     def __init__(
         self,
         stop_words=STOP_WORDS,
+        n_jobs: int = 1,
+        parallel_threshold: int = 2000,
+        chunk_size: int = 500,
+        token_cache: Optional[AbstractTokenCache] = None,
     ):
         self.stop_words = stop_words
+        self.n_jobs = n_jobs
+        self.parallel_threshold = parallel_threshold
+        self.chunk_size = chunk_size
+        self.token_cache = token_cache
         self.tokenizer = MeCab.Tagger()
 
     def tokenize_name(
@@ -148,28 +295,26 @@ class NameTokenizer(BaseEstimator, TransformerMixin):
         text: str,
         stop_words: List[str] = [],
     ) -> List[str]:
-        ts = self.tokenizer.parse(text)
-        ts = ts.split("\n")
-        tokens = []
-        for t in ts:
-            if t == "EOS":
-                break
-            s = t.split("\t")
-            r = s[1].split(",")
-            w = s[0]
-            if r[0] in ("助詞"):
-                continue
-            if w == "":
-                continue
-            if w in stop_words:
-                continue
-            tokens.append(w)
-        return tokens
+        return parse_name(
+            tagger=self.tokenizer,
+            text=text,
+            stop_words=stop_words,
+        )
 
-    def transform(
+    def __tokenize(
         self,
         X: List[str],
-    ) -> np.ndarray:
+    ) -> List[str]:
+        n_jobs = resolve_n_jobs(n_jobs=self.n_jobs)
+        if n_jobs > 1 and len(X) >= self.parallel_threshold:
+            return tokenize_in_parallel(
+                tokenize=tokenize_names,
+                X=X,
+                stop_words=self.stop_words,
+                n_jobs=n_jobs,
+                chunk_size=self.chunk_size,
+            )
+
         y = []
         for x in X:
             ts = self.tokenize_name(
@@ -178,6 +323,33 @@ class NameTokenizer(BaseEstimator, TransformerMixin):
             )
             ts = " ".join(ts)
             y.append(ts)
+        return y
+
+    def transform(
+        self,
+        X: List[str],
+    ) -> np.ndarray:
+        X = list(X)
+        if self.token_cache is None:
+            return np.array(self.__tokenize(X=X))
+
+        y = self.token_cache.get(
+            kind="name",
+            stop_words=self.stop_words,
+            texts=X,
+        )
+        missing = [i for i, v in enumerate(y) if v is None]
+        if len(missing) > 0:
+            texts = [X[i] for i in missing]
+            tokens = self.__tokenize(X=texts)
+            self.token_cache.set(
+                kind="name",
+                stop_words=self.stop_words,
+                texts=texts,
+                tokens=tokens,
+            )
+            for i, token in zip(missing, tokens):
+                y[i] = token
         return np.array(y)
 
     def fit(
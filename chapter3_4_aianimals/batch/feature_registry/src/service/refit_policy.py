@@ -0,0 +1,76 @@
+from datetime import datetime, timedelta, timezone
+from typing import List, Optional, Union
+
+from sklearn.feature_extraction.text import TfidfVectorizer
+from src.middleware.logger import configure_logger
+from src.service.feature_processing import CategoricalVectorizer, DescriptionVectorizer, NameVectorizer
+
+logger = configure_logger(__name__)
+
+
+def get_tfidf_vectorizer(vectorizer: Union[DescriptionVectorizer, NameVectorizer]) -> TfidfVectorizer:
+    return vectorizer.pipeline.steps[-1][1]
+
+
+def measure_oov_rate(
+    vectorizer: Union[DescriptionVectorizer, NameVectorizer],
+    X: List[str],
+) -> float:
+    tfidf = get_tfidf_vectorizer(vectorizer=vectorizer)
+    analyzer = tfidf.build_analyzer()
+    vocabulary = tfidf.vocabulary_
+    total = 0
+    oov = 0
+    for x in X:
+        for token in analyzer(x):
+            total += 1
+            if token not in vocabulary:
+                oov += 1
+    if total == 0:
+        return 0.0
+    return oov / total
+
+
+def has_unknown_category(
+    vectorizer: CategoricalVectorizer,
+    x: List[int],
+) -> bool:
+    categories = set(vectorizer.pipeline.named_steps["one_hot_encoder"].categories_[0].tolist())
+    return any([v not in categories for v in x])
+
+
+class RefitPolicy(object):
+    def __init__(
+        self,
+        refit_interval_days: int = 7,
+        oov_drift_threshold: float = 0.1,
+        min_samples: int = 100,
+    ):
+        self.refit_interval_days = refit_interval_days
+        self.oov_drift_threshold = oov_drift_threshold
+        self.min_samples = min_samples
+
+    def check_schedule(
+        self,
+        fitted_at: datetime,
+        now: Optional[datetime] = None,
+    ) -> Optional[str]:
+        if now is None:
+            now = datetime.now(timezone.utc)
+        if now - fitted_at >= timedelta(days=self.refit_interval_days):
+            return f"vectorizers fitted at {fitted_at} are older than {self.refit_interval_days} days"
+        return None
+
+    def check_drift(
+        self,
+        name: str,
+        baseline_oov_rate: float,
+        oov_rate: float,
+        samples: int,
+    ) -> Optional[str]:
+        logger.info(f"{name} oov rate: {oov_rate} against baseline {baseline_oov_rate} in {samples} samples")
+        if samples < self.min_samples:
+            return None
+        if oov_rate - baseline_oov_rate > self.oov_drift_threshold:
+            return f"{name} oov rate {oov_rate:.3f} drifted from baseline {baseline_oov_rate:.3f}"
+        return None
@@ -0,0 +1,137 @@
+import hashlib
+from abc import ABC, abstractmethod
+from typing import Dict, List, Optional
+
+from src.infrastructure.cache import AbstractCache
+from src.middleware.logger import configure_logger
+
+logger = configure_logger(__name__)
+
+TOKENIZER_VERSION = "1"
+
+
+def make_stop_words_version(stop_words: List[str]) -> str:
+    value = "\n".join([TOKENIZER_VERSION, *sorted(set(stop_words))])
+    return hashlib.sha1(value.encode("utf-8")).hexdigest()[:12]
+
+
+def make_text_hash(text: str) -> str:
+    return hashlib.sha1(text.encode("utf-8")).hexdigest()
+
+
+class AbstractTokenCache(ABC):
+    def __init__(self):
+        pass
+
+    @abstractmethod
+    def get(
+        self,
+        kind: str,
+        stop_words: List[str],
+        texts: List[str],
+    ) -> List[Optional[str]]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def set(
+        self,
+        kind: str,
+        stop_words: List[str],
+        texts: List[str],
+        tokens: List[str],
+    ):
+        raise NotImplementedError
+
+
+class NoTokenCache(AbstractTokenCache):
+    def __init__(self):
+        super().__init__()
+
+    def get(
+        self,
+        kind: str,
+        stop_words: List[str],
+        texts: List[str],
+    ) -> List[Optional[str]]:
+        return [None for _ in texts]
+
+    def set(
+        self,
+        kind: str,
+        stop_words: List[str],
+        texts: List[str],
+        tokens: List[str],
+    ):
+        pass
+
+
+class TokenCache(AbstractTokenCache):
+    PREFIX = "token_cache"
+
+    def __init__(
+        self,
+        cache: AbstractCache,
+        expire_second: int = 60 * 60 * 24 * 30,
+        chunk_size: int = 1000,
+    ):
+        super().__init__()
+        self.cache = cache
+        self.expire_second = expire_second
+        self.chunk_size = chunk_size
+
+    def __make_name(
+        self,
+        kind: str,
+        stop_words: List[str],
+    ) -> str:
+        return f"{self.PREFIX}_{kind}_{make_stop_words_version(stop_words=stop_words)}"
+
+    def get(
+        self,
+        kind: str,
+        stop_words: List[str],
+        texts: List[str],
+    ) -> List[Optional[str]]:
+        name = self.__make_name(
+            kind=kind,
+            stop_words=stop_words,
+        )
+        keys = [make_text_hash(text=text) for text in texts]
+        values: List[Optional[str]] = []
+        try:
+            for i in range(0, len(keys), self.chunk_size):
+                values.extend(
+                    self.cache.hmget(
+                        name=name,
+                        keys=keys[i : i + self.chunk_size],
+                    )
+                )
+        except Exception as e:
+            logger.error(f"failed to get token cache {name}: {e}")
+            return [None for _ in texts]
+        hits = len([v for v in values if v is not None])
+        logger.info(f"token cache {name}: {hits} hits out of {len(texts)}")
+        return values
+
+    def set(
+        self,
+        kind: str,
+        stop_words: List[str],
+        texts: List[str],
+        tokens: List[str],
+    ):
+        name = self.__make_name(
+            kind=kind,
+            stop_words=stop_words,
+        )
+        mapping: Dict[str, str] = {make_text_hash(text=text): token for text, token in zip(texts, tokens)}
+        items = list(mapping.items())
+        try:
+            for i in range(0, len(items), self.chunk_size):
+                self.cache.hset(
+                    name=name,
+                    mapping=dict(items[i : i + self.chunk_size]),
+                    expire_second=self.expire_second,
+                )
+        except Exception as e:
+            logger.error(f"failed to set token cache {name}: {e}")
@@ -1,16 +1,25 @@
 import json
+import time
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from datetime import datetime, timezone
+from typing import List, Optional, Tuple
 
 import cloudpickle
+from scipy.sparse import csr_matrix, spmatrix
 from src.configurations import Configurations
-from src.entities.animal import AnimalQuery
+from src.entities.animal import AnimalModel, AnimalQuery
+from src.entities.animal_feature import AnimalFeatureState
 from src.infrastructure.cache import AbstractCache
 from src.infrastructure.client.rabbitmq_messaging import RabbitmqMessaging
+from src.middleware.feature_codec import FEATURE_ENCODING, encode_feature
 from src.middleware.logger import configure_logger
 from src.repository.animal_repository import AbstractAnimalRepository
-from src.request_object.animal_feature import AnimalFeatureInitializeRequest, AnimalFeatureRegistrationRequest
-from src.response_object.animal_feature import AnimalFeatureInitializeResponse
+from src.request_object.animal_feature import (
+    AnimalFeatureInitializeRequest,
+    AnimalFeatureRegistrationRequest,
+    AnimalFeatureUpdateRequest,
+)
+from src.response_object.animal_feature import AnimalFeatureInitializeResponse, AnimalFeatureUpdateResponse
 from src.service.feature_processing import (
     CategoricalVectorizer,
     DescriptionTokenizer,
@@ -18,6 +27,7 @@ from src.service.feature_processing import (
     NameTokenizer,
     NameVectorizer,
 )
+from src.service.refit_policy import RefitPolicy, has_unknown_category, measure_oov_rate
 
 logger = configure_logger(__name__)
 
@@ -36,6 +46,7 @@ class AbstractAnimalFeatureUsecase(ABC):
         name_tokenizer: NameTokenizer,
         description_vectorizer: DescriptionVectorizer,
         name_vectorizer: NameVectorizer,
+        refit_policy: RefitPolicy,
     ):
         self.animal_repository = animal_repository
         self.messaging = messaging
@@ -47,6 +58,7 @@ class AbstractAnimalFeatureUsecase(ABC):
         self.name_tokenizer = name_tokenizer
         self.description_vectorizer = description_vectorizer
         self.name_vectorizer = name_vectorizer
+        self.refit_policy = refit_policy
 
     @abstractmethod
     def fit_register_animal_feature(
@@ -55,6 +67,21 @@ class AbstractAnimalFeatureUsecase(ABC):
     ) -> Optional[AnimalFeatureInitializeResponse]:
         raise NotImplementedError
 
+    @abstractmethod
+    def update_animal_feature(
+        self,
+        request: AnimalFeatureUpdateRequest,
+    ) -> AnimalFeatureUpdateResponse:
+        raise NotImplementedError
+
+    @abstractmethod
+    def register_animal_features(
+        self,
+        animal_ids: List[str],
+        request: AnimalFeatureRegistrationRequest,
+    ) -> int:
+        raise NotImplementedError
+
     @abstractmethod
     def register_animal_feature(
         self,
@@ -62,6 +89,15 @@ class AbstractAnimalFeatureUsecase(ABC):
     ):
         raise NotImplementedError
 
+    @abstractmethod
+    def register_animal_features_from_queue(
+        self,
+        request: AnimalFeatureRegistrationRequest,
+        batch_size: int = 100,
+        linger_ms: int = 1000,
+    ):
+        raise NotImplementedError
+
 
 class AnimalFeatureUsecase(AbstractAnimalFeatureUsecase):
     def __init__(
@@ -75,6 +111,7 @@ class AnimalFeatureUsecase(AbstractAnimalFeatureUsecase):
         name_tokenizer: NameTokenizer,
         description_vectorizer: DescriptionVectorizer,
         name_vectorizer: NameVectorizer,
+        refit_policy: RefitPolicy,
     ):
         super().__init__(
             animal_repository=animal_repository,
@@ -86,6 +123,7 @@ class AnimalFeatureUsecase(AbstractAnimalFeatureUsecase):
             name_tokenizer=name_tokenizer,
             description_vectorizer=description_vectorizer,
             name_vectorizer=name_vectorizer,
+            refit_policy=refit_policy,
         )
 
     def make_cache_key(
@@ -96,24 +134,56 @@ class AnimalFeatureUsecase(AbstractAnimalFeatureUsecase):
     ) -> str:
         return f"{self.PREFIX}_{animal_id}_{mlflow_experiment_id}_{mlflow_run_id}"
 
+    def make_state_key(
+        self,
+        mlflow_experiment_id: int,
+        mlflow_run_id: str,
+    ) -> str:
+        return f"{self.PREFIX}_state_{mlflow_experiment_id}_{mlflow_run_id}"
+
+    def __load_state(
+        self,
+        mlflow_experiment_id: int,
+        mlflow_run_id: str,
+    ) -> Optional[AnimalFeatureState]:
+        value = self.cache.get(
+            key=self.make_state_key(
+                mlflow_experiment_id=mlflow_experiment_id,
+                mlflow_run_id=mlflow_run_id,
+            )
+        )
+        if value is None:
+            return None
+        return AnimalFeatureState(**json.loads(value))
+
+    def __save_state(
+        self,
+        mlflow_experiment_id: int,
+        mlflow_run_id: str,
+        state: AnimalFeatureState,
+    ):
+        logger.info(f"save feature state: {state}")
+        self.cache.set(
+            key=self.make_state_key(
+                mlflow_experiment_id=mlflow_experiment_id,
+                mlflow_run_id=mlflow_run_id,
+            ),
+            value=state.json(),
+            expire_second=Configurations.feature_cache_ttl,
+        )
+
     def fit_register_animal_feature(
         self,
         request: AnimalFeatureInitializeRequest,
     ) -> Optional[AnimalFeatureInitializeResponse]:
-        limit = 1000
-        offset = 0
         animals = []
-        while True:
-            _animals = self.animal_repository.select(
-                query=AnimalQuery(deactivated=False),
-                limit=limit,
-                offset=offset,
-            )
-            if len(_animals) == 0:
-                break
-            animals.extend(_animals)
-            offset += limit
-            logger.info(f"retrieved {len(animals)} data")
+        for animal in self.animal_repository.stream(
+            query=AnimalQuery(deactivated=False),
+            batch_size=1000,
+        ):
+            animals.append(animal)
+            if len(animals) % 1000 == 0:
+                logger.info(f"retrieved {len(animals)} data")
         logger.info(f"data size: {len(animals)}")
         if len(animals) == 0:
             logger.info("no data to fit and register")
@@ -122,20 +192,12 @@ class AnimalFeatureUsecase(AbstractAnimalFeatureUsecase):
         animal_ids = [a.id for a in animals]
 
         logger.info("vectorize animal_category")
-        vectorized_animal_category = (
-            self.animal_category_vectorizer.fit_transform(
-                x=[[a.animal_category_id] for a in animals],
-            )
-            .toarray()
-            .tolist()
+        vectorized_animal_category = self.animal_category_vectorizer.fit_transform(
+            x=[[a.animal_category_id] for a in animals],
         )
         logger.info("vectorize animal_subcategory")
-        vectorized_animal_subcategory = (
-            self.animal_subcategory_vectorizer.fit_transform(
-                x=[[a.animal_subcategory_id] for a in animals],
-            )
-            .toarray()
-            .tolist()
+        vectorized_animal_subcategory = self.animal_subcategory_vectorizer.fit_transform(
+            x=[[a.animal_subcategory_id] for a in animals],
         )
 
         logger.info("tokenize description")
@@ -148,20 +210,12 @@ class AnimalFeatureUsecase(AbstractAnimalFeatureUsecase):
         ).tolist()
 
         logger.info("vectorize description")
-        vectorized_description = (
-            self.description_vectorizer.fit_transform(
-                X=tokenized_description,
-            )
-            .toarray()
-            .tolist()
+        vectorized_description = self.description_vectorizer.fit_transform(
+            X=tokenized_description,
         )
         logger.info("vectorize name")
-        vectorized_name = (
-            self.name_vectorizer.fit_transform(
-                X=tokenized_name,
-            )
-            .toarray()
-            .tolist()
+        vectorized_name = self.name_vectorizer.fit_transform(
+            X=tokenized_name,
         )
 
         with open(Configurations.animal_category_vectorizer_file, "wb") as f:
@@ -183,7 +237,22 @@ class AnimalFeatureUsecase(AbstractAnimalFeatureUsecase):
             tokenized_names=tokenized_name,
             vectorized_descriptions=vectorized_description,
             vectorized_names=vectorized_name,
-            update=True,
+        )
+        self.__save_state(
+            mlflow_experiment_id=request.mlflow_experiment_id,
+            mlflow_run_id=request.mlflow_run_id,
+            state=AnimalFeatureState(
+                fitted_at=datetime.now(timezone.utc),
+                watermark=max([a.updated_at for a in animals]),
+                description_oov_rate=measure_oov_rate(
+                    vectorizer=self.description_vectorizer,
+                    X=tokenized_description,
+                ),
+                name_oov_rate=measure_oov_rate(
+                    vectorizer=self.name_vectorizer,
+                    X=tokenized_name,
+                ),
+            ),
         )
         return AnimalFeatureInitializeResponse(
             animal_category_vectorizer_file=Configurations.animal_category_vectorizer_file,
@@ -193,39 +262,116 @@ class AnimalFeatureUsecase(AbstractAnimalFeatureUsecase):
             animal_ids=animal_ids,
         )
 
-    def register_animal_feature(
+    def register_animal_features(
         self,
+        animal_ids: List[str],
         request: AnimalFeatureRegistrationRequest,
+    ) -> int:
+        animals: List[AnimalModel] = self.animal_repository.select(
+            query=AnimalQuery(
+                ids=animal_ids,
+                deactivated=False,
+            ),
+            limit=len(animal_ids),
+            offset=0,
+        )
+        if len(animals) == 0:
+            return 0
+
+        self.__transform_register_animal_features(
+            animals=animals,
+            mlflow_experiment_id=request.mlflow_experiment_id,
+            mlflow_run_id=request.mlflow_run_id,
+        )
+        return len(animals)
+
+    def __transform_register_animal_features(
+        self,
+        animals: List[AnimalModel],
+        mlflow_experiment_id: int,
+        mlflow_run_id: str,
+        tokenized_description: Optional[List[str]] = None,
+        tokenized_name: Optional[List[str]] = None,
     ):
-        def callback(ch, method, properties, body):
-            data = json.loads(body)
-            logger.info(f"consumed data: {data}")
-            animals = self.animal_repository.select(
+        vectorized_animal_category = self.animal_category_vectorizer.transform(
+            x=[[a.animal_category_id] for a in animals],
+        )
+        vectorized_animal_subcategory = self.animal_subcategory_vectorizer.transform(
+            x=[[a.animal_subcategory_id] for a in animals],
+        )
+
+        if tokenized_description is None:
+            tokenized_description = self.description_tokenizer.transform(
+                X=[a.description for a in animals],
+            ).tolist()
+        if tokenized_name is None:
+            tokenized_name = self.name_tokenizer.transform(
+                X=[a.name for a in animals],
+            ).tolist()
+
+        vectorized_description = self.description_vectorizer.transform(X=tokenized_description)
+        vectorized_name = self.name_vectorizer.transform(X=tokenized_name)
+
+        self.__register_animal_features(
+            animal_ids=[a.id for a in animals],
+            mlflow_experiment_id=mlflow_experiment_id,
+            mlflow_run_id=mlflow_run_id,
+            vectorized_animal_categories=vectorized_animal_category,
+            vectorized_animal_subcategories=vectorized_animal_subcategory,
+            tokenized_descriptions=tokenized_description,
+            tokenized_names=tokenized_name,
+            vectorized_descriptions=vectorized_description,
+            vectorized_names=vectorized_name,
+        )
+
+    def __require_refit(
+        self,
+        reason: str,
+    ) -> AnimalFeatureUpdateResponse:
+        logger.info(f"refit required: {reason}")
+        return AnimalFeatureUpdateResponse(
+            refit_required=True,
+            reason=reason,
+            animal_ids=[],
+            watermark=None,
+        )
+
+    def update_animal_feature(
+        self,
+        request: AnimalFeatureUpdateRequest,
+    ) -> AnimalFeatureUpdateResponse:
+        state = self.__load_state(
+            mlflow_experiment_id=request.mlflow_experiment_id,
+            mlflow_run_id=request.mlflow_run_id,
+        )
+        if state is None:
+            return self.__require_refit(
+                reason=f"no feature state for {request.mlflow_experiment_id} {request.mlflow_run_id}",
+            )
+        reason = self.refit_policy.check_schedule(fitted_at=state.fitted_at)
+        if reason is not None:
+            return self.__require_refit(reason=reason)
+
+        animals = list(
+            self.animal_repository.stream(
                 query=AnimalQuery(
-                    id=id,
                     deactivated=False,
+                    updated_from=state.watermark,
                 ),
-                limit=1,
-                offset=0,
+                batch_size=1000,
             )
-            if len(animals) == 0:
-                return
-            animal_ids = [a.id for a in animals]
+        )
+        logger.info(f"{len(animals)} animals created or updated since {state.watermark}")
 
-            vectorized_animal_category = (
-                self.animal_category_vectorizer.transform(
-                    x=[[a.animal_category_id] for a in animals],
-                )
-                .toarray()
-                .tolist()
-            )
-            vectorized_animal_subcategory = (
-                self.animal_subcategory_vectorizer.transform(
-                    x=[[a.animal_subcategory_id] for a in animals],
-                )
-                .toarray()
-                .tolist()
-            )
+        if len(animals) > 0:
+            if has_unknown_category(
+                vectorizer=self.animal_category_vectorizer,
+                x=[a.animal_category_id for a in animals],
+            ) or has_unknown_category(
+                vectorizer=self.animal_subcategory_vectorizer,
+                x=[a.animal_subcategory_id for a in animals],
+            ):
+                return self.__require_refit(reason="found animal category unknown to the fitted vectorizers")
 
             tokenized_description = self.description_tokenizer.transform(
                 X=[a.description for a in animals],
@@ -233,21 +379,69 @@ class AnimalFeatureUsecase(AbstractAnimalFeatureUsecase):
             tokenized_name = self.name_tokenizer.transform(
                 X=[a.name for a in animals],
             ).tolist()
+            for name, vectorizer, tokenized, baseline_oov_rate in (
+                ("description", self.description_vectorizer, tokenized_description, state.description_oov_rate),
+                ("name", self.name_vectorizer, tokenized_name, state.name_oov_rate),
+            ):
+                reason = self.refit_policy.check_drift(
+                    name=name,
+                    baseline_oov_rate=baseline_oov_rate,
+                    oov_rate=measure_oov_rate(
+                        vectorizer=vectorizer,
+                        X=tokenized,
+                    ),
+                    samples=len(animals),
+                )
+                if reason is not None:
+                    return self.__require_refit(reason=reason)
 
-            vectorized_description = self.description_vectorizer.transform(X=tokenized_description).toarray().tolist()
-            vectorized_name = self.name_vectorizer.transform(X=tokenized_name).toarray().tolist()
+            self.__transform_register_animal_features(
+                animals=animals,
+                mlflow_experiment_id=request.mlflow_experiment_id,
+                mlflow_run_id=request.mlflow_run_id,
+                tokenized_description=tokenized_description,
+                tokenized_name=tokenized_name,
+            )
+            state.watermark = max([a.updated_at for a in animals])
 
-            self.__register_animal_features(
-                animal_ids=animal_ids,
+        active_ids = self.animal_repository.select_ids(query=AnimalQuery(deactivated=False))
+        keys = [
+            self.make_cache_key(
+                animal_id=animal_id,
                 mlflow_experiment_id=request.mlflow_experiment_id,
                 mlflow_run_id=request.mlflow_run_id,
-                vectorized_animal_categories=vectorized_animal_category,
-                vectorized_animal_subcategories=vectorized_animal_subcategory,
-                tokenized_descriptions=tokenized_description,
-                tokenized_names=tokenized_name,
-                vectorized_descriptions=vectorized_description,
-                vectorized_names=vectorized_name,
-                update=False,
+            )
+            for animal_id in active_ids
+        ]
+        for i in range(0, len(keys), 1000):
+            self.cache.expire_many(
+                keys=keys[i : i + 1000],
+                expire_second=Configurations.feature_cache_ttl,
+            )
+        logger.info(f"extended expiry of {len(keys)} animal features")
+
+        self.__save_state(
+            mlflow_experiment_id=request.mlflow_experiment_id,
+            mlflow_run_id=request.mlflow_run_id,
+            state=state,
+        )
+        return AnimalFeatureUpdateResponse(
+            refit_required=False,
+            reason=None,
+            animal_ids=[a.id for a in animals],
+            watermark=state.watermark,
+        )
+
+    def register_animal_feature(
+        self,
+        request: AnimalFeatureRegistrationRequest,
+    ):
+        def callback(ch, method, properties, body):
+            data = json.loads(body)
+            logger.info(f"consumed data: {data}")
+            self.register_animal_features(
+                animal_ids=[data["id"]],
+                request=request,
             )
             ch.basic_ack(delivery_tag=method.delivery_tag)
 
@@ -258,56 +452,155 @@ class AnimalFeatureUsecase(AbstractAnimalFeatureUsecase):
         logger.info(f"Waiting for {Configurations.animal_feature_registry_queue} queue...")
         self.messaging.channel.start_consuming()
 
+    def __flush_animal_features(
+        self,
+        messages: List[Tuple[int, str, bool]],
+        request: AnimalFeatureRegistrationRequest,
+    ):
+        start = time.perf_counter()
+        animal_ids = list(dict.fromkeys([animal_id for _, animal_id, _ in messages]))
+        try:
+            registered = self.register_animal_features(
+                animal_ids=animal_ids,
+                request=request,
+            )
+        except Exception as e:
+            logger.error(f"failed to register animal features in batch; retrying one by one: {e}")
+            registered = self.__retry_animal_features(
+                messages=messages,
+                request=request,
+            )
+        else:
+            self.messaging.channel.basic_ack(
+                delivery_tag=messages[-1][0],
+                multiple=True,
+            )
+        elapsed = time.perf_counter() - start
+        logger.info(
+            f"registered {registered} animal features from {len(messages)} messages in {elapsed:.3f}s; "
+            f"{len(messages) / max(elapsed, 1e-6):.1f} messages/s"
+        )
+
+    def __retry_animal_features(
+        self,
+        messages: List[Tuple[int, str, bool]],
+        request: AnimalFeatureRegistrationRequest,
+    ) -> int:
+        registered = 0
+        for delivery_tag, animal_id, redelivered in messages:
+            try:
+                registered += self.register_animal_features(
+                    animal_ids=[animal_id],
+                    request=request,
+                )
+            except Exception as e:
+                if redelivered:
+                    logger.error(f"failed to register redelivered animal feature {animal_id}; drop {delivery_tag}: {e}")
+                else:
+                    logger.error(f"failed to register animal feature {animal_id}; requeue {delivery_tag}: {e}")
+                self.messaging.channel.basic_reject(
+                    delivery_tag=delivery_tag,
+                    requeue=not redelivered,
+                )
+                continue
+            self.messaging.channel.basic_ack(delivery_tag=delivery_tag)
+        return registered
+
+    def register_animal_features_from_queue(
+        self,
+        request: AnimalFeatureRegistrationRequest,
+        batch_size: int = 100,
+        linger_ms: int = 1000,
+    ):
+        linger_second = linger_ms / 1000
+        messages: List[Tuple[int, str, bool]] = []
+        deadline = 0.0
+        logger.info(f"Waiting for {Configurations.animal_feature_registry_queue} queue in batch of {batch_size}...")
+        for method, _, body in self.messaging.channel.consume(
+            queue=Configurations.animal_feature_registry_queue,
+            inactivity_timeout=linger_second,
+        ):
+            if method is not None:
+                try:
+                    animal_id = json.loads(body)["id"]
+                except (ValueError, TypeError, KeyError) as e:
+                    logger.error(f"malformed message; drop {method.delivery_tag}: {body!r} {e}")
+                    self.messaging.channel.basic_reject(
+                        delivery_tag=method.delivery_tag,
+                        requeue=False,
+                    )
+                    continue
+                if len(messages) == 0:
+                    deadline = time.monotonic() + linger_second
+                messages.append((method.delivery_tag, animal_id, method.redelivered))
+            if len(messages) > 0 and (len(messages) >= batch_size or time.monotonic() >= deadline):
+                self.__flush_animal_features(
+                    messages=messages,
+                    request=request,
+                )
+                messages = []
+
     def __register_animal_features(
         self,
         animal_ids: List[str],
         mlflow_experiment_id: int,
         mlflow_run_id: str,
-        vectorized_animal_categories: List[List[int]],
-        vectorized_animal_subcategories: List[List[int]],
+        vectorized_animal_categories: spmatrix,
+        vectorized_animal_subcategories: spmatrix,
         tokenized_descriptions: List[str],
         tokenized_names: List[str],
-        vectorized_descriptions: List[List[float]],
-        vectorized_names: List[List[float]],
-        update: bool = True,
+        vectorized_descriptions: spmatrix,
+        vectorized_names: spmatrix,
+        chunk_size: int = 1000,
     ):
-        for i, (
-            animal_id,
-            animal_category_vector,
-            animal_subcategory_vector,
-            description_words,
-            name_words,
-            description_vector,
-            name_vector,
-        ) in enumerate(
+        vectorized_animal_categories = csr_matrix(vectorized_animal_categories)
+        vectorized_animal_subcategories = csr_matrix(vectorized_animal_subcategories)
+        vectorized_descriptions = csr_matrix(vectorized_descriptions)
+        vectorized_names = csr_matrix(vectorized_names)
+        binary = Configurations.feature_cache_encoding == FEATURE_ENCODING.BINARY.value
+        registered = 0
+        mapping = {}
+        for i, (animal_id, description_words, name_words) in enumerate(
             zip(
                 animal_ids,
-                vectorized_animal_categories,
-                vectorized_animal_subcategories,
                 tokenized_descriptions,
                 tokenized_names,
-                vectorized_descriptions,
-                vectorized_names,
             )
         ):
-            if update:
-                key = self.make_cache_key(
-                    animal_id=animal_id,
-                    mlflow_experiment_id=mlflow_experiment_id,
-                    mlflow_run_id=mlflow_run_id,
-                )
-                data = dict(
-                    animal_category_vector=animal_category_vector,
-                    animal_subcategory_vector=animal_subcategory_vector,
-                    name_words=name_words.split(" "),
-                    description_words=description_words.split(" "),
-                    name_vector=name_vector,
-                    description_vector=description_vector,
-                )
-                self.cache.set(
-                    key=key,
-                    value=json.dumps(data),
+            key = self.make_cache_key(
+                animal_id=animal_id,
+                mlflow_experiment_id=mlflow_experiment_id,
+                mlflow_run_id=mlflow_run_id,
+            )
+            vectors = dict(
+                animal_category_vector=vectorized_animal_categories[i],
+                animal_subcategory_vector=vectorized_animal_subcategories[i],
+                name_vector=vectorized_names[i],
+                description_vector=vectorized_descriptions[i],
+            )
+            if not binary:
+                vectors = {name: vector.toarray().ravel().tolist() for name, vector in vectors.items()}
+            data = dict(
+                name_words=name_words.split(" "),
+                description_words=description_words.split(" "),
+                **vectors,
+            )
+            if binary:
+                mapping[key] = encode_feature(feature=data)
+            else:
+                mapping[key] = json.dumps(data)
+            if len(mapping) >= chunk_size:
+                self.cache.mset(
+                    mapping=mapping,
                     expire_second=Configurations.feature_cache_ttl,
                 )
-            if i % 1000 == 0:
-                logger.info(f"registered: {i} animal features")
+                registered += len(mapping)
+                mapping = {}
+                logger.info(f"registered: {registered} animal features")
+        if len(mapping) > 0:
+            self.cache.mset(
+                mapping=mapping,
+                expire_second=Configurations.feature_cache_ttl,
+            )
+            registered += len(mapping)
+        logger.info(f"registered: {registered} animal features")
@@ -4,7 +4,7 @@ from dependency_injector.containers import DeclarativeContainer
 from dependency_injector.providers import Configuration, Container, DependenciesContainer, Factory, Resource, Singleton
 from src.configurations import Configurations
 from src.infrastructure.cache import AbstractCache, RedisCache
-from src.infrastructure.database import AbstractDBClient, PostgresDBClient
+from src.infrastructure.database import AbstractDBClient, PooledPostgresDBClient
 from src.job.similar_word_registration_job import AbstractSimilarWordRegistrationJob, SimilarWordRegistrationJob
 from src.repository.access_log_repository import AbstractAccessLogRepository, AccessLogRepository
 from src.service.similar_word_predictor import AbstractSimilarWordPredictor, SimilarWordPredictor
@@ -22,7 +22,7 @@ class Core(DeclarativeContainer):
 class Infrastructures(DeclarativeContainer):
     config = Configuration()
 
-    db_client: AbstractDBClient = Singleton(PostgresDBClient)
+    db_client: AbstractDBClient = Singleton(PooledPostgresDBClient)
     cache_client: AbstractCache = Singleton(RedisCache)
 
 
@@ -1,6 +1,6 @@
 import logging
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Iterator, List
 
 from src.entities.access_log import AccessLog
 from src.infrastructure.database import AbstractDBClient
@@ -20,6 +20,13 @@ class AbstractAccessLogRepository(ABC):
     ) -> List[AccessLog]:
         raise NotImplementedError
 
+    @abstractmethod
+    def stream(
+        self,
+        itersize: int = 1000,
+    ) -> Iterator[AccessLog]:
+        raise NotImplementedError
+
 
 class AccessLogRepository(BaseRepository, AbstractAccessLogRepository):
     def __init__(
@@ -51,3 +58,21 @@ class AccessLogRepository(BaseRepository, AbstractAccessLogRepository):
         )
         data = [AccessLog(**r) for r in result]
         return data
+
+    def stream(
+        self,
+        itersize: int = 1000,
+    ) -> Iterator[AccessLog]:
+        query = f"""
+        SELECT
+            {self.table_name}.phrases
+        FROM
+            {self.table_name}
+        ;
+        """
+        for r in self.execute_select_query_stream(
+            query=query,
+            parameters=None,
+            itersize=itersize,
+        ):
+            yield AccessLog(**r)
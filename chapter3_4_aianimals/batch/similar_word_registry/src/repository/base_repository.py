@@ -1,5 +1,6 @@
 import logging
-from typing import Any, Dict, List, Optional, Tuple
+import uuid
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from psycopg2.extras import DictCursor
 from src.infrastructure.database import AbstractDBClient
@@ -24,3 +25,17 @@ class BaseRepository(object):
                 cursor.execute(query, parameters)
                 rows = cursor.fetchall()
         return rows
+
+    def execute_select_query_stream(
+        self,
+        query: str,
+        parameters: Optional[Tuple] = None,
+        itersize: int = 1000,
+    ) -> Iterator[Dict[str, Any]]:
+        self.logger.info(f"stream select query: {query}, parameters: {parameters}")
+        with self.db_client.get_connection() as conn:
+            with conn.cursor(name=f"stream_{uuid.uuid4().hex}", cursor_factory=DictCursor) as cursor:
+                cursor.itersize = itersize
+                cursor.execute(query, parameters)
+                for row in cursor:
+                    yield row
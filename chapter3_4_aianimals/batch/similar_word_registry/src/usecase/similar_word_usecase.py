@@ -62,22 +62,12 @@ class SimilarWordUsecase(AbstractSimilarWordUsecase):
     ):
         self.logger.info("start")
         data: Dict[str, int] = {}
-        limit = 200
-        offset = 0
-        while True:
-            access_logs = self.access_log_repository.select(
-                limit=limit,
-                offset=offset,
-            )
-            if len(access_logs) == 0:
-                break
-            for access_log in access_logs:
-                for a in access_log.phrases:
-                    if a in data.keys():
-                        data[a] += 1
-                    else:
-                        data[a] = 1
-            offset += limit
+        for access_log in self.access_log_repository.stream():
+            for a in access_log.phrases:
+                if a in data.keys():
+                    data[a] += 1
+                else:
+                    data[a] = 1
         sorted_data = sorted(
             data.items(),
             key=lambda item: item[1],
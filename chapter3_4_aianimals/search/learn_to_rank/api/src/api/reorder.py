@@ -1,6 +1,7 @@
 from logging import getLogger
 
 from fastapi import APIRouter, BackgroundTasks
+from fastapi.concurrency import run_in_threadpool
 from src.registry.container import EmptyContainer
 from src.registry.registry import container
 from src.schema.animal import AnimalRequest, AnimalRequestResponse, AnimalResponse
@@ -23,7 +24,8 @@ async def post_reorder(
     if isinstance(container, EmptyContainer):
         return AnimalResponse(ids=request.ids)
     else:
-        data = container.reorder_usecase.reorder(
+        data = await run_in_threadpool(
+            container.reorder_usecase.reorder,
             request=request,
             background_tasks=background_tasks,
         )
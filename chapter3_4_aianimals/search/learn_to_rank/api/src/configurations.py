@@ -27,9 +27,19 @@ class Configurations(object):
     feature_mlflow_experiment_id = int(os.getenv("FEATURE_MLFLOW_EXPERIMENT_ID", _feature_mlflow_experiment_id))
     feature_mlflow_run_id = str(os.getenv("FEATURE_MLFLOW_RUN_ID", _feature_mlflow_run_id))
 
+    feature_cache_chunk_size = int(os.getenv("FEATURE_CACHE_CHUNK_SIZE", 500))
+
     is_onnx_predictor = bool(int(os.getenv("IS_ONNX_PREDICTOR", "0")))
-    predictor_batch_size = int(os.getenv("PREDICTOR_BATCH_SIZE", 32))
     predictor_input_name = os.getenv("PREDICTOR_INPUT_NAME", "inputs")
     predictor_output_name = os.getenv("PREDICTOR_OUTPUT_NAME", "outputs")
+    onnx_intra_op_num_threads = int(os.getenv("ONNX_INTRA_OP_NUM_THREADS", 0))
+    onnx_inter_op_num_threads = int(os.getenv("ONNX_INTER_OP_NUM_THREADS", 0))
+    onnx_graph_optimization_level = os.getenv("ONNX_GRAPH_OPTIMIZATION_LEVEL", "all")
+
+    like_count_table_enabled = bool(int(os.getenv("LIKE_COUNT_TABLE_ENABLED", "0")))
+
+    micro_batch_enabled = bool(int(os.getenv("MICRO_BATCH_ENABLED", "0")))
+    micro_batch_max_rows = int(os.getenv("MICRO_BATCH_MAX_ROWS", 1000))
+    micro_batch_max_wait_ms = float(os.getenv("MICRO_BATCH_MAX_WAIT_MS", 5))
 
     empty_run = bool(int(os.getenv("EMPTY_RUN", "0")))
@@ -1,7 +1,7 @@
 import os
 from abc import ABC, abstractmethod
 from logging import getLogger
-from typing import Optional
+from typing import List, Optional, Union
 
 import redis
 
@@ -28,6 +28,22 @@ class AbstractCacheClient(ABC):
     ) -> Optional[str]:
         raise NotImplementedError
 
+    @abstractmethod
+    def mget(
+        self,
+        keys: List[str],
+        chunk_size: int = 500,
+    ) -> List[Optional[str]]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def mget_bytes(
+        self,
+        keys: List[str],
+        chunk_size: int = 500,
+    ) -> List[Optional[bytes]]:
+        raise NotImplementedError
+
 
 class RedisClient(AbstractCacheClient):
     def __init__(self):
@@ -42,6 +58,12 @@ class RedisClient(AbstractCacheClient):
             db=self.__redis_db,
             decode_responses=True,
         )
+        self.redis_bytes_client = redis.Redis(
+            host=self.__redis_host,
+            port=self.__redis_port,
+            db=self.__redis_db,
+            decode_responses=False,
+        )
 
     def set(
         self,
@@ -61,3 +83,43 @@ class RedisClient(AbstractCacheClient):
     ) -> Optional[str]:
         value = self.redis_client.get(key)
         return value
+
+    def __mget(
+        self,
+        client: redis.Redis,
+        keys: List[str],
+        chunk_size: int = 500,
+    ) -> List[Optional[Union[str, bytes]]]:
+        values: List[Optional[Union[str, bytes]]] = []
+        if len(keys) == 0:
+            return values
+        if len(keys) <= chunk_size:
+            return client.mget(keys)
+        with client.pipeline(transaction=False) as pipe:
+            for i in range(0, len(keys), chunk_size):
+                pipe.mget(keys[i : i + chunk_size])
+            for chunk in pipe.execute():
+                values.extend(chunk)
+        return values
+
+    def mget(
+        self,
+        keys: List[str],
+        chunk_size: int = 500,
+    ) -> List[Optional[str]]:
+        return self.__mget(
+            client=self.redis_client,
+            keys=keys,
+            chunk_size=chunk_size,
+        )
+
+    def mget_bytes(
+        self,
+        keys: List[str],
+        chunk_size: int = 500,
+    ) -> List[Optional[bytes]]:
+        return self.__mget(
+            client=self.redis_bytes_client,
+            keys=keys,
+            chunk_size=chunk_size,
+        )
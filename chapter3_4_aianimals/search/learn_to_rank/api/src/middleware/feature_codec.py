@@ -0,0 +1,160 @@
+import json
+import struct
+from enum import Enum
+from typing import Dict, List, Optional, Tuple, Union
+
+import numpy as np
+from scipy.sparse import csr_matrix, issparse, spmatrix
+
+MAGIC = b"AFV"
+VERSION = 1
+HEADER = struct.Struct("<3sB")
+SECTION = struct.Struct("<BxxxII")
+FLOAT_DTYPE = np.dtype("<f4")
+INDEX_DTYPE = np.dtype("<u4")
+
+
+class LAYOUT(Enum):
+    DENSE = 0
+    SPARSE = 1
+    TEXT = 2
+
+
+class FEATURE_ENCODING(Enum):
+    JSON = "json"
+    BINARY = "binary"
+
+    @staticmethod
+    def has_value(value: str) -> bool:
+        return value in [v.value for v in FEATURE_ENCODING.__members__.values()]
+
+    @staticmethod
+    def get_list() -> List[str]:
+        return [v.value for v in FEATURE_ENCODING.__members__.values()]
+
+
+FEATURE_SCHEMA: Dict[int, List[Tuple[str, LAYOUT]]] = {
+    1: [
+        ("animal_category_vector", LAYOUT.DENSE),
+        ("animal_subcategory_vector", LAYOUT.DENSE),
+        ("name_vector", LAYOUT.DENSE),
+        ("description_vector", LAYOUT.DENSE),
+        ("name_words", LAYOUT.TEXT),
+        ("description_words", LAYOUT.TEXT),
+    ],
+}
+
+
+def _pad(length: int) -> bytes:
+    return b"\x00" * (-length % 4)
+
+
+def _encode_sparse_vector(vector: spmatrix) -> bytes:
+    row = csr_matrix(vector, dtype=FLOAT_DTYPE, copy=True)
+    if row.shape[0] != 1:
+        raise ValueError(f"sparse vector must be a single row: {row.shape}")
+    row.eliminate_zeros()
+    row.sort_indices()
+    return b"".join(
+        [
+            SECTION.pack(LAYOUT.SPARSE.value, row.shape[1], row.nnz),
+            row.indices.astype(INDEX_DTYPE).tobytes(),
+            row.data.astype(FLOAT_DTYPE).tobytes(),
+        ]
+    )
+
+
+def _encode_vector(vector: Union[List[float], np.ndarray, spmatrix]) -> bytes:
+    if issparse(vector):
+        if vector.nnz * 2 < vector.shape[1]:
+            return _encode_sparse_vector(vector=vector)
+        vector = vector.toarray()
+    array = np.asarray(vector, dtype=FLOAT_DTYPE).ravel()
+    nonzero = np.flatnonzero(array)
+    if len(nonzero) * 2 < len(array):
+        return b"".join(
+            [
+                SECTION.pack(LAYOUT.SPARSE.value, len(array), len(nonzero)),
+                nonzero.astype(INDEX_DTYPE).tobytes(),
+                array[nonzero].tobytes(),
+            ]
+        )
+    return SECTION.pack(LAYOUT.DENSE.value, len(array), len(array)) + array.tobytes()
+
+
+def _encode_text(words: List[str]) -> bytes:
+    text = " ".join(words).encode("utf-8")
+    return SECTION.pack(LAYOUT.TEXT.value, len(text), len(text)) + text + _pad(len(text))
+
+
+def encode_feature(feature: Dict[str, Union[List[float], List[str], np.ndarray, spmatrix]]) -> bytes:
+    sections = [HEADER.pack(MAGIC, VERSION)]
+    for name, layout in FEATURE_SCHEMA[VERSION]:
+        if layout == LAYOUT.TEXT:
+            sections.append(_encode_text(words=feature.get(name, [])))
+        else:
+            sections.append(_encode_vector(vector=feature[name]))
+    return b"".join(sections)
+
+
+def is_binary_feature(value: Union[str, bytes]) -> bool:
+    return isinstance(value, bytes) and value[: len(MAGIC)] == MAGIC
+
+
+def _to_csr(vector: np.ndarray) -> csr_matrix:
+    return csr_matrix(vector.reshape(1, -1), dtype=FLOAT_DTYPE)
+
+
+def decode_feature(
+    value: Union[str, bytes],
+    as_sparse: bool = False,
+) -> Dict[str, Union[np.ndarray, csr_matrix, List[str]]]:
+    if not is_binary_feature(value=value):
+        feature = json.loads(value)
+        decoded: Dict[str, Union[np.ndarray, csr_matrix, List[str]]] = {}
+        for name, layout in FEATURE_SCHEMA[VERSION]:
+            if name not in feature:
+                continue
+            if layout == LAYOUT.TEXT:
+                decoded[name] = feature[name]
+                continue
+            vector = np.asarray(feature[name], dtype=FLOAT_DTYPE)
+            decoded[name] = _to_csr(vector=vector) if as_sparse else vector
+        return decoded
+
+    buffer = memoryview(value)
+    _, version = HEADER.unpack_from(buffer, 0)
+    schema: Optional[List[Tuple[str, LAYOUT]]] = FEATURE_SCHEMA.get(version)
+    if schema is None:
+        raise ValueError(f"unsupported feature version: {version}")
+
+    feature: Dict[str, Union[np.ndarray, csr_matrix, List[str]]] = {}
+    offset = HEADER.size
+    for name, _ in schema:
+        layout, dimension, count = SECTION.unpack_from(buffer, offset)
+        offset += SECTION.size
+        if layout == LAYOUT.DENSE.value:
+            vector = np.frombuffer(buffer, dtype=FLOAT_DTYPE, count=count, offset=offset)
+            feature[name] = _to_csr(vector=vector) if as_sparse else vector
+            offset += count * FLOAT_DTYPE.itemsize
+        elif layout == LAYOUT.SPARSE.value:
+            indices = np.frombuffer(buffer, dtype=INDEX_DTYPE, count=count, offset=offset)
+            offset += count * INDEX_DTYPE.itemsize
+            values = np.frombuffer(buffer, dtype=FLOAT_DTYPE, count=count, offset=offset)
+            offset += count * FLOAT_DTYPE.itemsize
+            if as_sparse:
+                feature[name] = csr_matrix(
+                    (values.copy(), indices.astype(np.int32), np.array([0, count], dtype=np.int32)),
+                    shape=(1, dimension),
+                )
+            else:
+                vector = np.zeros(dimension, dtype=FLOAT_DTYPE)
+                vector[indices] = values
+                feature[name] = vector
+        elif layout == LAYOUT.TEXT.value:
+            text = bytes(buffer[offset : offset + count]).decode("utf-8")
+            feature[name] = text.split(" ") if len(text) > 0 else []
+            offset += count + len(_pad(count))
+        else:
+            raise ValueError(f"unsupported feature layout: {layout}")
+    return feature
@@ -4,10 +4,10 @@ from logging import getLogger
 import cloudpickle
 import mlflow
 from mlflow.tracking import MlflowClient
-from onnxruntime import InferenceSession
+from onnxruntime import GraphOptimizationLevel, InferenceSession, SessionOptions
 from src.configurations import Configurations
 from src.infrastructure.cache_client import RedisClient
-from src.infrastructure.db_client import DBClient
+from src.infrastructure.db_client import PooledDBClient
 from src.registry.container import Container, EmptyContainer
 from src.service.learn_to_rank_service import AbstractLearnToRankService, LearnToRankService
 
@@ -33,6 +33,22 @@ def load_cloud_pickle(file_path: str):
     return p
 
 
+GRAPH_OPTIMIZATION_LEVELS = {
+    "disable": GraphOptimizationLevel.ORT_DISABLE_ALL,
+    "basic": GraphOptimizationLevel.ORT_ENABLE_BASIC,
+    "extended": GraphOptimizationLevel.ORT_ENABLE_EXTENDED,
+    "all": GraphOptimizationLevel.ORT_ENABLE_ALL,
+}
+
+
+def make_session_options() -> SessionOptions:
+    session_options = SessionOptions()
+    session_options.intra_op_num_threads = Configurations.onnx_intra_op_num_threads
+    session_options.inter_op_num_threads = Configurations.onnx_inter_op_num_threads
+    session_options.graph_optimization_level = GRAPH_OPTIMIZATION_LEVELS[Configurations.onnx_graph_optimization_level]
+    return session_options
+
+
 def build_container() -> Container:
     logger.info("build container...")
 
@@ -70,7 +86,10 @@ def build_container() -> Container:
     if predictor_file_path.endswith(".pkl") or predictor_file_path.endswith(".pickle"):
         predictor = load_cloud_pickle(file_path=predictor_file_path)
     elif predictor_file_path.endswith(".onnx"):
-        predictor = InferenceSession(predictor_file_path)
+        predictor = InferenceSession(
+            predictor_file_path,
+            sess_options=make_session_options(),
+        )
     else:
         raise ValueError
 
@@ -86,13 +105,15 @@ def build_container() -> Container:
         preprocess_query_phrase_encoder=query_phrase_encoder,
         predictor=predictor,
         is_onnx_predictor=Configurations.is_onnx_predictor,
-        predictor_batch_size=Configurations.predictor_batch_size,
         predictor_input_name=Configurations.predictor_input_name,
         predictor_output_name=Configurations.predictor_output_name,
+        micro_batch_enabled=Configurations.micro_batch_enabled,
+        micro_batch_max_rows=Configurations.micro_batch_max_rows,
+        micro_batch_max_wait_ms=Configurations.micro_batch_max_wait_ms,
     )
 
     return Container(
-        db_client=DBClient(),
+        db_client=PooledDBClient(),
         cache_client=RedisClient(),
         learn_to_rank_service=learn_to_rank_service,
     )
@@ -11,6 +11,7 @@ logger = getLogger(__name__)
 class TABLES(Enum):
     ANIMAL = "animals"
     LIKE = "likes"
+    ANIMAL_LIKE_COUNT = "animal_like_counts"
 
     @staticmethod
     def has_value(value: str) -> bool:
@@ -1,9 +1,11 @@
-import json
 from abc import ABC, abstractmethod
 from logging import getLogger
 from typing import Dict, List
 
+import numpy as np
+from src.configurations import Configurations
 from src.infrastructure.cache_client import AbstractCacheClient
+from src.middleware.feature_codec import decode_feature
 
 logger = getLogger(__name__)
 
@@ -19,7 +21,7 @@ class AbstractFeatureCacheRepository(ABC):
     def get_features_by_keys(
         self,
         keys: List[str],
-    ) -> Dict[str, Dict[str, List[float]]]:
+    ) -> Dict[str, Dict[str, np.ndarray]]:
         raise NotImplementedError
 
 
@@ -33,10 +35,14 @@ class FeatureCacheRepository(AbstractFeatureCacheRepository):
     def get_features_by_keys(
         self,
         keys: List[str],
-    ) -> Dict[str, Dict[str, List[float]]]:
+    ) -> Dict[str, Dict[str, np.ndarray]]:
         features = {}
-        for key in keys:
-            feature = self.cache.get(key=key)
+        values = self.cache.mget_bytes(
+            keys=keys,
+            chunk_size=Configurations.feature_cache_chunk_size,
+        )
+        for key, feature in zip(keys, values):
             if feature is not None:
-                features[key] = json.loads(str(feature))
+                features[key] = decode_feature(value=feature)
+        logger.debug(f"retrieved {len(features)} of {len(keys)} features from cache")
         return features
@@ -2,6 +2,7 @@ from logging import getLogger
 from typing import Dict, List
 
 from pydantic import BaseModel, Extra
+from src.configurations import Configurations
 from src.infrastructure.db_client import AbstractDBClient
 from src.repository.base_repository import TABLES, BaseRepository
 
@@ -22,60 +23,42 @@ class LikeRepository(BaseRepository):
     ):
         super().__init__(db_client=db_client)
         self.like_table = TABLES.LIKE.value
+        self.like_count_table = TABLES.ANIMAL_LIKE_COUNT.value
 
-    def select(
+    def select_all(
         self,
         like_query: LikeQuery,
-        limit: int = 200,
-        offset: int = 0,
     ) -> Dict[str, int]:
-        parameters = like_query.animal_ids
-        ids = ",".join(["%s" for _ in like_query.animal_ids])
-        query = f"""
+        if len(like_query.animal_ids) == 0:
+            return {}
+        if Configurations.like_count_table_enabled:
+            query = f"""
+            SELECT
+                {self.like_count_table}.animal_id AS animal_id,
+                {self.like_count_table}.likes AS likes
+            FROM
+                {self.like_count_table}
+            WHERE
+                {self.like_count_table}.animal_id = ANY(%s)
+            ;
+        """
+        else:
+            query = f"""
             SELECT
-                {self.like_table}.animal_id as animal_id,
+                {self.like_table}.animal_id AS animal_id,
                 COUNT({self.like_table}.animal_id) AS likes
             FROM
                 {self.like_table}
             WHERE
-                {self.like_table}.animal_id IN ({ids})
+                {self.like_table}.animal_id = ANY(%s)
             GROUP BY
                 {self.like_table}.animal_id
-            LIMIT
-                {limit}
-            OFFSET
-                {offset}
             ;
         """
 
         records = self.execute_select_query(
             query=query,
-            parameters=tuple(parameters),
+            parameters=(list(set(like_query.animal_ids)),),
         )
         data = {r["animal_id"]: int(r["likes"]) for r in records}
         return data
-
-    def select_all(
-        self,
-        like_query: LikeQuery,
-    ) -> Dict[str, int]:
-        limit = 200
-        offset = 0
-        records = {}
-        while True:
-            data = self.select(
-                like_query=like_query,
-                limit=limit,
-                offset=offset,
-            )
-            if len(data) == len(like_query.animal_ids):
-                for k, v in data.items():
-                    records[k] = v
-                break
-            if len(data) > 0:
-                for k, v in data.items():
-                    records[k] = v
-            else:
-                break
-            offset += limit
-        return records
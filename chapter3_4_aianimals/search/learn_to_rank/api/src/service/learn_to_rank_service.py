@@ -5,7 +5,9 @@ from typing import List, Optional, Tuple, Union
 import numpy as np
 from lightgbm import LGBMRanker, LGBMRegressor
 from onnxruntime import InferenceSession
+from scipy.sparse import issparse, spmatrix
 from sklearn.base import BaseEstimator
+from src.service.micro_batch import MicroBatcher
 
 logger = getLogger(__name__)
 
@@ -17,29 +19,29 @@ class AbstractLearnToRankService(ABC):
     @abstractmethod
     def transform_like_scaler(
         self,
-        likes: List[List[int]],
-    ) -> List[List[float]]:
+        likes: np.ndarray,
+    ) -> np.ndarray:
         raise NotImplementedError
 
     @abstractmethod
     def transform_query_animal_category_id_encoder(
         self,
         query_animal_category_id: List[List[Optional[int]]],
-    ) -> List[List[float]]:
+    ) -> np.ndarray:
         raise NotImplementedError
 
     @abstractmethod
     def transform_query_animal_subcategory_id_encoder(
         self,
         query_animal_subcategory_id: List[List[Optional[int]]],
-    ) -> List[List[float]]:
+    ) -> np.ndarray:
         raise NotImplementedError
 
     @abstractmethod
     def transform_query_phrase_encoder(
         self,
         query_phrase: List[List[str]],
-    ) -> List[List[float]]:
+    ) -> np.ndarray:
         raise NotImplementedError
 
     @abstractmethod
@@ -54,7 +56,7 @@ class AbstractLearnToRankService(ABC):
     def predict(
         self,
         ids: List[str],
-        input: List[List[float]],
+        input: np.ndarray,
     ) -> List[Tuple[str, float]]:
         raise NotImplementedError
 
@@ -68,9 +70,11 @@ class LearnToRankService(AbstractLearnToRankService):
         preprocess_query_phrase_encoder: BaseEstimator,
         predictor: Union[BaseEstimator, LGBMRanker, LGBMRegressor, InferenceSession],
         is_onnx_predictor: bool = False,
-        predictor_batch_size: Optional[int] = None,
         predictor_input_name: Optional[str] = None,
         predictor_output_name: Optional[str] = None,
+        micro_batch_enabled: bool = False,
+        micro_batch_max_rows: int = 1000,
+        micro_batch_max_wait_ms: float = 5,
     ):
         super().__init__()
 
@@ -80,70 +84,106 @@ class LearnToRankService(AbstractLearnToRankService):
         self.preprocess_query_phrase_encoder = preprocess_query_phrase_encoder
         self.predictor = predictor
         self.is_onnx_predictor = is_onnx_predictor
-        self.predictor_batch_size = predictor_batch_size
         self.predictor_input_name = predictor_input_name
         self.predictor_output_name = predictor_output_name
 
+        self.onnx_fixed_batch_size: Optional[int] = None
+        if self.is_onnx_predictor:
+            self.onnx_fixed_batch_size = self.__onnx_fixed_batch_size()
+            if self.onnx_fixed_batch_size is not None:
+                logger.info(f"onnx predictor has fixed batch size {self.onnx_fixed_batch_size}; pad inputs")
+
+        self.micro_batcher: Optional[MicroBatcher] = None
+        if micro_batch_enabled:
+            self.micro_batcher = MicroBatcher(
+                predict=lambda input: self._predict(input=input),
+                max_batch_rows=micro_batch_max_rows,
+                max_wait_ms=micro_batch_max_wait_ms,
+            )
+
+    def __to_dense(
+        self,
+        x: Union[np.ndarray, spmatrix],
+    ) -> np.ndarray:
+        if issparse(x):
+            x = x.toarray()
+        return np.asarray(x, dtype=np.float32)
+
     def transform_like_scaler(
         self,
-        likes: List[List[int]],
-    ) -> List[List[float]]:
-        return self.preprocess_like_scaler.transform(likes).tolist()
+        likes: np.ndarray,
+    ) -> np.ndarray:
+        return self.preprocess_like_scaler.transform(likes).astype(np.float32)
 
     def transform_query_animal_category_id_encoder(
         self,
         query_animal_category_id: List[List[Optional[int]]],
-    ) -> List[List[float]]:
-        return self.preprocess_query_animal_category_id_encoder.transform(query_animal_category_id).toarray().tolist()
+    ) -> np.ndarray:
+        return self.__to_dense(self.preprocess_query_animal_category_id_encoder.transform(query_animal_category_id))
 
     def transform_query_animal_subcategory_id_encoder(
         self,
         query_animal_subcategory_id: List[List[Optional[int]]],
-    ) -> List[List[float]]:
-        return (
+    ) -> np.ndarray:
+        return self.__to_dense(
             self.preprocess_query_animal_subcategory_id_encoder.transform(query_animal_subcategory_id)
-            .toarray()
-            .tolist()
         )
 
     def transform_query_phrase_encoder(
         self,
         query_phrase: List[List[str]],
-    ) -> List[List[float]]:
-        return self.preprocess_query_phrase_encoder.transform(query_phrase).toarray().tolist()
+    ) -> np.ndarray:
+        return self.__to_dense(self.preprocess_query_phrase_encoder.transform(query_phrase))
 
     def _predict_sklearn(
         self,
-        input: List[List[float]],
+        input: np.ndarray,
     ) -> List[float]:
         return self.predictor.predict(input).tolist()
 
+    def __onnx_fixed_batch_size(self) -> Optional[int]:
+        batch_dimension = self.predictor.get_inputs()[0].shape[0]
+        if isinstance(batch_dimension, int):
+            return batch_dimension
+        return None
+
     def _predict_onnx(
         self,
-        input: List[List[float]],
+        input: np.ndarray,
     ) -> List[float]:
-        if self.predictor_batch_size is None:
-            raise ValueError
+        _input = np.ascontiguousarray(input, dtype=np.float32)
+        if self.onnx_fixed_batch_size is None:
+            output = self.predictor.run(
+                [self.predictor_output_name],
+                {self.predictor_input_name: _input},
+            )
+            return output[0].ravel().tolist()
+        return self._predict_onnx_padded(input=_input)
+
+    def _predict_onnx_padded(
+        self,
+        input: np.ndarray,
+    ) -> List[float]:
+        batch_size = self.onnx_fixed_batch_size
+        size = input.shape[0]
+        padded_size = -(-size // batch_size) * batch_size
+        if padded_size != size:
+            padded = np.zeros((padded_size, input.shape[1]), dtype=np.float32)
+            padded[:size] = input
+            input = padded
 
         outputs = []
-        _input = np.array(input)
-        for i in range(0, _input.shape[0], self.predictor_batch_size):
-            x = _input[i : i + self.predictor_batch_size].astype("float32")
-            if len(x) < self.predictor_batch_size:
-                _x = np.zeros((self.predictor_batch_size, x.shape[1])).astype("float32")
-                for p in range(len(_x)):
-                    _x[p] = x[p]
-                x = _x
+        for i in range(0, padded_size, batch_size):
             output = self.predictor.run(
                 [self.predictor_output_name],
-                {self.predictor_input_name: x},
+                {self.predictor_input_name: input[i : i + batch_size]},
             )
-            outputs.extend(output[0].tolist())
-        return outputs[: _input.shape[0]]
+            outputs.append(output[0].ravel())
+        return np.concatenate(outputs)[:size].tolist()
 
     def _predict(
         self,
-        input: List[List[float]],
+        input: np.ndarray,
     ) -> List[float]:
         if self.is_onnx_predictor:
             return self._predict_onnx(input=input)
@@ -162,9 +202,12 @@ class LearnToRankService(AbstractLearnToRankService):
     def predict(
         self,
         ids: List[str],
-        input: List[List[float]],
+        input: np.ndarray,
     ) -> List[Tuple[str, float]]:
-        prediction = self._predict(input=input)
+        if self.micro_batcher is not None:
+            prediction = self.micro_batcher.submit(input=input)
+        else:
+            prediction = self._predict(input=input)
         id_prediction = self.postprocess(
             ids=ids,
             prediction=prediction,
@@ -0,0 +1,95 @@
+import queue
+import threading
+import time
+from concurrent.futures import Future
+from logging import getLogger
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
+from prometheus_client import Histogram
+
+logger = getLogger(__name__)
+
+BATCH_ROWS = Histogram(
+    "learn_to_rank_micro_batch_rows",
+    "Rows per coalesced learn to rank prediction",
+    buckets=(1, 10, 50, 100, 200, 500, 1000, 2000, 5000),
+)
+BATCH_REQUESTS = Histogram(
+    "learn_to_rank_micro_batch_requests",
+    "Requests per coalesced learn to rank prediction",
+    buckets=(1, 2, 4, 8, 16, 32, 64),
+)
+QUEUE_SECONDS = Histogram(
+    "learn_to_rank_micro_batch_queue_seconds",
+    "Seconds a request waits in the micro batch queue before prediction",
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25),
+)
+
+
+class MicroBatcher(object):
+    def __init__(
+        self,
+        predict: Callable[[np.ndarray], List[float]],
+        max_batch_rows: int = 1000,
+        max_wait_ms: float = 5,
+    ):
+        self.predict = predict
+        self.max_batch_rows = max_batch_rows
+        self.max_wait_second = max_wait_ms / 1000
+        self.__queue: "queue.Queue[Tuple[np.ndarray, Future, float]]" = queue.Queue()
+        self.__worker = threading.Thread(
+            target=self.__run,
+            name="learn_to_rank_micro_batcher",
+            daemon=True,
+        )
+        self.__worker.start()
+
+    def submit(
+        self,
+        input: np.ndarray,
+    ) -> List[float]:
+        future: Future = Future()
+        self.__queue.put((input, future, time.perf_counter()))
+        return future.result()
+
+    def __collect(self) -> List[Tuple[np.ndarray, Future, float]]:
+        items = [self.__queue.get()]
+        rows = items[0][0].shape[0]
+        deadline = time.perf_counter() + self.max_wait_second
+        while rows < self.max_batch_rows:
+            timeout = deadline - time.perf_counter()
+            if timeout <= 0:
+                break
+            try:
+                item = self.__queue.get(timeout=timeout)
+            except queue.Empty:
+                break
+            items.append(item)
+            rows += item[0].shape[0]
+        return items
+
+    def __run(self):
+        while True:
+            items = self.__collect()
+            started_at = time.perf_counter()
+            for _, _, queued_at in items:
+                QUEUE_SECONDS.observe(started_at - queued_at)
+            sizes = [input.shape[0] for input, _, _ in items]
+            BATCH_ROWS.observe(sum(sizes))
+            BATCH_REQUESTS.observe(len(items))
+
+            prediction: Optional[List[float]] = None
+            try:
+                inputs = items[0][0] if len(items) == 1 else np.concatenate([input for input, _, _ in items])
+                prediction = self.predict(inputs)
+            except Exception as e:
+                logger.exception(f"failed micro batch prediction: {e}")
+                for _, future, _ in items:
+                    future.set_exception(e)
+                continue
+
+            offset = 0
+            for size, (_, future, _) in zip(sizes, items):
+                future.set_result(prediction[offset : offset + size])
+                offset += size
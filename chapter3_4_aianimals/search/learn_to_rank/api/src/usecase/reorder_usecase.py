@@ -1,7 +1,8 @@
 from abc import ABC, abstractmethod
 from logging import getLogger
-from typing import List, Optional
+from typing import Dict, List, Optional
 
+import numpy as np
 from fastapi import BackgroundTasks
 from src.configurations import Configurations
 from src.infrastructure.cache_client import AbstractCacheClient
@@ -14,6 +15,13 @@ from src.service.learn_to_rank_service import AbstractLearnToRankService
 
 logger = getLogger(__name__)
 
+FEATURE_VECTOR_NAMES = [
+    "animal_category_vector",
+    "animal_subcategory_vector",
+    "name_vector",
+    "description_vector",
+]
+
 
 def make_query_id(
     animal_ids: List[str],
@@ -84,6 +92,37 @@ class ReorderUsecase(AbstractReorderUsecase):
             expire_second=60 * 10,  # expire in 10 minutes
         )
 
+    def __make_input(
+        self,
+        likes: np.ndarray,
+        query_phrase: List[List[str]],
+        query_animal_category_id: List[List[Optional[int]]],
+        query_animal_subcategory_id: List[List[Optional[int]]],
+        features: List[Dict[str, np.ndarray]],
+    ) -> np.ndarray:
+        query_vectors = [
+            self.learn_to_rank_service.transform_like_scaler(likes=likes),
+            self.learn_to_rank_service.transform_query_phrase_encoder(query_phrase=query_phrase),
+            self.learn_to_rank_service.transform_query_animal_category_id_encoder(
+                query_animal_category_id=query_animal_category_id
+            ),
+            self.learn_to_rank_service.transform_query_animal_subcategory_id_encoder(
+                query_animal_subcategory_id=query_animal_subcategory_id
+            ),
+        ]
+        feature_vectors = [np.stack([f[name] for f in features]) for name in FEATURE_VECTOR_NAMES]
+        blocks = [*query_vectors, *feature_vectors]
+
+        inputs = np.empty(
+            (len(features), sum(b.shape[1] for b in blocks)),
+            dtype=np.float32,
+        )
+        offset = 0
+        for block in blocks:
+            inputs[:, offset : offset + block.shape[1]] = block
+            offset += block.shape[1]
+        return inputs
+
     def reorder(
         self,
         request: AnimalRequest,
@@ -101,44 +140,29 @@ class ReorderUsecase(AbstractReorderUsecase):
         if cached_data is not None:
             return AnimalResponse(ids=cached_data.split(","))
         _likes = self.like_repository.select_all(like_query=LikeQuery(animal_ids=request.ids))
-        likes = [[_likes.get(id, 0)] for id in request.ids]
 
-        feature_cache_keys = [make_feature_cache_key(animal_id=id) for id in request.ids]
-        features = self.feature_cache_repository.get_features_by_keys(keys=feature_cache_keys)
-        transformed_likes = self.learn_to_rank_service.transform_like_scaler(likes=likes)
-        transformed_query_animal_category_id = self.learn_to_rank_service.transform_query_animal_category_id_encoder(
-            query_animal_category_id=[[request.query_animal_category_id]]
-        )
-        transformed_query_animal_subcategory_id = (
-            self.learn_to_rank_service.transform_query_animal_subcategory_id_encoder(
-                query_animal_subcategory_id=[[request.query_animal_subcategory_id]]
-            )
+        feature_cache_keys = {id: make_feature_cache_key(animal_id=id) for id in request.ids}
+        features = self.feature_cache_repository.get_features_by_keys(keys=list(feature_cache_keys.values()))
+        ids = [id for id in request.ids if feature_cache_keys[id] in features]
+        missing_ids = [id for id in request.ids if feature_cache_keys[id] not in features]
+        if len(missing_ids) > 0:
+            logger.info(f"no feature cache for {missing_ids}")
+        if len(ids) == 0:
+            return AnimalResponse(ids=request.ids)
+
+        likes = np.array([[_likes.get(id, 0)] for id in ids])
+        inputs = self.__make_input(
+            likes=likes,
+            query_phrase=[[query_phrases]],
+            query_animal_category_id=[[request.query_animal_category_id]],
+            query_animal_subcategory_id=[[request.query_animal_subcategory_id]],
+            features=[features[feature_cache_keys[id]] for id in ids],
         )
-        transformed_query_phrase = self.learn_to_rank_service.transform_query_phrase_encoder(
-            query_phrase=[[query_phrases]]
-        )
-
-        inputs = [
-            [
-                *l,
-                *transformed_query_phrase[0],
-                *transformed_query_animal_category_id[0],
-                *transformed_query_animal_subcategory_id[0],
-                *f["animal_category_vector"],
-                *f["animal_subcategory_vector"],
-                *f["name_vector"],
-                *f["description_vector"],
-            ]
-            for l, f in zip(
-                transformed_likes,
-                features.values(),
-            )
-        ]
         prediction = self.learn_to_rank_service.predict(
-            ids=request.ids,
+            ids=ids,
             input=inputs,
         )
-        ordered_animal_ids = [p[0] for p in prediction]
+        ordered_animal_ids = [p[0] for p in prediction] + missing_ids
 
         background_tasks.add_task(
             self.__set_prediction_cache,
@@ -20,3 +20,6 @@ class Configurations:
 
     if feature_mlflow_experiment_id is None or feature_mlflow_run_id is None:
         raise ValueError("feature_mlflow_experiment_id and feature_mlflow_run_id cannot be None")
+
+    snapshot_directory = os.getenv("SNAPSHOT_DIRECTORY", None)
+    snapshot_update = int(os.getenv("SNAPSHOT_UPDATE", 1)) == 1
@@ -1,17 +1,34 @@
-import json
 import os
+import threading
+import time
+import uuid
 from abc import ABC, abstractmethod
+from contextlib import contextmanager
 from datetime import date
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
+import numpy as np
 import psycopg2
 import redis
+from prometheus_client import Histogram
 from psycopg2.extras import DictCursor
+from psycopg2.pool import PoolError, ThreadedConnectionPool
+from scipy.sparse import csr_matrix
 from src.dataset.schema import TABLES, AccessLog
+from src.middleware.feature_codec import decode_feature
 from src.middleware.logger import configure_logger
 
 logger = configure_logger(__name__)
 
+POSTGRES_POOL_WAIT_SECONDS = Histogram(
+    "postgres_pool_wait_seconds",
+    "Seconds waited for a pooled postgres connection",
+)
+POSTGRES_POOL_CHECKOUT_SECONDS = Histogram(
+    "postgres_pool_checkout_seconds",
+    "Seconds a pooled postgres connection is held",
+)
+
 
 class AbstractDBClient(ABC):
     def __init__(self):
@@ -33,6 +50,13 @@ class AbstractCache(ABC):
     ) -> Optional[Union[str, int, float, bool, bytes]]:
         raise NotImplementedError
 
+    @abstractmethod
+    def mget(
+        self,
+        keys: List[str],
+    ) -> List[Optional[Union[str, int, float, bool, bytes]]]:
+        raise NotImplementedError
+
 
 class DBClient(AbstractDBClient):
     def __init__(self):
@@ -47,6 +71,126 @@ class DBClient(AbstractDBClient):
         return psycopg2.connect(self.__connection_string)
 
 
+class PooledDBClient(AbstractDBClient):
+    def __init__(self):
+        self.__postgres_user = os.environ["POSTGRES_USER"]
+        self.__postgres_password = os.environ["POSTGRES_PASSWORD"]
+        self.__postgres_port = int(os.getenv("POSTGRES_PORT", 5432))
+        self.__postgres_db = os.environ["POSTGRES_DB"]
+        self.__postgres_host = os.environ["POSTGRES_HOST"]
+        self.__connection_string = f"host={self.__postgres_host} port={self.__postgres_port} dbname={self.__postgres_db} user={self.__postgres_user} password={self.__postgres_password}"
+        self.min_size = int(os.getenv("POSTGRES_POOL_MIN_SIZE", 1))
+        self.max_size = int(os.getenv("POSTGRES_POOL_MAX_SIZE", 10))
+        self.max_lifetime_second = float(os.getenv("POSTGRES_POOL_MAX_LIFETIME_SECOND", 60 * 30))
+        self.wait_timeout_second = float(os.getenv("POSTGRES_POOL_WAIT_TIMEOUT_SECOND", 30))
+        self.health_check_interval_second = float(os.getenv("POSTGRES_POOL_HEALTH_CHECK_INTERVAL_SECOND", 30))
+
+        self.__lock = threading.Lock()
+        self.__pid: Optional[int] = None
+        self.__pool: Optional[ThreadedConnectionPool] = None
+        self.__semaphore: Optional[threading.BoundedSemaphore] = None
+        self.__created_at: Dict[int, float] = {}
+        self.__used_at: Dict[int, float] = {}
+        self.__inherited_pools: List[ThreadedConnectionPool] = []
+
+    def __get_pool(self) -> Tuple[ThreadedConnectionPool, threading.BoundedSemaphore]:
+        with self.__lock:
+            pid = os.getpid()
+            if self.__pool is None or self.__pid != pid:
+                if self.__pool is not None:
+                    # connections inherited through fork belong to the parent; closing them here would end its sessions
+                    self.__inherited_pools.append(self.__pool)
+                self.__pool = ThreadedConnectionPool(
+                    minconn=self.min_size,
+                    maxconn=self.max_size,
+                    dsn=self.__connection_string,
+                )
+                self.__semaphore = threading.BoundedSemaphore(self.max_size)
+                self.__pid = pid
+                self.__created_at = {}
+                self.__used_at = {}
+            return self.__pool, self.__semaphore
+
+    def __is_healthy(
+        self,
+        connection,
+    ) -> bool:
+        if connection.closed:
+            return False
+        now = time.monotonic()
+        key = id(connection)
+        with self.__lock:
+            created_at = self.__created_at.setdefault(key, now)
+            used_at = self.__used_at.get(key, now)
+        if now - created_at > self.max_lifetime_second:
+            return False
+        if now - used_at < self.health_check_interval_second:
+            return True
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT 1")
+            connection.rollback()
+            return True
+        except psycopg2.Error:
+            return False
+
+    def __discard(
+        self,
+        pool: ThreadedConnectionPool,
+        connection,
+    ):
+        with self.__lock:
+            self.__created_at.pop(id(connection), None)
+            self.__used_at.pop(id(connection), None)
+        pool.putconn(connection, close=True)
+
+    def __checkout(
+        self,
+        pool: ThreadedConnectionPool,
+    ):
+        while True:
+            connection = pool.getconn()
+            if self.__is_healthy(connection=connection):
+                return connection
+            self.__discard(
+                pool=pool,
+                connection=connection,
+            )
+
+    @contextmanager
+    def get_connection(self) -> Iterator:
+        pool, semaphore = self.__get_pool()
+        waited_from = time.perf_counter()
+        if not semaphore.acquire(timeout=self.wait_timeout_second):
+            raise PoolError(f"no postgres connection available within {self.wait_timeout_second} seconds")
+        checked_out_at = time.perf_counter()
+        POSTGRES_POOL_WAIT_SECONDS.observe(checked_out_at - waited_from)
+        connection = None
+        try:
+            connection = self.__checkout(pool=pool)
+            with connection:
+                yield connection
+        finally:
+            if connection is not None:
+                if connection.closed:
+                    self.__discard(
+                        pool=pool,
+                        connection=connection,
+                    )
+                else:
+                    with self.__lock:
+                        self.__used_at[id(connection)] = time.monotonic()
+                    pool.putconn(connection)
+            semaphore.release()
+            POSTGRES_POOL_CHECKOUT_SECONDS.observe(time.perf_counter() - checked_out_at)
+
+    def close(self):
+        with self.__lock:
+            if self.__pool is not None and self.__pid == os.getpid():
+                self.__pool.closeall()
+                self.__pool = None
+
+
 class RedisCache(AbstractCache):
     def __init__(self):
         super().__init__()
@@ -60,6 +204,12 @@ class RedisCache(AbstractCache):
             db=self.__redis_db,
             decode_responses=True,
         )
+        self.redis_bytes_client = redis.Redis(
+            host=self.__redis_host,
+            port=self.__redis_port,
+            db=self.__redis_db,
+            decode_responses=False,
+        )
 
     def get(
         self,
@@ -68,29 +218,41 @@ class RedisCache(AbstractCache):
         value = self.redis_client.get(key)
         return value
 
+    def mget(
+        self,
+        keys: List[str],
+    ) -> List[Optional[Union[str, int, float, bool, bytes]]]:
+        if len(keys) == 0:
+            return []
+        return self.redis_bytes_client.mget(keys)
+
 
 class FeatureCacheRepository(object):
     def __init__(
         self,
         cache: AbstractCache,
+        chunk_size: int = 1000,
     ):
         self.cache = cache
+        self.chunk_size = chunk_size
 
     def get_features_by_keys(
         self,
         keys: List[str],
-    ) -> Dict[str, Dict[str, List[float]]]:
+        as_sparse: bool = False,
+    ) -> Dict[str, Dict[str, Union[np.ndarray, csr_matrix]]]:
         logger.info(f"keys to get from cache: {len(keys)}")
         features = {}
-        i = 1000
-        for key in keys:
-            feature = self.cache.get(key=key)
-            if feature is not None:
-                features[key] = json.loads(str(feature))
-                i -= 1
-                if i == 0:
-                    logger.info(f"retrieved {len(features)} from cache")
-                    i = 1000
+        for i in range(0, len(keys), self.chunk_size):
+            _keys = keys[i : i + self.chunk_size]
+            values = self.cache.mget(keys=_keys)
+            for key, feature in zip(_keys, values):
+                if feature is not None:
+                    features[key] = decode_feature(
+                        value=feature,
+                        as_sparse=as_sparse,
+                    )
+            logger.info(f"retrieved {len(features)} from cache")
         return features
 
 
@@ -113,6 +275,20 @@ class BaseRepository(object):
                 rows = cursor.fetchall()
         return rows
 
+    def execute_select_query_stream(
+        self,
+        query: str,
+        parameters: Optional[Tuple] = None,
+        itersize: int = 1000,
+    ) -> Iterator[Dict[str, Any]]:
+        logger.info(f"stream select query: {query}, parameters: {parameters}")
+        with self.db_client.get_connection() as conn:
+            with conn.cursor(name=f"stream_{uuid.uuid4().hex}", cursor_factory=DictCursor) as cursor:
+                cursor.itersize = itersize
+                cursor.execute(query, parameters)
+                for row in cursor:
+                    yield row
+
 
 class AccessLogRepository(BaseRepository):
     def __init__(
@@ -123,12 +299,10 @@ class AccessLogRepository(BaseRepository):
         self.access_log_table = TABLES.ACCESS_LOG.value
         self.animal_table = TABLES.ANIMAL.value
 
-    def select(
+    def __make_select_query(
         self,
         date_from: Optional[date] = None,
-        limit: int = 1000,
-        offset: int = 0,
-    ) -> List[AccessLog]:
+    ) -> Tuple[str, List]:
         parameters = []
         query = f"""
 SELECT
@@ -138,7 +312,8 @@ SELECT
     {self.access_log_table}.animal_subcategory_id AS query_animal_subcategory_id,
     {self.access_log_table}.likes AS likes,
     {self.access_log_table}.action AS action,
-    {self.access_log_table}.animal_id AS animal_id
+    {self.access_log_table}.animal_id AS animal_id,
+    {self.access_log_table}.created_at AS created_at
 FROM 
     {self.access_log_table}
 LEFT JOIN
@@ -158,7 +333,19 @@ AND
 
         query += f"""
 ORDER BY
-    {self.access_log_table}.created_at
+    {self.access_log_table}.created_at,
+    {self.access_log_table}.id
+"""
+        return query, parameters
+
+    def select(
+        self,
+        date_from: Optional[date] = None,
+        limit: int = 1000,
+        offset: int = 0,
+    ) -> List[AccessLog]:
+        query, parameters = self.__make_select_query(date_from=date_from)
+        query += f"""
 LIMIT
     {limit}
 OFFSET
@@ -168,26 +355,26 @@ OFFSET
 
         records = self.execute_select_query(
             query=query,
-            parameters=parameters,
+            parameters=tuple(parameters),
         )
         data = [AccessLog(**r) for r in records]
         return data
 
+    def stream(
+        self,
+        date_from: Optional[date] = None,
+        itersize: int = 1000,
+    ) -> Iterator[AccessLog]:
+        query, parameters = self.__make_select_query(date_from=date_from)
+        for record in self.execute_select_query_stream(
+            query=query,
+            parameters=tuple(parameters),
+            itersize=itersize,
+        ):
+            yield AccessLog(**record)
+
     def select_all(
         self,
         date_from: Optional[date] = None,
     ) -> List[AccessLog]:
-        limit = 1000
-        offset = 0
-        records = []
-        while True:
-            r = self.select(
-                limit=limit,
-                offset=offset,
-            )
-            if len(r) > 0:
-                records.extend(r)
-            else:
-                break
-            offset += limit
-        return records
+        return list(self.stream(date_from=date_from))
@@ -3,6 +3,7 @@ from enum import Enum
 from typing import Dict, List, Optional, Union
 
 from pydantic import BaseModel, Extra
+from scipy.sparse import csr_matrix
 
 
 class Action(Enum):
@@ -65,16 +66,20 @@ class AccessLog(BaseModel):
     likes: int
     action: str
     animal_id: str
+    created_at: Optional[datetime] = None
 
     class Config:
         extra = Extra.forbid
 
 
 class FeatureVector(BaseModel):
-    animal_category_vector: List[float]
-    animal_subcategory_vector: List[float]
-    name_vector: List[float]
-    description_vector: List[float]
+    animal_category_vector: csr_matrix
+    animal_subcategory_vector: csr_matrix
+    name_vector: csr_matrix
+    description_vector: csr_matrix
+
+    class Config:
+        arbitrary_types_allowed = True
 
 
 class Data(BaseModel):
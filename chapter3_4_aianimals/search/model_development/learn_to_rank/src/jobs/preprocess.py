@@ -1,7 +1,11 @@
+import os
 import random
-from typing import Dict, List, Optional, Tuple
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple, Union
 
+import numpy as np
 from pydantic import BaseModel
+from scipy.sparse import csr_matrix, hstack, issparse, spmatrix, vstack
 from sklearn.model_selection import train_test_split
 from src.dataset.schema import Data, RawData, SplitData
 from src.middleware.logger import configure_logger
@@ -91,13 +95,102 @@ def split_by_qid(
     )
 
 
-class PreprocessedData(BaseModel):
-    x_train: List[List[float]]
-    y_train: List[int]
-    x_test: List[List[float]]
-    y_test: List[int]
-    q_train: Optional[List[int]]
-    q_test: Optional[List[int]]
+def matrix_nbytes(x: Union[csr_matrix, np.ndarray]) -> int:
+    if issparse(x):
+        return x.data.nbytes + x.indices.nbytes + x.indptr.nbytes
+    return x.nbytes
+
+
+def save_matrix(
+    x: Union[csr_matrix, np.ndarray],
+    directory: str,
+    name: str,
+) -> List[str]:
+    if issparse(x):
+        x = csr_matrix(x)
+        components = dict(
+            data=x.data,
+            indices=x.indices,
+            indptr=x.indptr,
+            shape=np.array(x.shape, dtype=np.int64),
+        )
+    else:
+        components = dict(dense=np.ascontiguousarray(x))
+    file_paths = []
+    for component, array in components.items():
+        file_path = os.path.join(directory, f"{name}.{component}.npy")
+        np.save(file_path, array)
+        file_paths.append(file_path)
+    return file_paths
+
+
+def load_matrix(
+    directory: str,
+    name: str,
+    mmap_mode: Optional[str] = "r",
+) -> Optional[Union[csr_matrix, np.ndarray]]:
+    dense_file_path = os.path.join(directory, f"{name}.dense.npy")
+    if os.path.exists(dense_file_path):
+        return np.load(dense_file_path, mmap_mode=mmap_mode)
+    shape_file_path = os.path.join(directory, f"{name}.shape.npy")
+    if not os.path.exists(shape_file_path):
+        return None
+    return csr_matrix(
+        (
+            np.load(os.path.join(directory, f"{name}.data.npy"), mmap_mode=mmap_mode),
+            np.load(os.path.join(directory, f"{name}.indices.npy"), mmap_mode=mmap_mode),
+            np.load(os.path.join(directory, f"{name}.indptr.npy"), mmap_mode=mmap_mode),
+        ),
+        shape=tuple(np.load(shape_file_path).tolist()),
+        copy=False,
+    )
+
+
+@dataclass
+class PreprocessedData(object):
+    x_train: Union[csr_matrix, np.ndarray]
+    y_train: np.ndarray
+    x_test: Union[csr_matrix, np.ndarray]
+    y_test: np.ndarray
+    q_train: Optional[np.ndarray] = None
+    q_test: Optional[np.ndarray] = None
+
+    def save(
+        self,
+        directory: str,
+    ) -> List[str]:
+        os.makedirs(directory, exist_ok=True)
+        file_paths = []
+        for name in ("x_train", "y_train", "x_test", "y_test", "q_train", "q_test"):
+            x = getattr(self, name)
+            if x is None:
+                continue
+            file_paths.extend(
+                save_matrix(
+                    x=x,
+                    directory=directory,
+                    name=name,
+                )
+            )
+        logger.info(f"saved preprocessed data: {file_paths}")
+        return file_paths
+
+    @staticmethod
+    def load(
+        directory: str,
+        mmap_mode: Optional[str] = "r",
+    ) -> "PreprocessedData":
+        logger.info(f"load preprocessed data: {directory}")
+        return PreprocessedData(
+            **{
+                name: load_matrix(
+                    directory=directory,
+                    name=name,
+                    mmap_mode=mmap_mode,
+                )
+                for name in ("x_train", "y_train", "x_test", "y_test", "q_train", "q_test")
+            }
+        )
 
 
 class PreprocessArtifact(BaseModel):
@@ -111,6 +204,39 @@ class Preprocess(object):
     def __init__(self):
         pass
 
+    def __assemble(
+        self,
+        likes: np.ndarray,
+        query_phrases: spmatrix,
+        query_animal_category_ids: spmatrix,
+        query_animal_subcategory_ids: spmatrix,
+        x: List[Data],
+        sparse_output: bool = True,
+    ) -> Union[csr_matrix, np.ndarray]:
+        blocks = [
+            csr_matrix(likes),
+            query_phrases,
+            query_animal_category_ids,
+            query_animal_subcategory_ids,
+            vstack([d.feature_vector.animal_category_vector for d in x], format="csr"),
+            vstack([d.feature_vector.animal_subcategory_vector for d in x], format="csr"),
+            vstack([d.feature_vector.name_vector for d in x], format="csr"),
+            vstack([d.feature_vector.description_vector for d in x], format="csr"),
+        ]
+        if sparse_output:
+            return hstack(blocks, format="csr", dtype=np.float32)
+
+        matrix = np.zeros(
+            (len(x), sum([block.shape[1] for block in blocks])),
+            dtype=np.float32,
+        )
+        offset = 0
+        for block in blocks:
+            coo = block.tocoo()
+            matrix[coo.row, offset + coo.col] = coo.data
+            offset += block.shape[1]
+        return matrix
+
     def run(
         self,
         likes_scaler: NumericalMinMaxScaler,
@@ -127,6 +253,7 @@ class Preprocess(object):
         y_test: List[int],
         q_train: Optional[List[int]] = None,
         q_test: Optional[List[int]] = None,
+        sparse_output: bool = True,
     ) -> Tuple[PreprocessedData, PreprocessArtifact]:
         logger.info(
             f"""
@@ -140,92 +267,37 @@ q_test: {sum(q_test) if q_test is not None else None}
         """
         )
 
-        likes_train = likes_scaler.fit_transform(x=[[d.likes] for d in x_train]).tolist()
-        query_phrases_train = (
-            query_phrase_encoder.fit_transform(x=[[d.query_phrases] for d in x_train]).toarray().tolist()
-        )
-        query_animal_category_ids_train = (
-            query_animal_category_id_encoder.fit_transform(x=[[d.query_animal_category_id] for d in x_train])
-            .toarray()
-            .tolist()
-        )
-        query_animal_subcategory_ids_train = (
-            query_animal_subcategory_id_encoder.fit_transform(x=[[d.query_animal_subcategory_id] for d in x_train])
-            .toarray()
-            .tolist()
-        )
-
-        likes_test = likes_scaler.transform(x=[[d.likes] for d in x_test]).tolist()
-        query_phrases_test = query_phrase_encoder.transform(x=[[d.query_phrases] for d in x_test]).toarray().tolist()
-        query_animal_category_ids_test = (
-            query_animal_category_id_encoder.transform(x=[[d.query_animal_category_id] for d in x_test])
-            .toarray()
-            .tolist()
+        _x_train = self.__assemble(
+            likes=likes_scaler.fit_transform(x=[[d.likes] for d in x_train]),
+            query_phrases=query_phrase_encoder.fit_transform(x=[[d.query_phrases] for d in x_train]),
+            query_animal_category_ids=query_animal_category_id_encoder.fit_transform(
+                x=[[d.query_animal_category_id] for d in x_train]
+            ),
+            query_animal_subcategory_ids=query_animal_subcategory_id_encoder.fit_transform(
+                x=[[d.query_animal_subcategory_id] for d in x_train]
+            ),
+            x=x_train,
+            sparse_output=sparse_output,
         )
-        query_animal_subcategory_ids_test = (
-            query_animal_subcategory_id_encoder.transform(x=[[d.query_animal_subcategory_id] for d in x_test])
-            .toarray()
-            .tolist()
+        _x_test = self.__assemble(
+            likes=likes_scaler.transform(x=[[d.likes] for d in x_test]),
+            query_phrases=query_phrase_encoder.transform(x=[[d.query_phrases] for d in x_test]),
+            query_animal_category_ids=query_animal_category_id_encoder.transform(
+                x=[[d.query_animal_category_id] for d in x_test]
+            ),
+            query_animal_subcategory_ids=query_animal_subcategory_id_encoder.transform(
+                x=[[d.query_animal_subcategory_id] for d in x_test]
+            ),
+            x=x_test,
+            sparse_output=sparse_output,
         )
 
-        _x_train = [
-            [
-                *_likes_train,
-                *_query_phrases_train,
-                *_query_animal_category_ids_train,
-                *_query_animal_subcategory_ids_train,
-                *v.feature_vector.animal_category_vector,
-                *v.feature_vector.animal_subcategory_vector,
-                *v.feature_vector.name_vector,
-                *v.feature_vector.description_vector,
-            ]
-            for (
-                _likes_train,
-                _query_phrases_train,
-                _query_animal_category_ids_train,
-                _query_animal_subcategory_ids_train,
-                v,
-            ) in zip(
-                likes_train,
-                query_phrases_train,
-                query_animal_category_ids_train,
-                query_animal_subcategory_ids_train,
-                x_train,
-            )
-        ]
-
-        _x_test = [
-            [
-                *_likes_test,
-                *_query_phrases_test,
-                *_query_animal_category_ids_test,
-                *_query_animal_subcategory_ids_test,
-                *v.feature_vector.animal_category_vector,
-                *v.feature_vector.animal_subcategory_vector,
-                *v.feature_vector.name_vector,
-                *v.feature_vector.description_vector,
-            ]
-            for (
-                _likes_test,
-                _query_phrases_test,
-                _query_animal_category_ids_test,
-                _query_animal_subcategory_ids_test,
-                v,
-            ) in zip(
-                likes_test,
-                query_phrases_test,
-                query_animal_category_ids_test,
-                query_animal_subcategory_ids_test,
-                x_test,
-            )
-        ]
-
         logger.info(
             f"""
 data after preprocess
-x_train: {len(_x_train)}
+x_train: {_x_train.shape}, {matrix_nbytes(x=_x_train)} bytes
 y_train: {len(y_train)}
-x_test: {len(_x_test)}
+x_test: {_x_test.shape}, {matrix_nbytes(x=_x_test)} bytes
 y_test: {len(y_test)}
 q_train: {sum(q_train) if q_train is not None else None}
 q_test: {sum(q_test) if q_test is not None else None}
@@ -247,11 +319,11 @@ q_test: {sum(q_test) if q_test is not None else None}
 
         data = PreprocessedData(
             x_train=_x_train,
-            y_train=y_train,
+            y_train=np.array(y_train, dtype=np.int32),
             x_test=_x_test,
-            y_test=y_test,
-            q_train=q_train,
-            q_test=q_test,
+            y_test=np.array(y_test, dtype=np.int32),
+            q_train=np.array(q_train, dtype=np.int32) if q_train is not None else None,
+            q_test=np.array(q_test, dtype=np.int32) if q_test is not None else None,
         )
         artifact = PreprocessArtifact(
             likes_scaler_save_file_path=likes_scaler_path,
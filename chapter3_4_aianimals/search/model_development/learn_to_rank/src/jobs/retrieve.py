@@ -13,6 +13,16 @@ def make_cache_key(
     return f"animal_feature_{animal_id}_{feature_mlflow_experiment_id}_{feature_mlflow_run_id}"
 
 
+def make_target(action: str) -> int:
+    if action == Action.SELECT.value:
+        return 1
+    elif action == Action.SEE_LONG.value:
+        return 3
+    elif action == Action.LIKE.value:
+        return 4
+    raise ValueError(f"unknown action: {action}")
+
+
 def retrieve_access_logs(
     feature_mlflow_experiment_id: int,
     feature_mlflow_run_id: str,
@@ -35,7 +45,10 @@ def retrieve_access_logs(
     )
     logger.info(f"retrieved: {len(records)} like {records[0]}")
     feature_cache_repository = FeatureCacheRepository(cache=cache)
-    features = feature_cache_repository.get_features_by_keys(keys=ids)
+    features = feature_cache_repository.get_features_by_keys(
+        keys=ids,
+        as_sparse=True,
+    )
     data = []
     target = []
     i = 1000
@@ -64,12 +77,7 @@ def retrieve_access_logs(
         )
 
         data.append(d)
-        if record.action == Action.SELECT.value:
-            target.append(1)
-        elif record.action == Action.SEE_LONG.value:
-            target.append(3)
-        elif record.action == Action.LIKE.value:
-            target.append(4)
+        target.append(make_target(action=record.action))
         i -= 1
         if i == 0:
             logger.info(f"organized {len(data)} data")
@@ -0,0 +1,191 @@
+import os
+from datetime import date
+from typing import Dict, List, Optional
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from src.dataset.data_manager import AbstractCache, AbstractDBClient, AccessLogRepository, FeatureCacheRepository
+from src.dataset.schema import AccessLog, Data, FeatureVector, RawData
+from src.jobs.retrieve import make_cache_key, make_target
+from src.middleware.logger import configure_logger
+
+logger = configure_logger(__name__)
+
+PARTITION_FILE = "access_logs.parquet"
+SNAPSHOT_SCHEMA = pa.schema(
+    [
+        ("id", pa.string()),
+        ("animal_id", pa.string()),
+        ("query_phrases", pa.list_(pa.string())),
+        ("query_animal_category_id", pa.int64()),
+        ("query_animal_subcategory_id", pa.int64()),
+        ("likes", pa.int64()),
+        ("action", pa.string()),
+        ("created_at", pa.timestamp("us")),
+    ]
+)
+
+
+def make_partition_directory(
+    snapshot_directory: str,
+    partition_date: date,
+) -> str:
+    return os.path.join(snapshot_directory, f"date={partition_date.isoformat()}")
+
+
+def list_partition_dates(snapshot_directory: str) -> List[date]:
+    if not os.path.isdir(snapshot_directory):
+        return []
+    dates = []
+    for name in os.listdir(snapshot_directory):
+        if name.startswith("date=") and os.path.exists(os.path.join(snapshot_directory, name, PARTITION_FILE)):
+            dates.append(date.fromisoformat(name[len("date=") :]))
+    return sorted(dates)
+
+
+def write_partition(
+    records: List[AccessLog],
+    partition_date: date,
+    snapshot_directory: str,
+) -> int:
+    columns: Dict[str, List] = {field.name: [] for field in SNAPSHOT_SCHEMA}
+    for record in records:
+        columns["id"].append(record.id)
+        columns["animal_id"].append(record.animal_id)
+        columns["query_phrases"].append(record.query_phrases)
+        columns["query_animal_category_id"].append(record.query_animal_category_id)
+        columns["query_animal_subcategory_id"].append(record.query_animal_subcategory_id)
+        columns["likes"].append(record.likes)
+        columns["action"].append(record.action)
+        columns["created_at"].append(record.created_at)
+
+    directory = make_partition_directory(
+        snapshot_directory=snapshot_directory,
+        partition_date=partition_date,
+    )
+    os.makedirs(directory, exist_ok=True)
+    file_path = os.path.join(directory, PARTITION_FILE)
+    temporary_file_path = f"{file_path}.tmp"
+    table = pa.Table.from_pydict(columns, schema=SNAPSHOT_SCHEMA)
+    pq.write_table(table, temporary_file_path)
+    os.replace(temporary_file_path, file_path)
+    logger.info(f"wrote {table.num_rows} rows to {file_path}")
+    return table.num_rows
+
+
+def update_snapshot(
+    db_client: AbstractDBClient,
+    snapshot_directory: str,
+) -> List[date]:
+    dates = list_partition_dates(snapshot_directory=snapshot_directory)
+    # the latest partition may have been written before its day was over, so it is rewritten
+    date_from = dates[-1] if len(dates) > 0 else None
+    logger.info(f"update snapshot from {date_from}")
+
+    access_log_repository = AccessLogRepository(db_client=db_client)
+    written: List[date] = []
+    records: List[AccessLog] = []
+    partition_date: Optional[date] = None
+    for record in access_log_repository.stream(date_from=date_from):
+        record_date = record.created_at.date()
+        if partition_date is not None and record_date != partition_date:
+            write_partition(
+                records=records,
+                partition_date=partition_date,
+                snapshot_directory=snapshot_directory,
+            )
+            written.append(partition_date)
+            records = []
+        partition_date = record_date
+        records.append(record)
+    if partition_date is not None and len(records) > 0:
+        write_partition(
+            records=records,
+            partition_date=partition_date,
+            snapshot_directory=snapshot_directory,
+        )
+        written.append(partition_date)
+    logger.info(f"updated snapshot partitions: {written}")
+    return written
+
+
+def load_snapshot(
+    feature_mlflow_experiment_id: int,
+    feature_mlflow_run_id: str,
+    cache: AbstractCache,
+    snapshot_directory: str,
+    date_from: Optional[date] = None,
+) -> RawData:
+    dates = [
+        d for d in list_partition_dates(snapshot_directory=snapshot_directory) if date_from is None or d >= date_from
+    ]
+    logger.info(f"load snapshot: {len(dates)} partitions")
+    tables = [
+        pq.read_table(
+            os.path.join(
+                make_partition_directory(
+                    snapshot_directory=snapshot_directory,
+                    partition_date=partition_date,
+                ),
+                PARTITION_FILE,
+            )
+        )
+        for partition_date in dates
+    ]
+    if len(tables) == 0:
+        return RawData(
+            data=[],
+            target=[],
+        )
+    columns = pa.concat_tables(tables).to_pydict()
+    logger.info(f"loaded {len(columns['id'])} access logs until {dates[-1]}")
+
+    keys = {
+        animal_id: make_cache_key(
+            animal_id=animal_id,
+            feature_mlflow_experiment_id=feature_mlflow_experiment_id,
+            feature_mlflow_run_id=feature_mlflow_run_id,
+        )
+        for animal_id in set(columns["animal_id"])
+    }
+    feature_cache_repository = FeatureCacheRepository(cache=cache)
+    features = feature_cache_repository.get_features_by_keys(
+        keys=list(keys.values()),
+        as_sparse=True,
+    )
+
+    feature_vectors: Dict[str, FeatureVector] = {}
+    data = []
+    target = []
+    skipped = 0
+    for i, animal_id in enumerate(columns["animal_id"]):
+        feature_vector = feature_vectors.get(animal_id, None)
+        if feature_vector is None:
+            feature = features.get(keys[animal_id], None)
+            if feature is None:
+                skipped += 1
+                continue
+            feature_vector = FeatureVector(
+                animal_category_vector=feature["animal_category_vector"],
+                animal_subcategory_vector=feature["animal_subcategory_vector"],
+                name_vector=feature["name_vector"],
+                description_vector=feature["description_vector"],
+            )
+            feature_vectors[animal_id] = feature_vector
+        data.append(
+            Data(
+                animal_id=animal_id,
+                query_phrases=".".join(sorted(columns["query_phrases"][i])),
+                query_animal_category_id=columns["query_animal_category_id"][i],
+                query_animal_subcategory_id=columns["query_animal_subcategory_id"][i],
+                likes=columns["likes"][i],
+                feature_vector=feature_vector,
+            )
+        )
+        target.append(make_target(action=columns["action"][i]))
+    logger.info(f"joined {len(data)} access logs with features; skipped {skipped} for lack of cache")
+
+    return RawData(
+        data=data,
+        target=target,
+    )
@@ -1,7 +1,8 @@
-from typing import List, Optional
+from typing import Optional, Union
 
 import numpy as np
 from pydantic import BaseModel
+from scipy.sparse import spmatrix
 from src.middleware.logger import configure_logger
 from src.models.base_model import BaseLearnToRankModel
 
@@ -21,19 +22,20 @@ class Trainer(object):
         self,
         model: BaseLearnToRankModel,
         model_save_file_path: str,
-        x_train: List[List[float]],
-        y_train: List[int],
-        x_test: List[List[float]],
-        y_test: List[int],
-        q_train: Optional[List[int]] = None,
-        q_test: Optional[List[int]] = None,
+        x_train: Union[np.ndarray, spmatrix],
+        y_train: np.ndarray,
+        x_test: Union[np.ndarray, spmatrix],
+        y_test: np.ndarray,
+        q_train: Optional[np.ndarray] = None,
+        q_test: Optional[np.ndarray] = None,
+        onnx_batch_size: Optional[int] = None,
     ) -> Artifact:
         logger.info(
             f"""
 data to train
-x_train: {len(x_train)}
+x_train: {x_train.shape}
 y_train: {len(y_train)}
-x_test: {len(x_test)}
+x_test: {x_test.shape}
 y_test: {len(y_test)}
 q_train: {sum(q_train) if q_train is not None else None}
 q_test: {sum(q_test) if q_test is not None else None}
@@ -41,10 +43,10 @@ q_test: {sum(q_test) if q_test is not None else None}
         )
 
         model.train(
-            x_train=np.array(x_train),
-            y_train=np.array(y_train),
-            x_test=np.array(x_test),
-            y_test=np.array(y_test),
+            x_train=x_train,
+            y_train=y_train,
+            x_test=x_test,
+            y_test=y_test,
             q_train=q_train,
             q_test=q_test,
         )
@@ -52,8 +54,8 @@ q_test: {sum(q_test) if q_test is not None else None}
         model_file_path = model.save(file_path=model_save_file_path)
         onnx_file_path = model.save_onnx(
             file_path=model_save_file_path,
-            batch_size=40,
-            feature_size=np.array(x_train).shape[1],
+            batch_size=onnx_batch_size,
+            feature_size=x_train.shape[1],
         )
         return Artifact(
             model_file_path=model_file_path,
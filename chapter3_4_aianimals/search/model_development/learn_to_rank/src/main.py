@@ -1,15 +1,15 @@
 import json
 import os
-import pickle
 from datetime import datetime
 
 import hydra
 import mlflow
 from omegaconf import DictConfig
 from src.configurations import Configurations
-from src.dataset.data_manager import DBClient, RedisCache
-from src.jobs.preprocess import Preprocess, random_split, split_by_qid
+from src.dataset.data_manager import PooledDBClient, RedisCache
+from src.jobs.preprocess import Preprocess, PreprocessedData, random_split, split_by_qid
 from src.jobs.retrieve import retrieve_access_logs
+from src.jobs.snapshot import load_snapshot, update_snapshot
 from src.jobs.train import Trainer
 from src.middleware.logger import configure_logger
 from src.models.models import MODELS
@@ -39,14 +39,27 @@ def main(cfg: DictConfig):
     mlflow.set_tracking_uri(os.getenv("MLFLOW_TRACKING_URI", "http://mlflow:5000"))
     mlflow.set_experiment(experiment_name=experiment_name)
     with mlflow.start_run(run_name=run_name) as run:
-        db_client = DBClient()
+        db_client = PooledDBClient()
         cache = RedisCache()
-        raw_data = retrieve_access_logs(
-            feature_mlflow_experiment_id=Configurations.feature_mlflow_experiment_id,
-            feature_mlflow_run_id=Configurations.feature_mlflow_run_id,
-            db_client=db_client,
-            cache=cache,
-        )
+        if Configurations.snapshot_directory is not None:
+            if Configurations.snapshot_update:
+                update_snapshot(
+                    db_client=db_client,
+                    snapshot_directory=Configurations.snapshot_directory,
+                )
+            raw_data = load_snapshot(
+                feature_mlflow_experiment_id=Configurations.feature_mlflow_experiment_id,
+                feature_mlflow_run_id=Configurations.feature_mlflow_run_id,
+                cache=cache,
+                snapshot_directory=Configurations.snapshot_directory,
+            )
+        else:
+            raw_data = retrieve_access_logs(
+                feature_mlflow_experiment_id=Configurations.feature_mlflow_experiment_id,
+                feature_mlflow_run_id=Configurations.feature_mlflow_run_id,
+                db_client=db_client,
+                cache=cache,
+            )
         if cfg.jobs.data.split_by_qid:
             dataset = split_by_qid(
                 raw_data=raw_data,
@@ -86,6 +99,7 @@ def main(cfg: DictConfig):
             y_test=dataset.y_test,
             q_train=dataset.q_train,
             q_test=dataset.q_test,
+            sparse_output=cfg.jobs.data.get("sparse", True),
         )
         mlflow.log_artifact(preprocess_artifact.likes_scaler_save_file_path, "likes_scaler")
         mlflow.log_artifact(preprocess_artifact.query_phrase_encoder_save_file_path, "query_phrase_encoder")
@@ -97,10 +111,13 @@ def main(cfg: DictConfig):
             "query_animal_subcategory_id_encoder",
         )
 
-        preprocessed_data_file = os.path.join(cwd, f"preprocessed_data.pickle")
-        with open(preprocessed_data_file, "wb") as f:
-            pickle.dump(preprocessed_data, f)
-        mlflow.log_artifact(preprocessed_data_file, "preprocessed_data_file")
+        preprocessed_data_directory = os.path.join(cwd, "preprocessed_data")
+        preprocessed_data.save(directory=preprocessed_data_directory)
+        mlflow.log_artifacts(preprocessed_data_directory, "preprocessed_data")
+        preprocessed_data = PreprocessedData.load(
+            directory=preprocessed_data_directory,
+            mmap_mode="r",
+        )
 
         artifact = Trainer().train(
             model=model,
@@ -111,6 +128,7 @@ def main(cfg: DictConfig):
             y_test=preprocessed_data.y_test,
             q_train=preprocessed_data.q_train,
             q_test=preprocessed_data.q_test,
+            onnx_batch_size=cfg.jobs.model.get("onnx_batch_size", None),
         )
 
         mlflow.log_artifact(artifact.model_file_path, "model")
@@ -5,6 +5,7 @@ from typing import Dict, List, Optional, Union
 import cloudpickle
 import numpy as np
 import pandas as pd
+from scipy.sparse import spmatrix
 from src.middleware.logger import configure_logger
 
 cloudpickle.register_pickle_by_value(sys.modules[__name__])
@@ -28,9 +29,9 @@ class BaseLearnToRankModel(ABC):
     @abstractmethod
     def train(
         self,
-        x_train: Union[np.ndarray, pd.DataFrame],
+        x_train: Union[np.ndarray, pd.DataFrame, spmatrix],
         y_train: Union[np.ndarray, pd.DataFrame],
-        x_test: Optional[Union[np.ndarray, pd.DataFrame]] = None,
+        x_test: Optional[Union[np.ndarray, pd.DataFrame, spmatrix]] = None,
         y_test: Optional[Union[np.ndarray, pd.DataFrame]] = None,
         q_train: Optional[List[int]] = None,
         q_test: Optional[List[int]] = None,
@@ -48,7 +49,7 @@ class BaseLearnToRankModel(ABC):
     def save_onnx(
         self,
         file_path: str,
-        batch_size: int = 20,
+        batch_size: Optional[int] = None,
         feature_size: int = 1,
     ) -> str:
         raise NotImplementedError
@@ -6,6 +6,7 @@ import cloudpickle
 import numpy as np
 import pandas as pd
 from lightgbm import LGBMRanker
+from scipy.sparse import spmatrix
 from src.middleware.logger import configure_logger
 from src.models.base_model import BaseLearnToRankModel
 
@@ -59,9 +60,9 @@ class LightGBMLearnToRankRanker(BaseLearnToRankModel):
 
     def train(
         self,
-        x_train: Union[np.ndarray, pd.DataFrame],
+        x_train: Union[np.ndarray, pd.DataFrame, spmatrix],
         y_train: Union[np.ndarray, pd.DataFrame],
-        x_test: Optional[Union[np.ndarray, pd.DataFrame]] = None,
+        x_test: Optional[Union[np.ndarray, pd.DataFrame, spmatrix]] = None,
         y_test: Optional[Union[np.ndarray, pd.DataFrame]] = None,
         q_train: Optional[List[int]] = None,
         q_test: Optional[List[int]] = None,
@@ -98,7 +99,7 @@ class LightGBMLearnToRankRanker(BaseLearnToRankModel):
     def save_onnx(
         self,
         file_path: str,
-        batch_size: int = 20,
+        batch_size: Optional[int] = None,
         feature_size: int = 1,
     ) -> str:
         logger.info("pass")
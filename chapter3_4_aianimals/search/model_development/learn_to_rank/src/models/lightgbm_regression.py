@@ -8,6 +8,7 @@ import onnxmltools
 import pandas as pd
 from lightgbm import LGBMRegressor
 from onnxmltools.convert.common.data_types import FloatTensorType
+from scipy.sparse import spmatrix
 from src.middleware.logger import configure_logger
 from src.models.base_model import BaseLearnToRankModel
 
@@ -58,9 +59,9 @@ class LightGBMLearnToRankRegression(BaseLearnToRankModel):
 
     def train(
         self,
-        x_train: Union[np.ndarray, pd.DataFrame],
+        x_train: Union[np.ndarray, pd.DataFrame, spmatrix],
         y_train: Union[np.ndarray, pd.DataFrame],
-        x_test: Optional[Union[np.ndarray, pd.DataFrame]] = None,
+        x_test: Optional[Union[np.ndarray, pd.DataFrame, spmatrix]] = None,
         y_test: Optional[Union[np.ndarray, pd.DataFrame]] = None,
         q_train: Optional[List[int]] = None,
         q_test: Optional[List[int]] = None,
@@ -93,7 +94,7 @@ class LightGBMLearnToRankRegression(BaseLearnToRankModel):
     def save_onnx(
         self,
         file_path: str,
-        batch_size: int = 20,
+        batch_size: Optional[int] = None,
         feature_size: int = 1,
     ) -> str:
         file, ext = os.path.splitext(file_path)
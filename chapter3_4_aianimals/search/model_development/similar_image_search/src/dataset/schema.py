@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from enum import Enum
-from typing import List
+from typing import List, Optional
 
 import numpy as np
 from pydantic import BaseModel, Extra
@@ -30,6 +30,7 @@ class Animal(BaseModel):
 class DownloadedImage(BaseModel):
     id: str
     path: str
+    digest: Optional[str] = None
 
 
 class DownloadedImages(BaseModel):
@@ -8,6 +8,7 @@ import numpy as np
 from PIL import Image
 from src.dataset.data_manager import AbstractDBClient, AnimalRepository
 from src.dataset.schema import Animal, Dataset, DownloadedImage, DownloadedImages
+from src.middleware.image_cache import ImageCache
 from src.middleware.logger import configure_logger
 
 logger = configure_logger(__name__)
@@ -25,26 +26,54 @@ async def download_file(
     id: str,
     source_path: str,
     destination_path: str,
-) -> Tuple[Optional[str], Optional[str]]:
+    image_cache: Optional[ImageCache] = None,
+) -> Tuple[Optional[str], Optional[str], Optional[str]]:
+    entry = None
+    if image_cache is not None:
+        entry = image_cache.lookup(url=source_path)
+        if entry is not None and image_cache.is_fresh(entry=entry):
+            path = image_cache.path(digest=entry["digest"])
+            if path is not None:
+                return id, path, entry["digest"]
     logger.info(f"download: {source_path} to {destination_path}")
     if os.path.exists(destination_path):
         logger.error(f"data already exists: {id} {source_path} {destination_path}")
-        return id, destination_path
-    res = await client.get(source_path)
+        return id, destination_path, None
+    etag = None if entry is None else entry["etag"]
+    res = await client.get(
+        source_path,
+        headers={} if etag is None else {"If-None-Match": etag},
+    )
+    if res.status_code == 304:
+        image_cache.revalidate(url=source_path)
+        path = image_cache.path(digest=entry["digest"])
+        if path is not None:
+            return id, path, entry["digest"]
+        res = await client.get(source_path)
     if res.status_code != 200:
         raise Exception(f"failed to download {source_path}")
+    if image_cache is not None:
+        digest = image_cache.put(
+            url=source_path,
+            content=res.content,
+            etag=res.headers.get("ETag"),
+        )
+        path = image_cache.path(digest=digest)
+        if path is not None:
+            return id, path, digest
     img = Image.open(BytesIO(res.content))
     if img.mode == "RGBA":
         img_rgb = Image.new("RGB", (img.height, img.width), (255, 255, 255))
         img_rgb.paste(img, mask=img.split()[3])
         img = img_rgb
     img.save(destination_path)
-    return id, destination_path
+    return id, destination_path, None
 
 
 async def download_files(
     animals: List[Animal],
     destination_directory: str,
+    image_cache: Optional[ImageCache] = None,
 ) -> DownloadedImages:
     tasks = []
     timeout = 10.0
@@ -58,15 +87,16 @@ async def download_files(
         for animal in animals:
             basename = os.path.basename(animal.photo_url)
             d = os.path.join(destination_directory, basename)
-            tasks.append(download_file(client, animal.id, animal.photo_url, d))
+            tasks.append(download_file(client, animal.id, animal.photo_url, d, image_cache))
         data = await asyncio.gather(*tasks)
     downloaded_images = []
-    for id, destination_path in data:
+    for id, destination_path, digest in data:
         if id is not None and destination_path is not None:
             downloaded_images.append(
                 DownloadedImage(
                     id=id,
                     path=destination_path,
+                    digest=digest,
                 )
             )
     return DownloadedImages(images=downloaded_images)
@@ -75,6 +105,7 @@ async def download_files(
 def download_dataset(
     animals: List[Animal],
     destination_directory: str,
+    image_cache: Optional[ImageCache] = None,
 ) -> DownloadedImages:
     logger.info("start downloading image")
     os.makedirs(destination_directory, exist_ok=True)
@@ -83,6 +114,7 @@ def download_dataset(
         download_files(
             animals=animals,
             destination_directory=destination_directory,
+            image_cache=image_cache,
         )
     )
     logger.info("done downloading image")
@@ -93,23 +125,40 @@ def load_images(
     images: DownloadedImages,
     height: int,
     width: int,
+    image_cache: Optional[ImageCache] = None,
 ) -> Dataset:
     logger.info("start loading image")
     data = np.zeros((len(images.images), height, width, 3)).astype(np.float32)
     ids = []
+    cached = 0
     for i, image in enumerate(images.images):
-        img = Image.open(image.path)
-        img_resized = img.resize((height, width))
-        if img_resized.mode == "RGBA":
-            img_rgb = Image.new("RGB", (height, width), (255, 255, 255))
-            img_rgb.paste(img_resized, mask=img_resized.split()[3])
-            img_resized = img_rgb
-        img_array = np.array(img_resized).astype(np.float32) / 255.0
-        data[i] = img_array
+        img_array = None
+        if image_cache is not None and image.digest is not None:
+            img_array = image_cache.read_variant(
+                digest=image.digest,
+                size=(height, width),
+            )
+        if img_array is None:
+            img = Image.open(image.path)
+            img_resized = img.resize((height, width))
+            if img_resized.mode == "RGBA":
+                img_rgb = Image.new("RGB", (height, width), (255, 255, 255))
+                img_rgb.paste(img_resized, mask=img_resized.split()[3])
+                img_resized = img_rgb
+            img_array = np.array(img_resized)
+            if image_cache is not None and image.digest is not None:
+                image_cache.put_variant(
+                    digest=image.digest,
+                    size=(height, width),
+                    array=img_array,
+                )
+        else:
+            cached += 1
+        data[i] = img_array.astype(np.float32) / 255.0
         ids.append(image.id)
         if len(ids) % 100 == 0:
             logger.info(f"loaded: {len(ids)} images")
-    logger.info("done loading image")
+    logger.info(f"done loading image: {cached} resized images from cache")
     return Dataset(
         data=data,
         ids=ids,
@@ -6,8 +6,9 @@ from datetime import datetime
 import hydra
 import mlflow
 from omegaconf import DictConfig
-from src.dataset.data_manager import DBClient
+from src.dataset.data_manager import PooledDBClient
 from src.jobs.retrieve import download_dataset, load_images, retrieve_animals
+from src.middleware.image_cache import ImageCache
 from src.middleware.logger import configure_logger
 from src.models.scann import ScannModel
 
@@ -34,17 +35,25 @@ def main(cfg: DictConfig):
     mlflow.set_tracking_uri(os.getenv("MLFLOW_TRACKING_URI", "http://mlflow:5000"))
     mlflow.set_experiment(experiment_name=experiment_name)
     with mlflow.start_run(run_name=run_name) as run:
-        db_client = DBClient()
+        db_client = PooledDBClient()
         image_dir = os.path.join(cwd, "images")
+        image_cache_max_age_second = os.getenv("IMAGE_CACHE_MAX_AGE_SECOND", None)
+        image_cache = ImageCache(
+            directory=os.getenv("IMAGE_CACHE_DIRECTORY", "/opt/outputs/image_cache"),
+            max_bytes=int(os.getenv("IMAGE_CACHE_MAX_BYTES", str(10 * 1024 * 1024 * 1024))),
+            max_age_second=int(image_cache_max_age_second) if image_cache_max_age_second else None,
+        )
         animals = retrieve_animals(db_client=db_client)
         downloaded_images = download_dataset(
             animals=animals,
             destination_directory=image_dir,
+            image_cache=image_cache,
         )
         dataset = load_images(
             images=downloaded_images,
             height=cfg.input.height,
             width=cfg.input.width,
+            image_cache=image_cache,
         )
 
         scann_model = ScannModel(
@@ -66,8 +75,16 @@ def main(cfg: DictConfig):
             root_dir="/opt/outputs/saved_model/similar_image_search/",
         )
         saved_model_zip = shutil.move("./saved_model.zip", "/opt/outputs/saved_model.zip")
+        scann_model.save_embedding_store(directory="/opt/outputs/embedding_store")
+        shutil.make_archive(
+            "embedding_store",
+            format="zip",
+            root_dir="/opt/outputs/embedding_store",
+        )
+        embedding_store_zip = shutil.move("./embedding_store.zip", "/opt/outputs/embedding_store.zip")
 
         mlflow.log_artifact(saved_model_zip, "saved_model")
+        mlflow.log_artifact(embedding_store_zip, "embedding_store")
         mlflow.log_artifacts(os.path.join(cwd, ".hydra/"), "hydra")
         mlflow.log_artifact(os.path.join(cwd, "main.log"))
         mlflow.log_params(cfg.model)
@@ -0,0 +1,209 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from logging import getLogger
+from typing import Callable, Dict, List, Optional, Tuple
+
+import numpy as np
+
+logger = getLogger(__name__)
+
+TMP_SUFFIX = ".tmp"
+
+
+def make_url_key(url: str) -> str:
+    return hashlib.sha256(url.encode("utf-8")).hexdigest()
+
+
+def make_digest(content: bytes) -> str:
+    return hashlib.sha256(content).hexdigest()
+
+
+def make_variant_name(
+    digest: str,
+    size: Tuple[int, int],
+) -> str:
+    return f"{digest}_{size[0]}x{size[1]}.npy"
+
+
+class ImageCache(object):
+    def __init__(
+        self,
+        directory: str,
+        max_bytes: int = 10 * 1024 * 1024 * 1024,
+        max_age_second: Optional[int] = None,
+        eviction_ratio: float = 0.9,
+    ):
+        self.directory = directory
+        self.url_directory = os.path.join(directory, "urls")
+        self.object_directory = os.path.join(directory, "objects")
+        self.max_bytes = max_bytes
+        self.max_age_second = max_age_second
+        self.eviction_ratio = eviction_ratio
+        os.makedirs(self.url_directory, exist_ok=True)
+        os.makedirs(self.object_directory, exist_ok=True)
+        self.__lock = threading.Lock()
+        self.__size = sum([size for _, size, _ in self.__list_objects()])
+        logger.info(f"initialized image cache {directory}: {self.__size} bytes of {max_bytes}")
+
+    def __url_path(self, url: str) -> str:
+        key = make_url_key(url=url)
+        return os.path.join(self.url_directory, key[:2], f"{key}.json")
+
+    def __object_path(self, name: str) -> str:
+        return os.path.join(self.object_directory, name[:2], name)
+
+    def __write(
+        self,
+        path: str,
+        write: Callable,
+    ):
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}{TMP_SUFFIX}"
+        with open(tmp_path, "wb") as f:
+            write(f)
+        os.replace(tmp_path, path)
+
+    def __list_objects(self) -> List[Tuple[str, int, float]]:
+        objects = []
+        for root, _, files in os.walk(self.object_directory):
+            for file in files:
+                if file.endswith(TMP_SUFFIX):
+                    continue
+                path = os.path.join(root, file)
+                try:
+                    stat = os.stat(path)
+                except FileNotFoundError:
+                    continue
+                objects.append((path, stat.st_size, stat.st_mtime))
+        return objects
+
+    def __touch(self, path: str) -> bool:
+        try:
+            os.utime(path)
+            return True
+        except FileNotFoundError:
+            return False
+
+    def __add_size(self, size: int):
+        with self.__lock:
+            self.__size += size
+            if self.__size <= self.max_bytes:
+                return
+            self.evict()
+
+    def evict(self):
+        objects = sorted(self.__list_objects(), key=lambda o: o[2])
+        size = sum([o[1] for o in objects])
+        target = int(self.max_bytes * self.eviction_ratio)
+        evicted = 0
+        for path, object_size, _ in objects:
+            if size <= target:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            size -= object_size
+            evicted += 1
+        self.__size = size
+        logger.info(f"evicted {evicted} objects from image cache {self.directory}: {size} bytes left")
+
+    def lookup(self, url: str) -> Optional[Dict]:
+        try:
+            with open(self.__url_path(url=url), "r") as f:
+                entry = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        if not os.path.exists(self.__object_path(name=entry["digest"])):
+            return None
+        return entry
+
+    def is_fresh(self, entry: Dict) -> bool:
+        if self.max_age_second is None:
+            return True
+        return time.time() - entry["checked_at"] < self.max_age_second
+
+    def revalidate(self, url: str):
+        entry = self.lookup(url=url)
+        if entry is None:
+            return
+        entry["checked_at"] = time.time()
+        self.__write(
+            path=self.__url_path(url=url),
+            write=lambda f: f.write(json.dumps(entry).encode("utf-8")),
+        )
+
+    def path(self, digest: str) -> Optional[str]:
+        path = self.__object_path(name=digest)
+        if not self.__touch(path=path):
+            return None
+        return path
+
+    def read(self, digest: str) -> Optional[bytes]:
+        path = self.path(digest=digest)
+        if path is None:
+            return None
+        try:
+            with open(path, "rb") as f:
+                return f.read()
+        except FileNotFoundError:
+            return None
+
+    def put(
+        self,
+        url: str,
+        content: bytes,
+        etag: Optional[str] = None,
+    ) -> str:
+        digest = make_digest(content=content)
+        path = self.__object_path(name=digest)
+        if not self.__touch(path=path):
+            self.__write(
+                path=path,
+                write=lambda f: f.write(content),
+            )
+            self.__add_size(size=len(content))
+        entry = {
+            "url": url,
+            "etag": etag,
+            "digest": digest,
+            "checked_at": time.time(),
+        }
+        self.__write(
+            path=self.__url_path(url=url),
+            write=lambda f: f.write(json.dumps(entry).encode("utf-8")),
+        )
+        return digest
+
+    def read_variant(
+        self,
+        digest: str,
+        size: Tuple[int, int],
+    ) -> Optional[np.ndarray]:
+        path = self.path(digest=make_variant_name(digest=digest, size=size))
+        if path is None:
+            return None
+        try:
+            return np.load(path)
+        except (FileNotFoundError, ValueError) as e:
+            logger.error(f"failed to read image cache variant {path}: {e}")
+            return None
+
+    def put_variant(
+        self,
+        digest: str,
+        size: Tuple[int, int],
+        array: np.ndarray,
+    ):
+        path = self.__object_path(name=make_variant_name(digest=digest, size=size))
+        if self.__touch(path=path):
+            return
+        array = np.ascontiguousarray(array, dtype=np.uint8)
+        self.__write(
+            path=path,
+            write=lambda f: np.save(f, array),
+        )
+        self.__add_size(size=array.nbytes)
@@ -1,5 +1,8 @@
+import json
+import os
 from typing import List
 
+import numpy as np
 import tensorflow as tf
 import tensorflow_hub as hub
 import tensorflow_recommenders as tfrs
@@ -9,16 +12,21 @@ from tensorflow import keras
 
 logger = configure_logger(__name__)
 
+EMBEDDINGS_FILE = "embeddings.npy"
+IDS_FILE = "ids.json"
+
 
 class Scann(keras.Model):
     def __init__(
         self,
         feature_extraction,
         model,
+        embedding_dimension: int,
     ):
         super().__init__(self)
         self.feature_extraction = feature_extraction
         self.model = model
+        self.embedding_dimension = embedding_dimension
 
     @tf.function(
         input_signature=[
@@ -42,11 +50,36 @@ class Scann(keras.Model):
         feature = self.feature_extraction(input_img)
         return self.model(feature, k=k)
 
+    def search_embedding_fn(
+        self,
+        embedding: List[float],
+        k: int,
+    ) -> tf.Tensor:
+        return self.model(embedding, k=k)
+
     def save(
         self,
         export_path: str = "/opt/outputs/saved_model/similar_image_search/0",
     ):
-        signatures = {"serving_default": self.serving_fn}
+        search_embedding_fn = tf.function(
+            self.search_embedding_fn,
+            input_signature=[
+                tf.TensorSpec(
+                    shape=[None, self.embedding_dimension],
+                    dtype=tf.float32,
+                    name="embedding",
+                ),
+                tf.TensorSpec(
+                    shape=[1],
+                    dtype=tf.int32,
+                    name="k",
+                ),
+            ],
+        )
+        signatures = {
+            "serving_default": self.serving_fn,
+            "search_embedding": search_embedding_fn,
+        }
         keras.backend.set_learning_phase(0)
         tf.saved_model.save(self, export_path, signatures=signatures)
 
@@ -77,12 +110,18 @@ class ScannModel(object):
         dataset: Dataset,
         batch_size: int = 32,
     ):
-        id_data = tf.data.Dataset.from_tensor_slices(dataset.ids)
-        image_data = tf.data.Dataset.from_tensor_slices(dataset.data)
+        self.ids = dataset.ids
+        self.embeddings = self.feature_extraction.predict(
+            dataset.data,
+            batch_size=batch_size,
+        ).astype(np.float32)
+        logger.info(f"embeddings: {self.embeddings.shape}")
+        id_data = tf.data.Dataset.from_tensor_slices(self.ids)
+        embedding_data = tf.data.Dataset.from_tensor_slices(self.embeddings)
         self.x_train_embedding = tf.data.Dataset.zip(
             (
                 id_data.batch(batch_size),
-                image_data.batch(batch_size).map(self.feature_extraction),
+                embedding_data.batch(batch_size),
             )
         )
 
@@ -117,6 +156,7 @@ class ScannModel(object):
         self.scann = Scann(
             feature_extraction=self.feature_extraction,
             model=self.model,
+            embedding_dimension=self.embeddings.shape[1],
         )
 
     def save_as_saved_model(
@@ -126,3 +166,14 @@ class ScannModel(object):
         self.scann.save(export_path=saved_model)
         logger.info(f"saved model: {saved_model}")
         return saved_model
+
+    def save_embedding_store(
+        self,
+        directory: str = "/opt/outputs/embedding_store",
+    ) -> str:
+        os.makedirs(directory, exist_ok=True)
+        np.save(os.path.join(directory, EMBEDDINGS_FILE), self.embeddings)
+        with open(os.path.join(directory, IDS_FILE), "w") as f:
+            json.dump(self.ids, f)
+        logger.info(f"saved embedding store: {directory} {self.embeddings.shape}")
+        return directory
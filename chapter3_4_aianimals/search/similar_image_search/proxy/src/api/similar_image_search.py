@@ -19,7 +19,7 @@ async def post_similar_image_search(
     background_tasks: BackgroundTasks,
     request: AnimalRequest,
 ):
-    data = container.search_similar_image_usecase.search(
+    data = await container.search_similar_image_usecase.search(
         request=request,
         background_tasks=background_tasks,
     )
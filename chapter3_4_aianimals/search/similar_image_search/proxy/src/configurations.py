@@ -10,8 +10,27 @@ class Configurations(object):
     predictor_url = os.getenv("PREDICTOR_URL", "http://localhost:8501/v1/models/similar_image_search:predict")
     predictor_height = int(os.getenv("PREDICTOR_HEIGHT", "224"))
     predictor_width = int(os.getenv("PREDICTOR_WIDTH", "224"))
+    predictor_protocol = os.getenv("PREDICTOR_PROTOCOL", "rest")
+    predictor_grpc_address = os.getenv("PREDICTOR_GRPC_ADDRESS", "localhost:8500")
+    predictor_model_name = os.getenv("PREDICTOR_MODEL_NAME", "similar_image_search")
+
+    http_timeout = float(os.getenv("HTTP_TIMEOUT", 10.0))
+    http_retries = int(os.getenv("HTTP_RETRIES", 3))
+    http_max_connections = int(os.getenv("HTTP_MAX_CONNECTIONS", 100))
+    http_max_keepalive_connections = int(os.getenv("HTTP_MAX_KEEPALIVE_CONNECTIONS", 20))
+    http_keepalive_expiry = float(os.getenv("HTTP_KEEPALIVE_EXPIRY", 60.0))
+    http2 = bool(int(os.getenv("HTTP2", "1")))
+
+    image_download_concurrency = int(os.getenv("IMAGE_DOWNLOAD_CONCURRENCY", 32))
+    image_max_bytes = int(os.getenv("IMAGE_MAX_BYTES", 10 * 1024 * 1024))
+    image_decode_workers = int(os.getenv("IMAGE_DECODE_WORKERS", 4))
+    image_cache_directory = os.getenv("IMAGE_CACHE_DIRECTORY", None)
+    image_cache_max_bytes = int(os.getenv("IMAGE_CACHE_MAX_BYTES", 1024 * 1024 * 1024))
+    image_cache_max_age_second = os.getenv("IMAGE_CACHE_MAX_AGE_SECOND", None)
+    image_cache_max_age_second = int(image_cache_max_age_second) if image_cache_max_age_second else None
 
     threshold = int(os.getenv("THRESHOLD", 100))
+    embedding_store_directory = os.getenv("EMBEDDING_STORE_DIRECTORY", None)
 
     pseudo_prediction = bool(int(os.getenv("PSEUDO_PREDICTION", "0")))
 
@@ -0,0 +1,50 @@
+import json
+import os
+from logging import getLogger
+from typing import Optional
+
+import numpy as np
+
+logger = getLogger(__name__)
+
+EMBEDDINGS_FILE = "embeddings.npy"
+IDS_FILE = "ids.json"
+
+
+class EmbeddingStore(object):
+    def __init__(
+        self,
+        directory: str,
+    ):
+        self.directory = directory
+        with open(os.path.join(directory, IDS_FILE), "r") as f:
+            ids = json.load(f)
+        self.embeddings = np.load(
+            os.path.join(directory, EMBEDDINGS_FILE),
+            mmap_mode="r",
+        )
+        if self.embeddings.ndim != 2 or self.embeddings.shape[0] != len(ids):
+            raise ValueError(f"embeddings {self.embeddings.shape} do not match {len(ids)} ids in {directory}")
+        self.index = {id: i for i, id in enumerate(ids)}
+        logger.info(f"loaded embedding store {directory}: {self.embeddings.shape}")
+
+    @property
+    def dimension(self) -> int:
+        return self.embeddings.shape[1]
+
+    def get(self, id: str) -> Optional[np.ndarray]:
+        i = self.index.get(id)
+        if i is None:
+            return None
+        return np.array(self.embeddings[i : i + 1], dtype=np.float32)
+
+
+def load_embedding_store(directory: str) -> Optional[EmbeddingStore]:
+    if not os.path.exists(os.path.join(directory, IDS_FILE)):
+        logger.info(f"no embedding store found in {directory}; extracting features from images")
+        return None
+    try:
+        return EmbeddingStore(directory=directory)
+    except (OSError, ValueError) as e:
+        logger.error(f"failed to load embedding store {directory}: {e}")
+        return None
@@ -4,6 +4,7 @@ from fastapi import FastAPI
 from prometheus_fastapi_instrumentator import Instrumentator, metrics
 from src.api import health_check, similar_image_search
 from src.configurations import Configurations
+from src.registry.container import container
 
 logger = getLogger(__name__)
 
@@ -19,6 +20,13 @@ app = FastAPI(
     redoc_url=f"{base_prefix}/redoc",
 )
 
+
+@app.on_event("shutdown")
+async def shutdown():
+    await container.image_fetcher.aclose()
+    container.close()
+
+
 app.include_router(
     health_check.router,
     prefix=f"{base_prefix}/health-check",
@@ -1,8 +1,19 @@
+from typing import Optional
+
 from src.configurations import Configurations
 from src.infrastructure.cache_client import AbstractCacheClient, RedisClient
-from src.infrastructure.db_client import AbstractDBClient, DBClient
+from src.infrastructure.db_client import AbstractDBClient, PooledDBClient
+from src.infrastructure.embedding_store import EmbeddingStore, load_embedding_store
+from src.infrastructure.http_client import AbstractHTTPClient, PooledHTTPClient
+from src.infrastructure.image_cache import ImageCache
+from src.infrastructure.image_fetcher import ImageFetcher
 from src.repository.animal_repository import AnimalRepository
-from src.service.predictor import AbstractPredictor, SimilarImageSearchPredictor
+from src.service.predictor import (
+    PREDICTOR_PROTOCOL,
+    AbstractPredictor,
+    SimilarImageSearchGrpcPredictor,
+    SimilarImageSearchPredictor,
+)
 from src.usecase.search_similar_image_usecase import AbstractSearchSimilarImageUsecase, SearchSimilarImageUsecase
 
 
@@ -11,27 +22,89 @@ class Container(object):
         self,
         db_client: AbstractDBClient,
         cache_client: AbstractCacheClient,
+        http_client: AbstractHTTPClient,
+        image_fetcher: ImageFetcher,
         predictor: AbstractPredictor,
+        embedding_store: Optional[EmbeddingStore] = None,
     ):
         self.db_client = db_client
         self.cache_client = cache_client
+        self.http_client = http_client
+        self.image_fetcher = image_fetcher
         self.predictor = predictor
+        self.embedding_store = embedding_store
 
         self.animal_repository: AnimalRepository = AnimalRepository(db_client=self.db_client)
         self.search_similar_image_usecase: AbstractSearchSimilarImageUsecase = SearchSimilarImageUsecase(
             animal_repository=self.animal_repository,
             cache_client=self.cache_client,
             predictor=self.predictor,
+            image_fetcher=self.image_fetcher,
             threshold=Configurations.threshold,
+            embedding_store=self.embedding_store,
         )
 
+    def close(self):
+        self.http_client.close()
 
-container = Container(
-    db_client=DBClient(),
-    cache_client=RedisClient(),
-    predictor=SimilarImageSearchPredictor(
+
+http_client: AbstractHTTPClient = PooledHTTPClient(
+    timeout=Configurations.http_timeout,
+    retries=Configurations.http_retries,
+    max_connections=Configurations.http_max_connections,
+    max_keepalive_connections=Configurations.http_max_keepalive_connections,
+    keepalive_expiry=Configurations.http_keepalive_expiry,
+    http2=Configurations.http2,
+)
+
+image_cache: Optional[ImageCache] = None
+if Configurations.image_cache_directory is not None:
+    image_cache = ImageCache(
+        directory=Configurations.image_cache_directory,
+        max_bytes=Configurations.image_cache_max_bytes,
+        max_age_second=Configurations.image_cache_max_age_second,
+    )
+
+image_fetcher = ImageFetcher(
+    timeout=Configurations.http_timeout,
+    retries=Configurations.http_retries,
+    concurrency=Configurations.image_download_concurrency,
+    max_connections=Configurations.http_max_connections,
+    max_keepalive_connections=Configurations.http_max_keepalive_connections,
+    keepalive_expiry=Configurations.http_keepalive_expiry,
+    http2=Configurations.http2,
+    max_bytes=Configurations.image_max_bytes,
+    size=(Configurations.predictor_height, Configurations.predictor_width),
+    decode_workers=Configurations.image_decode_workers,
+    image_cache=image_cache,
+)
+
+predictor: AbstractPredictor
+if Configurations.predictor_protocol == PREDICTOR_PROTOCOL.GRPC.value:
+    predictor = SimilarImageSearchGrpcPredictor(
+        address=Configurations.predictor_grpc_address,
+        model_name=Configurations.predictor_model_name,
+        height=Configurations.predictor_height,
+        width=Configurations.predictor_width,
+        timeout=Configurations.http_timeout,
+    )
+else:
+    predictor = SimilarImageSearchPredictor(
+        http_client=http_client,
         url=Configurations.predictor_url,
         height=Configurations.predictor_height,
         width=Configurations.predictor_width,
-    ),
+    )
+
+embedding_store: Optional[EmbeddingStore] = None
+if Configurations.embedding_store_directory is not None:
+    embedding_store = load_embedding_store(directory=Configurations.embedding_store_directory)
+
+container = Container(
+    db_client=PooledDBClient(),
+    cache_client=RedisClient(),
+    http_client=http_client,
+    image_fetcher=image_fetcher,
+    predictor=predictor,
+    embedding_store=embedding_store,
 )
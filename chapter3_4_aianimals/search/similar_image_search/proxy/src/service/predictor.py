@@ -1,16 +1,33 @@
 import json
 from abc import ABC, abstractmethod
+from enum import Enum
 from logging import getLogger
 from typing import Dict, List, Optional
 
-import httpx
+import grpc
 import numpy as np
+import tensorflow as tf
 from PIL import Image
 from pydantic import BaseModel
+from src.infrastructure.http_client import AbstractHTTPClient
+from tensorflow_serving.apis import predict_pb2, prediction_service_pb2_grpc
 
 logger = getLogger(__name__)
 
 
+class PREDICTOR_PROTOCOL(Enum):
+    REST = "rest"
+    GRPC = "grpc"
+
+    @staticmethod
+    def has_value(value: str) -> bool:
+        return value in [v.value for v in PREDICTOR_PROTOCOL.__members__.values()]
+
+    @staticmethod
+    def get_list() -> List[str]:
+        return [v.value for v in PREDICTOR_PROTOCOL.__members__.values()]
+
+
 class Prediction(BaseModel):
     animal_ids: List[str]
     similarities: List[float]
@@ -38,30 +55,36 @@ class AbstractPredictor(ABC):
     ) -> Optional[Prediction]:
         raise NotImplementedError
 
+    @abstractmethod
+    def predict_by_embedding(
+        self,
+        embedding: np.ndarray,
+    ) -> Optional[Prediction]:
+        raise NotImplementedError
+
 
 class SimilarImageSearchPredictor(AbstractPredictor):
     def __init__(
         self,
+        http_client: AbstractHTTPClient,
         url: str = "http://localhost:8501/v1/models/similar_image_search:predict",
+        embedding_signature_name: str = "search_embedding",
         height: int = 224,
         width: int = 224,
-        timeout: float = 10.0,
-        retries: int = 3,
     ):
+        self.http_client = http_client
         self.url = url
+        self.embedding_signature_name = embedding_signature_name
         self.height = height
         self.width = width
-        self.timeout = timeout
-        self.transport = httpx.HTTPTransport(
-            retries=retries,
-        )
         self.headers = {"Content-Type": "application/json"}
 
     def _preprocess(
         self,
         img: Image,
     ) -> np.ndarray:
-        img = img.resize((self.height, self.width))
+        if img.size != (self.height, self.width):
+            img = img.resize((self.height, self.width))
         array = np.array(img).reshape((1, self.height, self.width, 3)).astype(np.float32) / 255.0
         return array
 
@@ -77,15 +100,31 @@ class SimilarImageSearchPredictor(AbstractPredictor):
                 "image": img_list,
             },
         }
-        with httpx.Client(
-            timeout=self.timeout,
-            transport=self.transport,
-        ) as client:
-            res = client.post(
-                self.url,
-                data=json.dumps(request_dict),
-                headers=self.headers,
-            )
+        return self.__post(request_dict=request_dict)
+
+    def _predict_embedding(
+        self,
+        embedding: np.ndarray,
+        k: int = 32,
+    ) -> Optional[Dict]:
+        request_dict = {
+            "signature_name": self.embedding_signature_name,
+            "inputs": {
+                "k": k,
+                "embedding": embedding.tolist(),
+            },
+        }
+        return self.__post(request_dict=request_dict)
+
+    def __post(
+        self,
+        request_dict: Dict,
+    ) -> Optional[Dict]:
+        res = self.http_client.client.post(
+            self.url,
+            data=json.dumps(request_dict),
+            headers=self.headers,
+        )
         if res.status_code != 200:
             logger.error(f"prediction failed")
             return None
@@ -105,3 +144,163 @@ class SimilarImageSearchPredictor(AbstractPredictor):
             animal_ids=prediction["output_1"][0],
             similarities=prediction["output_0"][0],
         )
+
+    def predict_by_embedding(
+        self,
+        embedding: np.ndarray,
+    ) -> Optional[Prediction]:
+        prediction = self._predict_embedding(embedding=embedding)
+        if prediction is None:
+            return None
+        return Prediction(
+            animal_ids=prediction["output_1"][0],
+            similarities=prediction["output_0"][0],
+        )
+
+
+class SimilarImageSearchGrpcPredictor(AbstractPredictor):
+    def __init__(
+        self,
+        address: str = "localhost:8500",
+        model_name: str = "similar_image_search",
+        signature_name: str = "serving_default",
+        embedding_signature_name: str = "search_embedding",
+        height: int = 224,
+        width: int = 224,
+        timeout: float = 10.0,
+    ):
+        self.address = address
+        self.model_name = model_name
+        self.signature_name = signature_name
+        self.embedding_signature_name = embedding_signature_name
+        self.height = height
+        self.width = width
+        self.timeout = timeout
+        self.channel = grpc.insecure_channel(self.address)
+        self.stub = prediction_service_pb2_grpc.PredictionServiceStub(self.channel)
+
+    def _preprocess(
+        self,
+        img: Image,
+    ) -> np.ndarray:
+        if img.size != (self.height, self.width):
+            img = img.resize((self.height, self.width))
+        array = np.array(img).reshape((1, self.height, self.width, 3)).astype(np.float32) / 255.0
+        return array
+
+    def make_request(
+        self,
+        img_array: np.ndarray,
+        k: int = 32,
+    ) -> predict_pb2.PredictRequest:
+        return self.__make_request(
+            signature_name=self.signature_name,
+            input_name="image",
+            array=img_array,
+            k=k,
+        )
+
+    def make_embedding_request(
+        self,
+        embedding: np.ndarray,
+        k: int = 32,
+    ) -> predict_pb2.PredictRequest:
+        return self.__make_request(
+            signature_name=self.embedding_signature_name,
+            input_name="embedding",
+            array=embedding,
+            k=k,
+        )
+
+    def __make_request(
+        self,
+        signature_name: str,
+        input_name: str,
+        array: np.ndarray,
+        k: int = 32,
+    ) -> predict_pb2.PredictRequest:
+        request = predict_pb2.PredictRequest()
+        request.model_spec.name = self.model_name
+        request.model_spec.signature_name = signature_name
+        request.inputs[input_name].CopyFrom(
+            tf.make_tensor_proto(
+                array,
+                dtype=tf.float32,
+            )
+        )
+        request.inputs["k"].CopyFrom(
+            tf.make_tensor_proto(
+                [k],
+                dtype=tf.int32,
+            )
+        )
+        return request
+
+    def _predict(
+        self,
+        img_array: np.ndarray,
+        k: int = 32,
+    ) -> Optional[Dict]:
+        request = self.make_request(
+            img_array=img_array,
+            k=k,
+        )
+        return self.__call(request=request)
+
+    def _predict_embedding(
+        self,
+        embedding: np.ndarray,
+        k: int = 32,
+    ) -> Optional[Dict]:
+        request = self.make_embedding_request(
+            embedding=embedding,
+            k=k,
+        )
+        return self.__call(request=request)
+
+    def __call(
+        self,
+        request: predict_pb2.PredictRequest,
+    ) -> Optional[Dict]:
+        try:
+            response = self.stub.Predict(
+                request,
+                timeout=self.timeout,
+            )
+        except grpc.RpcError as e:
+            logger.error(f"prediction failed: {e}")
+            return None
+        prediction = {
+            "output_0": tf.make_ndarray(response.outputs["output_0"]).tolist(),
+            "output_1": [
+                [animal_id.decode("utf-8") for animal_id in animal_ids]
+                for animal_ids in tf.make_ndarray(response.outputs["output_1"])
+            ],
+        }
+        logger.info(f"prediction: {prediction}")
+        return prediction
+
+    def predict(
+        self,
+        img: Image,
+    ) -> Optional[Prediction]:
+        img_array = self._preprocess(img=img)
+        prediction = self._predict(img_array=img_array)
+        if prediction is None:
+            return None
+        return Prediction(
+            animal_ids=prediction["output_1"][0],
+            similarities=prediction["output_0"][0],
+        )
+
+    def predict_by_embedding(
+        self,
+        embedding: np.ndarray,
+    ) -> Optional[Prediction]:
+        prediction = self._predict_embedding(embedding=embedding)
+        if prediction is None:
+            return None
+        return Prediction(
+            animal_ids=prediction["output_1"][0],
+            similarities=prediction["output_0"][0],
+        )
@@ -1,13 +1,13 @@
 from abc import ABC, abstractmethod
-from io import BytesIO
 from logging import getLogger
-from typing import List
+from typing import List, Optional
 
-import httpx
 from fastapi import BackgroundTasks
-from PIL import Image
+from fastapi.concurrency import run_in_threadpool
 from src.configurations import Configurations
 from src.infrastructure.cache_client import AbstractCacheClient
+from src.infrastructure.embedding_store import EmbeddingStore
+from src.infrastructure.image_fetcher import ImageFetcher
 from src.repository.animal_repository import AnimalQuery, AnimalRepository
 from src.schema.animal import AnimalRequest, AnimalResponse
 from src.service.predictor import AbstractPredictor
@@ -21,21 +21,19 @@ class AbstractSearchSimilarImageUsecase(ABC):
         animal_repository: AnimalRepository,
         cache_client: AbstractCacheClient,
         predictor: AbstractPredictor,
+        image_fetcher: ImageFetcher,
         threshold: int = 100,
-        timeout: float = 10.0,
-        retries: int = 3,
+        embedding_store: Optional[EmbeddingStore] = None,
     ):
         self.animal_repository = animal_repository
         self.cache_client = cache_client
         self.predictor = predictor
+        self.image_fetcher = image_fetcher
         self.threshold = threshold
-        self.timeout = timeout
-        self.transport = httpx.HTTPTransport(
-            retries=retries,
-        )
+        self.embedding_store = embedding_store
 
     @abstractmethod
-    def search(
+    async def search(
         self,
         request: AnimalRequest,
         background_tasks: BackgroundTasks,
@@ -49,17 +47,17 @@ class SearchSimilarImageUsecase(AbstractSearchSimilarImageUsecase):
         animal_repository: AnimalRepository,
         cache_client: AbstractCacheClient,
         predictor: AbstractPredictor,
+        image_fetcher: ImageFetcher,
         threshold: int = 100,
-        timeout: float = 10.0,
-        retries: int = 3,
+        embedding_store: Optional[EmbeddingStore] = None,
     ):
         super().__init__(
             animal_repository=animal_repository,
             cache_client=cache_client,
             predictor=predictor,
+            image_fetcher=image_fetcher,
             threshold=threshold,
-            timeout=timeout,
-            retries=retries,
+            embedding_store=embedding_store,
         )
 
     def __set_prediction_cache(
@@ -75,7 +73,7 @@ class SearchSimilarImageUsecase(AbstractSearchSimilarImageUsecase):
             # 6 hours
         )
 
-    def search(
+    async def search(
         self,
         request: AnimalRequest,
         background_tasks: BackgroundTasks,
@@ -88,7 +86,8 @@ class SearchSimilarImageUsecase(AbstractSearchSimilarImageUsecase):
             logger.info(f"cache hit: {cache_key}")
             return AnimalResponse(ids=cached_data.split(","))
 
-        source_animals = self.animal_repository.select(
+        source_animals = await run_in_threadpool(
+            self.animal_repository.select,
             animal_query=AnimalQuery(id=request.id),
             limit=1,
             offset=0,
@@ -98,21 +97,21 @@ class SearchSimilarImageUsecase(AbstractSearchSimilarImageUsecase):
             return AnimalResponse(ids=[])
         source_animal = source_animals[0]
 
-        with httpx.Client(
-            timeout=self.timeout,
-            transport=self.transport,
-        ) as client:
-            res = client.get(source_animal.photo_url)
-        if res.status_code != 200:
-            logger.error(f"failed to download {source_animal.id} {source_animal.photo_url}")
-            return AnimalResponse(ids=[])
-        img = Image.open(BytesIO(res.content))
-        if img.mode == "RGBA":
-            img_rgb = Image.new("RGB", (img.height, img.width), (255, 255, 255))
-            img_rgb.paste(img, mask=img.split()[3])
-            img = img_rgb
+        prediction = None
+        if self.embedding_store is not None:
+            embedding = self.embedding_store.get(id=source_animal.id)
+            if embedding is not None:
+                prediction = await run_in_threadpool(self.predictor.predict_by_embedding, embedding=embedding)
+            else:
+                logger.info(f"no stored embedding: {source_animal.id}")
+
+        if prediction is None:
+            img = await self.image_fetcher.fetch(url=source_animal.photo_url)
+            if img is None:
+                logger.error(f"failed to download {source_animal.id} {source_animal.photo_url}")
+                return AnimalResponse(ids=[])
+            prediction = await run_in_threadpool(self.predictor.predict, img=img)
 
-        prediction = self.predictor.predict(img=img)
         if prediction is None:
             logger.error(f"failed to search {source_animal.id}")
             return AnimalResponse(ids=[])
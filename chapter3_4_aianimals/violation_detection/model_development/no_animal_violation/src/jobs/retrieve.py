@@ -5,6 +5,7 @@ from typing import List, Optional
 
 import httpx
 from PIL import Image
+from src.middleware.image_cache import ImageCache
 from src.middleware.logger import configure_logger
 
 logger = configure_logger(__name__)
@@ -13,6 +14,7 @@ logger = configure_logger(__name__)
 def download_dataset(
     filepaths: List[str],
     destination_directory: str,
+    image_cache: Optional[ImageCache] = None,
 ) -> List[str]:
     logger.info("start downloading image")
     os.makedirs(destination_directory, exist_ok=True)
@@ -31,6 +33,7 @@ def download_dataset(
             download_files(
                 filepaths=fs,
                 destination_directory=destination_directory,
+                image_cache=image_cache,
             )
         )
         destination_paths.extend(_destination_paths)
@@ -42,6 +45,7 @@ def download_dataset(
 async def download_files(
     filepaths: List[str],
     destination_directory: str,
+    image_cache: Optional[ImageCache] = None,
 ) -> List[str]:
     tasks = []
     timeout = 10.0
@@ -55,7 +59,7 @@ async def download_files(
         for f in filepaths:
             basename = os.path.basename(f)
             d = os.path.join(destination_directory, basename)
-            tasks.append(download_file(client, f, d))
+            tasks.append(download_file(client, f, d, image_cache))
         destination_paths = await asyncio.gather(*tasks)
     return destination_paths
 
@@ -64,19 +68,44 @@ async def download_file(
     client: httpx.AsyncClient,
     source_path: str,
     destination_path: str,
+    image_cache: Optional[ImageCache] = None,
 ) -> Optional[str]:
     logger.info(f"download {source_path}: {destination_path}")
     if os.path.exists(destination_path):
         return destination_path
-    try:
-        res = await client.get(source_path)
-    except httpx.PoolTimeout as e:
-        logger.error(f"timeout {e}: failed to download data: {source_path}")
-        return None
-    if res.status_code != 200:
-        logger.error(f"status code {res.status_code}: failed to download data: {source_path}")
-        return None
-    img = Image.open(BytesIO(res.content))
+    content = None
+    entry = None
+    if image_cache is not None:
+        entry = image_cache.lookup(url=source_path)
+        if entry is not None and image_cache.is_fresh(entry=entry):
+            content = image_cache.read(digest=entry["digest"])
+    if content is None:
+        etag = None if entry is None else entry["etag"]
+        try:
+            res = await client.get(
+                source_path,
+                headers={} if etag is None else {"If-None-Match": etag},
+            )
+            if res.status_code == 304:
+                image_cache.revalidate(url=source_path)
+                content = image_cache.read(digest=entry["digest"])
+                if content is None:
+                    res = await client.get(source_path)
+        except httpx.PoolTimeout as e:
+            logger.error(f"timeout {e}: failed to download data: {source_path}")
+            return None
+    if content is None:
+        if res.status_code != 200:
+            logger.error(f"status code {res.status_code}: failed to download data: {source_path}")
+            return None
+        content = res.content
+        if image_cache is not None:
+            image_cache.put(
+                url=source_path,
+                content=content,
+                etag=res.headers.get("ETag"),
+            )
+    img = Image.open(BytesIO(content))
     if img.mode == "RGB":
         img = img
     elif img.mode == "RGBA":
@@ -12,6 +12,7 @@ from src.jobs.retrieve import download_dataset
 from src.jobs.save import save_as_saved_model, save_as_tflite
 from src.jobs.train import initialize_model, train_and_evaluate
 from src.middleware.file_utils import read_text
+from src.middleware.image_cache import ImageCache
 from src.middleware.logger import configure_logger
 
 logger = configure_logger(__name__)
@@ -51,21 +52,31 @@ def main(cfg: DictConfig):
                 positive_filepaths=positive_test_files,
             ),
         )
+        image_cache_max_age_second = os.getenv("IMAGE_CACHE_MAX_AGE_SECOND", None)
+        image_cache = ImageCache(
+            directory=os.getenv("IMAGE_CACHE_DIRECTORY", "/opt/outputs/image_cache"),
+            max_bytes=int(os.getenv("IMAGE_CACHE_MAX_BYTES", str(10 * 1024 * 1024 * 1024))),
+            max_age_second=int(image_cache_max_age_second) if image_cache_max_age_second else None,
+        )
         downloaded_negative_train_files = download_dataset(
             filepaths=train_test_dataset.train_dataset.negative_filepaths,
             destination_directory="/opt/data/train/images",
+            image_cache=image_cache,
         )
         downloaded_positive_train_files = download_dataset(
             filepaths=train_test_dataset.train_dataset.positive_filepaths,
             destination_directory="/opt/data/train/no_animal_images",
+            image_cache=image_cache,
         )
         downloaded_negative_test_files = download_dataset(
             filepaths=train_test_dataset.test_dataset.negative_filepaths,
             destination_directory="/opt/data/test/images",
+            image_cache=image_cache,
         )
         downloaded_positive_test_files = download_dataset(
             filepaths=train_test_dataset.test_dataset.positive_filepaths,
             destination_directory="/opt/data/test/no_animal_images",
+            image_cache=image_cache,
         )
         train_test_dataset = TrainTestDataset(
             train_dataset=Dataset(
@@ -0,0 +1,117 @@
+import json
+import logging
+import statistics
+import time
+from typing import Callable, List, Optional
+
+import click
+import numpy as np
+from PIL import Image
+from src.benchmark.stand_in_server import serve
+from src.service.predictor import AbstractPredictor, NoViolationDetectionGrpcPredictor, NoViolationDetectionPredictor
+
+logger = logging.getLogger(__name__)
+
+
+def measure(
+    predict: Callable[[], Optional[object]],
+    repeat: int,
+) -> List[float]:
+    latencies = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        if predict() is None:
+            raise ValueError("prediction failed")
+        latencies.append(time.perf_counter() - start)
+    return latencies
+
+
+def report(
+    name: str,
+    request_bytes: int,
+    latencies: List[float],
+):
+    latencies = sorted(latencies)
+    logger.info(
+        f"{name}: {request_bytes} bytes per request, "
+        f"mean {statistics.mean(latencies) * 1000:.2f}ms, "
+        f"p50 {latencies[len(latencies) // 2] * 1000:.2f}ms, "
+        f"p99 {latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))] * 1000:.2f}ms"
+    )
+
+
+@click.command()
+@click.option(
+    "--rest_url",
+    type=str,
+    required=False,
+    help="tf serving rest predict url; a local stand-in server is used if omitted",
+)
+@click.option(
+    "--grpc_address",
+    type=str,
+    required=False,
+    help="tf serving grpc address; a local stand-in server is used if omitted",
+)
+@click.option(
+    "--repeat",
+    type=int,
+    default=50,
+)
+def main(
+    rest_url: Optional[str] = None,
+    grpc_address: Optional[str] = None,
+    repeat: int = 50,
+):
+    logging.basicConfig(
+        level=logging.INFO,
+        format="[%(asctime)s] [%(levelname)s] [%(name)s:%(lineno)d] %(message)s",
+    )
+    logging.getLogger("src.service.predictor").setLevel(logging.WARNING)
+    servers = None
+    if rest_url is None or grpc_address is None:
+        servers = serve()
+        _, grpc_port, _, rest_port = servers
+        rest_url = rest_url or f"http://localhost:{rest_port}/v1/models/no_animal_violation:predict"
+        grpc_address = grpc_address or f"localhost:{grpc_port}"
+
+    img = Image.fromarray(np.random.randint(0, 256, (480, 640, 3), dtype=np.uint8))
+    rest_predictor: AbstractPredictor = NoViolationDetectionPredictor(url=rest_url)
+    grpc_predictor = NoViolationDetectionGrpcPredictor(address=grpc_address)
+    img_array = rest_predictor._preprocess(img=img)
+
+    rest_bytes = len(json.dumps({"inputs": {"keras_layer_input": img_array.tolist()}}))
+    grpc_bytes = grpc_predictor.make_request(img_array=img_array).ByteSize()
+
+    rest_prediction = rest_predictor.predict(img=img)
+    grpc_prediction = grpc_predictor.predict(img=img)
+    if rest_prediction is None or grpc_prediction is None:
+        raise ValueError("prediction failed")
+    if not np.isclose(rest_prediction.violation_probability, grpc_prediction.violation_probability):
+        raise ValueError(f"predictions differ: rest {rest_prediction}, grpc {grpc_prediction}")
+
+    report(
+        name="rest json",
+        request_bytes=rest_bytes,
+        latencies=measure(
+            predict=lambda: rest_predictor.predict(img=img),
+            repeat=repeat,
+        ),
+    )
+    report(
+        name="grpc tensor",
+        request_bytes=grpc_bytes,
+        latencies=measure(
+            predict=lambda: grpc_predictor.predict(img=img),
+            repeat=repeat,
+        ),
+    )
+
+    if servers is not None:
+        grpc_server, _, rest_server, _ = servers
+        grpc_server.stop(grace=None)
+        rest_server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+import json
+import logging
+import threading
+from concurrent import futures
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import List, Tuple
+
+import grpc
+import numpy as np
+import tensorflow as tf
+from tensorflow_serving.apis import predict_pb2, prediction_service_pb2_grpc
+
+logger = logging.getLogger(__name__)
+
+STAND_IN_OUTPUT = [0.9, 0.1]
+
+
+def make_stand_in_outputs(batch_size: int) -> np.ndarray:
+    return np.tile(np.array([STAND_IN_OUTPUT], dtype=np.float32), (batch_size, 1))
+
+
+class StandInPredictionService(prediction_service_pb2_grpc.PredictionServiceServicer):
+    def Predict(self, request, context):
+        inputs = [tf.make_ndarray(tensor) for tensor in request.inputs.values()]
+        if len(inputs) != 1:
+            context.abort(grpc.StatusCode.INVALID_ARGUMENT, "stand-in server takes exactly one input")
+        response = predict_pb2.PredictResponse()
+        response.model_spec.CopyFrom(request.model_spec)
+        response.outputs["dense"].CopyFrom(tf.make_tensor_proto(make_stand_in_outputs(batch_size=inputs[0].shape[0])))
+        return response
+
+
+class StandInRestHandler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        inputs: List = list(body["inputs"].values())
+        array = np.array(inputs[0], dtype=np.float32)
+        response = json.dumps({"outputs": make_stand_in_outputs(batch_size=array.shape[0]).tolist()}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(response)))
+        self.end_headers()
+        self.wfile.write(response)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def serve(
+    grpc_port: int = 0,
+    rest_port: int = 0,
+    max_message_length: int = 64 * 1024 * 1024,
+) -> Tuple[grpc.Server, int, ThreadingHTTPServer, int]:
+    grpc_server = grpc.server(
+        futures.ThreadPoolExecutor(max_workers=4),
+        options=[
+            ("grpc.max_receive_message_length", max_message_length),
+            ("grpc.max_send_message_length", max_message_length),
+        ],
+    )
+    prediction_service_pb2_grpc.add_PredictionServiceServicer_to_server(StandInPredictionService(), grpc_server)
+    grpc_port = grpc_server.add_insecure_port(f"localhost:{grpc_port}")
+    grpc_server.start()
+
+    rest_server = ThreadingHTTPServer(("localhost", rest_port), StandInRestHandler)
+    threading.Thread(
+        target=rest_server.serve_forever,
+        name="stand_in_rest_server",
+        daemon=True,
+    ).start()
+    rest_port = rest_server.server_address[1]
+    logger.info(f"stand-in tf serving: grpc localhost:{grpc_port}, rest localhost:{rest_port}")
+    return grpc_server, grpc_port, rest_server, rest_port
@@ -9,11 +9,23 @@ class Configurations:
     registration_queue = os.getenv("REGISTRATION_QUEUE", "violation")
 
     run = bool(int(os.getenv("RUN", "0")))
+    batch_size = int(os.getenv("BATCH_SIZE", "1"))
+    batch_linger_ms = int(os.getenv("BATCH_LINGER_MS", "1000"))
+    download_concurrency = int(os.getenv("DOWNLOAD_CONCURRENCY", "8"))
+    image_max_bytes = int(os.getenv("IMAGE_MAX_BYTES", str(10 * 1024 * 1024)))
+    image_decode_workers = int(os.getenv("IMAGE_DECODE_WORKERS", "4"))
+    image_cache_directory = os.getenv("IMAGE_CACHE_DIRECTORY", None)
+    image_cache_max_bytes = int(os.getenv("IMAGE_CACHE_MAX_BYTES", str(1024 * 1024 * 1024)))
+    image_cache_max_age_second = os.getenv("IMAGE_CACHE_MAX_AGE_SECOND", None)
+    image_cache_max_age_second = int(image_cache_max_age_second) if image_cache_max_age_second else None
     pseudo_prediction = bool(int(os.getenv("PSEUDO_PREDICTION", "0")))
 
     predictor_url = os.getenv("PREDICTOR_URL", "http://localhost:8501/v1/models/no_animal_violation:predict")
     predictor_height = int(os.getenv("PREDICTOR_HEIGHT", "224"))
     predictor_width = int(os.getenv("PREDICTOR_WIDTH", "224"))
+    predictor_protocol = os.getenv("PREDICTOR_PROTOCOL", "rest")
+    predictor_grpc_address = os.getenv("PREDICTOR_GRPC_ADDRESS", "localhost:8500")
+    predictor_model_name = os.getenv("PREDICTOR_MODEL_NAME", "no_animal_violation")
 
     mlflow_param_json = os.getenv("MLFLOW_PARAM_JSON", None)
     if mlflow_param_json is not None:
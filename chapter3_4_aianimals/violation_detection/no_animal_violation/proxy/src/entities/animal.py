@@ -1,11 +1,12 @@
 from datetime import datetime
-from typing import Optional
+from typing import List, Optional
 
 from pydantic import BaseModel, Extra
 
 
 class AnimalQuery(BaseModel):
     id: Optional[str]
+    ids: Optional[List[str]]
 
     class Config:
         extra = Extra.forbid
@@ -0,0 +1,281 @@
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from importlib.util import find_spec
+from io import BytesIO
+from logging import getLogger
+from typing import Dict, List, Optional, Tuple
+
+import httpx
+import numpy as np
+from PIL import Image
+from src.infrastructure.image_cache import ImageCache
+
+logger = getLogger(__name__)
+
+
+def decode_image(
+    content: bytes,
+    size: Optional[Tuple[int, int]] = None,
+    max_pixels: int = 50_000_000,
+) -> Image.Image:
+    img = Image.open(BytesIO(content))
+    if img.width * img.height > max_pixels:
+        raise ValueError(f"image exceeds {max_pixels} pixels: {img.size}")
+    if img.mode in ("RGBA", "LA") or (img.mode == "P" and "transparency" in img.info):
+        img = img.convert("RGBA")
+        img_rgb = Image.new("RGB", img.size, (255, 255, 255))
+        img_rgb.paste(img, mask=img.split()[3])
+        img = img_rgb
+    elif img.mode != "RGB":
+        img = img.convert("RGB")
+    if size is not None and img.size != size:
+        img = img.resize(size)
+    else:
+        img.load()
+    return img
+
+
+class ImageFetcher(object):
+    def __init__(
+        self,
+        timeout: float = 10.0,
+        retries: int = 3,
+        concurrency: int = 8,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 60.0,
+        http2: bool = False,
+        max_bytes: int = 10 * 1024 * 1024,
+        max_pixels: int = 50_000_000,
+        size: Optional[Tuple[int, int]] = None,
+        decode_workers: int = 4,
+        image_cache: Optional[ImageCache] = None,
+    ):
+        self.timeout = timeout
+        self.retries = retries
+        self.concurrency = concurrency
+        self.limits = httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self.http2 = http2 and find_spec("h2") is not None
+        if http2 and not self.http2:
+            logger.info("h2 is not installed; falling back to HTTP/1.1")
+        self.max_bytes = max_bytes
+        self.max_pixels = max_pixels
+        self.size = size
+        self.image_cache = image_cache
+        self.decode_executor = ThreadPoolExecutor(
+            max_workers=decode_workers,
+            thread_name_prefix="image_decode",
+        )
+        self.__client: Optional[httpx.AsyncClient] = None
+        self.__semaphore: Optional[asyncio.Semaphore] = None
+        self.__loop: Optional[asyncio.AbstractEventLoop] = None
+        self.__thread: Optional[threading.Thread] = None
+        logger.info(f"initialized image fetcher: concurrency {concurrency}, {self.limits}, http2: {self.http2}")
+
+    def __get_client(self) -> httpx.AsyncClient:
+        if self.__client is None:
+            self.__client = httpx.AsyncClient(
+                timeout=self.timeout,
+                transport=httpx.AsyncHTTPTransport(
+                    retries=self.retries,
+                    limits=self.limits,
+                    http2=self.http2,
+                ),
+            )
+            self.__semaphore = asyncio.Semaphore(self.concurrency)
+        return self.__client
+
+    async def __download(
+        self,
+        url: str,
+        etag: Optional[str] = None,
+    ) -> Tuple[int, Optional[bytes], Optional[str]]:
+        client = self.__get_client()
+        headers = {} if etag is None else {"If-None-Match": etag}
+        async with self.__semaphore:
+            async with client.stream("GET", url, headers=headers) as res:
+                if res.status_code == 304:
+                    return res.status_code, None, etag
+                if res.status_code != 200:
+                    logger.error(f"failed to download {url}: {res.status_code}")
+                    return res.status_code, None, None
+                content_length = res.headers.get("Content-Length")
+                if content_length is not None and int(content_length) > self.max_bytes:
+                    logger.error(f"failed to download {url}: {content_length} bytes exceeds {self.max_bytes}")
+                    return res.status_code, None, None
+                chunks: List[bytes] = []
+                received = 0
+                async for chunk in res.aiter_bytes():
+                    received += len(chunk)
+                    if received > self.max_bytes:
+                        logger.error(f"failed to download {url}: exceeds {self.max_bytes} bytes")
+                        return res.status_code, None, None
+                    chunks.append(chunk)
+        return res.status_code, b"".join(chunks), res.headers.get("ETag")
+
+    def __decode(
+        self,
+        url: str,
+        content: bytes,
+    ) -> Optional[Image.Image]:
+        try:
+            return decode_image(
+                content=content,
+                size=self.size,
+                max_pixels=self.max_pixels,
+            )
+        except (OSError, ValueError, Image.DecompressionBombError) as e:
+            logger.error(f"failed to decode {url}: {e}")
+            return None
+
+    def __put_variant(
+        self,
+        digest: str,
+        img: Image.Image,
+    ):
+        if self.size is not None:
+            self.image_cache.put_variant(
+                digest=digest,
+                size=self.size,
+                array=np.asarray(img),
+            )
+
+    def __decode_and_cache(
+        self,
+        url: str,
+        content: bytes,
+        etag: Optional[str] = None,
+    ) -> Optional[Image.Image]:
+        img = self.__decode(
+            url=url,
+            content=content,
+        )
+        if img is not None and self.image_cache is not None:
+            digest = self.image_cache.put(
+                url=url,
+                content=content,
+                etag=etag,
+            )
+            self.__put_variant(
+                digest=digest,
+                img=img,
+            )
+        return img
+
+    def __load_cached(
+        self,
+        url: str,
+        digest: str,
+    ) -> Optional[Image.Image]:
+        if self.size is not None:
+            array = self.image_cache.read_variant(
+                digest=digest,
+                size=self.size,
+            )
+            if array is not None:
+                return Image.fromarray(array)
+        content = self.image_cache.read(digest=digest)
+        if content is None:
+            return None
+        img = self.__decode(
+            url=url,
+            content=content,
+        )
+        if img is not None:
+            self.__put_variant(
+                digest=digest,
+                img=img,
+            )
+        return img
+
+    async def fetch(
+        self,
+        url: str,
+    ) -> Optional[Image.Image]:
+        loop = asyncio.get_running_loop()
+        entry: Optional[Dict] = None
+        if self.image_cache is not None:
+            entry = await loop.run_in_executor(self.decode_executor, self.image_cache.lookup, url)
+            if entry is not None and self.image_cache.is_fresh(entry=entry):
+                img = await loop.run_in_executor(self.decode_executor, self.__load_cached, url, entry["digest"])
+                if img is not None:
+                    return img
+        try:
+            status, content, etag = await self.__download(
+                url=url,
+                etag=None if entry is None else entry["etag"],
+            )
+            if status == 304:
+                await loop.run_in_executor(self.decode_executor, self.image_cache.revalidate, url)
+                img = await loop.run_in_executor(self.decode_executor, self.__load_cached, url, entry["digest"])
+                if img is not None:
+                    return img
+                status, content, etag = await self.__download(url=url)
+        except httpx.HTTPError as e:
+            logger.error(f"failed to download {url}: {e}")
+            return None
+        if content is None:
+            return None
+        return await loop.run_in_executor(
+            self.decode_executor,
+            partial(
+                self.__decode_and_cache,
+                url=url,
+                content=content,
+                etag=etag,
+            ),
+        )
+
+    async def fetch_many(
+        self,
+        urls: List[str],
+    ) -> List[Optional[Image.Image]]:
+        return list(await asyncio.gather(*[self.fetch(url=url) for url in urls]))
+
+    def __get_loop(self) -> asyncio.AbstractEventLoop:
+        if self.__loop is None:
+            self.__loop = asyncio.new_event_loop()
+            self.__thread = threading.Thread(
+                target=self.__loop.run_forever,
+                name="image_fetcher",
+                daemon=True,
+            )
+            self.__thread.start()
+        return self.__loop
+
+    def fetch_sync(
+        self,
+        url: str,
+    ) -> Optional[Image.Image]:
+        return self.fetch_many_sync(urls=[url])[0]
+
+    def fetch_many_sync(
+        self,
+        urls: List[str],
+    ) -> List[Optional[Image.Image]]:
+        future = asyncio.run_coroutine_threadsafe(
+            self.fetch_many(urls=urls),
+            self.__get_loop(),
+        )
+        return future.result()
+
+    async def aclose(self):
+        if self.__client is not None:
+            await self.__client.aclose()
+            self.__client = None
+        self.decode_executor.shutdown(wait=False)
+
+    def close(self):
+        if self.__loop is None:
+            return
+        asyncio.run_coroutine_threadsafe(self.aclose(), self.__loop).result()
+        self.__loop.call_soon_threadsafe(self.__loop.stop)
+        self.__thread.join()
+        self.__loop.close()
+        self.__loop = None
@@ -1,7 +1,7 @@
 import json
 import logging
 import os
-from typing import Dict
+from typing import Dict, List
 
 import pika
 
@@ -42,3 +42,14 @@ class RabbitmqMessaging(object):
             body=json.dumps(body),
             properties=self.properties,
         )
+
+    def publish_many(
+        self,
+        queue_name: str,
+        bodies: List[Dict],
+    ):
+        for body in bodies:
+            self.publish(
+                queue_name=queue_name,
+                body=body,
+            )
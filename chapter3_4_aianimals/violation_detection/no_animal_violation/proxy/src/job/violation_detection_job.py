@@ -1,13 +1,12 @@
 import json
 import logging
-from io import BytesIO
-from typing import Dict, Optional
+import time
+from typing import Dict, List, Optional, Tuple
 
-import httpx
-from PIL import Image
 from src.configurations import Configurations
 from src.entities.animal import AnimalModel, AnimalQuery
 from src.entities.violation_type import ViolationTypeQuery
+from src.infrastructure.image_fetcher import ImageFetcher
 from src.infrastructure.messaging import RabbitmqMessaging
 from src.repository.animal_repository import AbstractAnimalRepository
 from src.repository.violation_type_repository import AbstractViolationTypeRepository
@@ -21,26 +20,24 @@ class ViolationDetectionJob(object):
         animal_repository: AbstractAnimalRepository,
         violation_type_repository: AbstractViolationTypeRepository,
         predictor: AbstractPredictor,
-        timeout: float = 10.0,
-        retries: int = 3,
+        image_fetcher: ImageFetcher,
     ):
         self.logger = logging.getLogger(__name__)
         self.messaging = messaging
         self.animal_repository = animal_repository
         self.violation_type_repository = violation_type_repository
         self.predictor = predictor
+        self.image_fetcher = image_fetcher
 
         _v = self.violation_type_repository.select(query=ViolationTypeQuery(name="no_animal_violation"))
         self.violation_type_id = _v[0].id
-        self.timeout = timeout
-        self.transport = httpx.HTTPTransport(
-            retries=retries,
-        )
 
     def run(
         self,
         consuming_queue: str,
         registration_queue: str,
+        batch_size: int = 1,
+        linger_ms: int = 1000,
     ):
         def callback(ch, method, properties, body):
             data = json.loads(body)
@@ -79,19 +76,123 @@ class ViolationDetectionJob(object):
                 queue=registration_queue,
                 durable=True,
             )
-            self.messaging.channel.basic_qos(prefetch_count=1)
-            self.messaging.channel.basic_consume(
-                queue=consuming_queue,
-                on_message_callback=callback,
-            )
-            self.logger.info(f"Waiting for {consuming_queue} queue...")
-            self.messaging.channel.start_consuming()
+            self.messaging.channel.basic_qos(prefetch_count=batch_size)
+            if batch_size > 1:
+                self.run_batch(
+                    consuming_queue=consuming_queue,
+                    registration_queue=registration_queue,
+                    batch_size=batch_size,
+                    linger_ms=linger_ms,
+                )
+            else:
+                self.messaging.channel.basic_consume(
+                    queue=consuming_queue,
+                    on_message_callback=callback,
+                )
+                self.logger.info(f"Waiting for {consuming_queue} queue...")
+                self.messaging.channel.start_consuming()
 
         except Exception as e:
             self.logger.exception(e)
             raise e
         finally:
             self.messaging.close()
+            self.image_fetcher.close()
+
+    def run_batch(
+        self,
+        consuming_queue: str,
+        registration_queue: str,
+        batch_size: int = 32,
+        linger_ms: int = 1000,
+    ):
+        linger_second = linger_ms / 1000
+        messages: List[Tuple[int, str]] = []
+        deadline = 0.0
+        self.logger.info(f"Waiting for {consuming_queue} queue in batch of {batch_size}...")
+        for method, _, body in self.messaging.channel.consume(
+            queue=consuming_queue,
+            inactivity_timeout=linger_second,
+        ):
+            if method is not None:
+                try:
+                    animal_id = json.loads(body)["id"]
+                except (ValueError, TypeError, KeyError) as e:
+                    self.logger.error(f"malformed message; drop {method.delivery_tag}: {body!r} {e}")
+                    self.messaging.channel.basic_reject(
+                        delivery_tag=method.delivery_tag,
+                        requeue=False,
+                    )
+                    continue
+                if len(messages) == 0:
+                    deadline = time.monotonic() + linger_second
+                messages.append((method.delivery_tag, animal_id))
+            if len(messages) > 0 and (len(messages) >= batch_size or time.monotonic() >= deadline):
+                self.__flush_violations(
+                    messages=messages,
+                    registration_queue=registration_queue,
+                )
+                messages = []
+
+    def __flush_violations(
+        self,
+        messages: List[Tuple[int, str]],
+        registration_queue: str,
+    ):
+        start = time.perf_counter()
+        animal_ids = list(dict.fromkeys([animal_id for _, animal_id in messages]))
+        animals = self.animal_repository.select(
+            query=AnimalQuery(ids=animal_ids),
+            limit=len(animal_ids),
+            offset=0,
+        )
+        if Configurations.pseudo_prediction:
+            violations = {animal.id: self.pseudo_detect_violation(animal=animal) for animal in animals}
+            unfetchable: List[str] = []
+        else:
+            violations, unfetchable = self.detect_violations(animals=animals)
+
+        self.messaging.publish_many(
+            queue_name=registration_queue,
+            bodies=[violation for violation in violations.values() if violation is not None],
+        )
+
+        dropped = []
+        failed = []
+        for delivery_tag, animal_id in messages:
+            if animal_id not in violations:
+                self.logger.error(f"no animal found for {animal_id}; ack {delivery_tag}")
+            elif animal_id in unfetchable:
+                dropped.append(delivery_tag)
+            elif violations[animal_id] is None:
+                failed.append(delivery_tag)
+        if len(dropped) == 0 and len(failed) == 0:
+            self.messaging.channel.basic_ack(
+                delivery_tag=messages[-1][0],
+                multiple=True,
+            )
+        else:
+            for delivery_tag, _ in messages:
+                if delivery_tag in dropped:
+                    self.logger.error(f"no image; drop {delivery_tag}")
+                    self.messaging.channel.basic_reject(
+                        delivery_tag=delivery_tag,
+                        requeue=False,
+                    )
+                elif delivery_tag in failed:
+                    self.logger.error(f"no prediction; requeue {delivery_tag}")
+                    self.messaging.channel.basic_reject(
+                        delivery_tag=delivery_tag,
+                        requeue=True,
+                    )
+                else:
+                    self.messaging.channel.basic_ack(delivery_tag=delivery_tag)
+        detected = len([violation for violation in violations.values() if violation is not None])
+        elapsed = time.perf_counter() - start
+        self.logger.info(
+            f"detected {detected} violations from {len(messages)} messages in {elapsed:.3f}s; "
+            f"{len(messages) / max(elapsed, 1e-6):.1f} messages/s"
+        )
 
     def pseudo_detect_violation(
         self,
@@ -106,32 +207,62 @@ class ViolationDetectionJob(object):
             "is_administrator_checked": False,
         }
 
+    def __make_violation(
+        self,
+        animal: AnimalModel,
+        probability: float,
+    ) -> Dict:
+        return {
+            "animal_id": animal.id,
+            "violation_type_id": self.violation_type_id,
+            "probability": probability,
+            "judge": Configurations.model_name,
+            "is_effective": True,
+            "is_administrator_checked": False,
+        }
+
     def detect_violation(
         self,
         animal: AnimalModel,
     ) -> Optional[Dict]:
-        with httpx.Client(
-            timeout=self.timeout,
-            transport=self.transport,
-        ) as client:
-            res = client.get(animal.photo_url)
-        if res.status_code != 200:
+        img = self.image_fetcher.fetch_sync(url=animal.photo_url)
+        if img is None:
             self.logger.error(f"failed to download {animal.id} {animal.photo_url}")
             return None
-        img = Image.open(BytesIO(res.content))
-        if img.mode == "RGBA":
-            img_rgb = Image.new("RGB", (img.height, img.width), (255, 255, 255))
-            img_rgb.paste(img, mask=img.split()[3])
-            img = img_rgb
         prediction = self.predictor.predict(img=img)
         if prediction is None:
             self.logger.error(f"failed to predict {animal.id}")
             return None
-        return {
-            "animal_id": animal.id,
-            "violation_type_id": self.violation_type_id,
-            "probability": prediction.violation_probability,
-            "judge": Configurations.model_name,
-            "is_effective": True,
-            "is_administrator_checked": False,
-        }
+        return self.__make_violation(
+            animal=animal,
+            probability=prediction.violation_probability,
+        )
+
+    def detect_violations(
+        self,
+        animals: List[AnimalModel],
+    ) -> Tuple[Dict[str, Optional[Dict]], List[str]]:
+        violations: Dict[str, Optional[Dict]] = {animal.id: None for animal in animals}
+        unfetchable: List[str] = []
+        if len(animals) == 0:
+            return violations, unfetchable
+        imgs = self.image_fetcher.fetch_many_sync(urls=[animal.photo_url for animal in animals])
+        downloaded = []
+        for animal, img in zip(animals, imgs):
+            if img is None:
+                self.logger.error(f"failed to download {animal.id} {animal.photo_url}")
+                unfetchable.append(animal.id)
+            else:
+                downloaded.append((animal, img))
+        if len(downloaded) == 0:
+            return violations, unfetchable
+        predictions = self.predictor.predict_batch(imgs=[img for _, img in downloaded])
+        if predictions is None:
+            self.logger.error(f"failed to predict {[animal.id for animal, _ in downloaded]}")
+            return violations, unfetchable
+        for (animal, _), prediction in zip(downloaded, predictions):
+            violations[animal.id] = self.__make_violation(
+                animal=animal,
+                probability=prediction.violation_probability,
+            )
+        return violations, unfetchable
@@ -16,6 +16,8 @@ def main(violation_detection_job: ViolationDetectionJob = Provide[Container.jobs
     violation_detection_job.run(
         consuming_queue=Configurations.consuming_queue,
         registration_queue=Configurations.registration_queue,
+        batch_size=Configurations.batch_size,
+        linger_ms=Configurations.batch_linger_ms,
     )
 
 
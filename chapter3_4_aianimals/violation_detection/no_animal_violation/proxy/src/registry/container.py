@@ -4,11 +4,18 @@ import logging.config
 from dependency_injector import containers, providers
 from src.configurations import Configurations
 from src.infrastructure.database import AbstractDatabase, PostgreSQLDatabase
+from src.infrastructure.image_cache import ImageCache
+from src.infrastructure.image_fetcher import ImageFetcher
 from src.infrastructure.messaging import RabbitmqMessaging
 from src.job.violation_detection_job import ViolationDetectionJob
 from src.repository.animal_repository import AbstractAnimalRepository, AnimalRepository
 from src.repository.violation_type_repository import AbstractViolationTypeRepository, ViolationTypeRepository
-from src.service.predictor import AbstractPredictor, NoViolationDetectionPredictor
+from src.service.predictor import (
+    PREDICTOR_PROTOCOL,
+    AbstractPredictor,
+    NoViolationDetectionGrpcPredictor,
+    NoViolationDetectionPredictor,
+)
 
 
 class Core(containers.DeclarativeContainer):
@@ -24,6 +31,23 @@ class Infrastructures(containers.DeclarativeContainer):
 
     database: AbstractDatabase = providers.Singleton(PostgreSQLDatabase)
     messaging: RabbitmqMessaging = providers.Singleton(RabbitmqMessaging)
+    if Configurations.image_cache_directory is not None:
+        image_cache: ImageCache = providers.Singleton(
+            ImageCache,
+            directory=Configurations.image_cache_directory,
+            max_bytes=Configurations.image_cache_max_bytes,
+            max_age_second=Configurations.image_cache_max_age_second,
+        )
+    else:
+        image_cache: ImageCache = providers.Object(None)
+    image_fetcher: ImageFetcher = providers.Singleton(
+        ImageFetcher,
+        concurrency=Configurations.download_concurrency,
+        max_bytes=Configurations.image_max_bytes,
+        size=(Configurations.predictor_height, Configurations.predictor_width),
+        decode_workers=Configurations.image_decode_workers,
+        image_cache=image_cache,
+    )
 
 
 class Repositories(containers.DeclarativeContainer):
@@ -43,12 +67,21 @@ class Repositories(containers.DeclarativeContainer):
 class Services(containers.DeclarativeContainer):
     config = providers.Configuration()
 
-    no_violation_detection_predictor: AbstractPredictor = providers.Factory(
-        NoViolationDetectionPredictor,
-        url=Configurations.predictor_url,
-        height=Configurations.predictor_height,
-        width=Configurations.predictor_width,
-    )
+    if Configurations.predictor_protocol == PREDICTOR_PROTOCOL.GRPC.value:
+        no_violation_detection_predictor: AbstractPredictor = providers.Factory(
+            NoViolationDetectionGrpcPredictor,
+            address=Configurations.predictor_grpc_address,
+            model_name=Configurations.predictor_model_name,
+            height=Configurations.predictor_height,
+            width=Configurations.predictor_width,
+        )
+    else:
+        no_violation_detection_predictor: AbstractPredictor = providers.Factory(
+            NoViolationDetectionPredictor,
+            url=Configurations.predictor_url,
+            height=Configurations.predictor_height,
+            width=Configurations.predictor_width,
+        )
 
 
 class Jobs(containers.DeclarativeContainer):
@@ -63,6 +96,7 @@ class Jobs(containers.DeclarativeContainer):
         violation_type_repository=repositories.violation_type_repository,
         animal_repository=repositories.animal_repository,
         predictor=services.no_violation_detection_predictor,
+        image_fetcher=infrastructures.image_fetcher,
     )
 
 
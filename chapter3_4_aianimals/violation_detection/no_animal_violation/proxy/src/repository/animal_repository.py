@@ -39,6 +39,8 @@ class AnimalRepository(AbstractAnimalRepository):
             if query is not None:
                 if query.id is not None:
                     filters.append(Animal.id == query.id)
+                if query.ids is not None:
+                    filters.append(Animal.id.in_(query.ids))
             results = session.query(Animal).filter(and_(*filters)).order_by(Animal.id).limit(limit).offset(offset)
             data = [
                 AnimalModel(
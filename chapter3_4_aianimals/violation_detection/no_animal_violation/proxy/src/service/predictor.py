@@ -1,12 +1,29 @@
 import json
 import logging
 from abc import ABC, abstractmethod
+from enum import Enum
 from typing import List, Optional
 
+import grpc
 import httpx
 import numpy as np
+import tensorflow as tf
 from PIL import Image
 from pydantic import BaseModel
+from tensorflow_serving.apis import predict_pb2, prediction_service_pb2_grpc
+
+
+class PREDICTOR_PROTOCOL(Enum):
+    REST = "rest"
+    GRPC = "grpc"
+
+    @staticmethod
+    def has_value(value: str) -> bool:
+        return value in [v.value for v in PREDICTOR_PROTOCOL.__members__.values()]
+
+    @staticmethod
+    def get_list() -> List[str]:
+        return [v.value for v in PREDICTOR_PROTOCOL.__members__.values()]
 
 
 class Prediction(BaseModel):
@@ -35,6 +52,13 @@ class AbstractPredictor(ABC):
     ) -> Optional[Prediction]:
         raise NotImplementedError
 
+    @abstractmethod
+    def predict_batch(
+        self,
+        imgs: List[Image],
+    ) -> Optional[List[Prediction]]:
+        raise NotImplementedError
+
 
 class NoViolationDetectionPredictor(AbstractPredictor):
     def __init__(
@@ -59,14 +83,15 @@ class NoViolationDetectionPredictor(AbstractPredictor):
         self,
         img: Image,
     ) -> np.ndarray:
-        img = img.resize((self.height, self.width))
+        if img.size != (self.height, self.width):
+            img = img.resize((self.height, self.width))
         array = np.array(img).reshape((1, self.height, self.width, 3)).astype(np.float32) / 255.0
         return array
 
     def _predict(
         self,
         img_array: np.ndarray,
-    ) -> Optional[List]:
+    ) -> Optional[List[List[float]]]:
         img_list = img_array.tolist()
         request_dict = {"inputs": {"keras_layer_input": img_list}}
         with httpx.Client(
@@ -83,7 +108,97 @@ class NoViolationDetectionPredictor(AbstractPredictor):
             return None
         response = res.json()
         self.logger.info(f"prediction: {response}")
-        return response["outputs"][0]
+        return response["outputs"]
+
+    def predict(
+        self,
+        img: Image,
+    ) -> Optional[Prediction]:
+        img_array = self._preprocess(img=img)
+        prediction = self._predict(img_array=img_array)
+        if prediction is None:
+            return None
+        return Prediction(violation_probability=prediction[0][1])
+
+    def predict_batch(
+        self,
+        imgs: List[Image],
+    ) -> Optional[List[Prediction]]:
+        if len(imgs) == 0:
+            return []
+        img_array = np.concatenate([self._preprocess(img=img) for img in imgs])
+        prediction = self._predict(img_array=img_array)
+        if prediction is None:
+            return None
+        return [Prediction(violation_probability=p[1]) for p in prediction]
+
+
+class NoViolationDetectionGrpcPredictor(AbstractPredictor):
+    def __init__(
+        self,
+        address: str = "localhost:8500",
+        model_name: str = "no_animal_violation",
+        signature_name: str = "serving_default",
+        input_name: str = "keras_layer_input",
+        height: int = 224,
+        width: int = 224,
+        timeout: float = 10.0,
+    ):
+        super().__init__()
+        self.address = address
+        self.model_name = model_name
+        self.signature_name = signature_name
+        self.input_name = input_name
+        self.height = height
+        self.width = width
+        self.timeout = timeout
+        self.channel = grpc.insecure_channel(self.address)
+        self.stub = prediction_service_pb2_grpc.PredictionServiceStub(self.channel)
+
+    def _preprocess(
+        self,
+        img: Image,
+    ) -> np.ndarray:
+        if img.size != (self.height, self.width):
+            img = img.resize((self.height, self.width))
+        array = np.array(img).reshape((1, self.height, self.width, 3)).astype(np.float32) / 255.0
+        return array
+
+    def make_request(
+        self,
+        img_array: np.ndarray,
+    ) -> predict_pb2.PredictRequest:
+        request = predict_pb2.PredictRequest()
+        request.model_spec.name = self.model_name
+        request.model_spec.signature_name = self.signature_name
+        request.inputs[self.input_name].CopyFrom(
+            tf.make_tensor_proto(
+                img_array,
+                dtype=tf.float32,
+            )
+        )
+        return request
+
+    def _predict(
+        self,
+        img_array: np.ndarray,
+    ) -> Optional[List[List[float]]]:
+        request = self.make_request(img_array=img_array)
+        try:
+            response = self.stub.Predict(
+                request,
+                timeout=self.timeout,
+            )
+        except grpc.RpcError as e:
+            self.logger.error(f"prediction failed: {e}")
+            return None
+        outputs = [tf.make_ndarray(output) for output in response.outputs.values()]
+        if len(outputs) != 1:
+            self.logger.error(f"unexpected outputs: {list(response.outputs.keys())}")
+            return None
+        prediction = outputs[0].tolist()
+        self.logger.info(f"prediction: {prediction}")
+        return prediction
 
     def predict(
         self,
@@ -93,4 +208,16 @@ class NoViolationDetectionPredictor(AbstractPredictor):
         prediction = self._predict(img_array=img_array)
         if prediction is None:
             return None
-        return Prediction(violation_probability=prediction[1])
+        return Prediction(violation_probability=prediction[0][1])
+
+    def predict_batch(
+        self,
+        imgs: List[Image],
+    ) -> Optional[List[Prediction]]:
+        if len(imgs) == 0:
+            return []
+        img_array = np.concatenate([self._preprocess(img=img) for img in imgs])
+        prediction = self._predict(img_array=img_array)
+        if prediction is None:
+            return None
+        return [Prediction(violation_probability=p[1]) for p in prediction]
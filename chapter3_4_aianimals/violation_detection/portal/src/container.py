@@ -1,6 +1,6 @@
 import logging.config
 
-from database import DBClient
+from database import PooledDBClient
 from dependency_injector.containers import DeclarativeContainer
 from dependency_injector.providers import Configuration, Container, DependenciesContainer, Factory, Resource, Singleton
 from model import AnimalRepository, ViolationRepository, ViolationTypeRepository
@@ -19,7 +19,7 @@ class Core(DeclarativeContainer):
 class Infrastructures(DeclarativeContainer):
     config = Configuration()
 
-    db_client = Singleton(DBClient)
+    db_client = Singleton(PooledDBClient)
 
 
 class Models(DeclarativeContainer):
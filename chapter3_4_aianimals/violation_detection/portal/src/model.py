@@ -1,8 +1,9 @@
 import logging
+import uuid
 from abc import ABC, abstractmethod
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple, Union
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
 
 import psycopg2
 from database import AbstractDBClient
@@ -135,6 +136,20 @@ class BaseRepository(object):
                 rows = cursor.fetchall()
         return rows
 
+    def execute_select_query_stream(
+        self,
+        query: str,
+        parameters: Optional[Tuple] = None,
+        itersize: int = 1000,
+    ) -> Iterator[Dict[str, Any]]:
+        self.logger.info(f"stream select query: {query}, parameters: {parameters}")
+        with self.db_client.get_connection() as conn:
+            with conn.cursor(name=f"stream_{uuid.uuid4().hex}", cursor_factory=DictCursor) as cursor:
+                cursor.itersize = itersize
+                cursor.execute(query, parameters)
+                for row in cursor:
+                    yield row
+
     def execute_insert_or_update_query(
         self,
         query: str,
@@ -165,6 +180,14 @@ class AbstractAnimalRepository(ABC):
     ) -> List[Animal]:
         raise NotImplementedError
 
+    @abstractmethod
+    def stream(
+        self,
+        animal_query: AnimalQuery,
+        itersize: int = 1000,
+    ) -> Iterator[Animal]:
+        raise NotImplementedError
+
     @abstractmethod
     def update_deactivated(
         self,
@@ -182,12 +205,10 @@ class AnimalRepository(BaseRepository, AbstractAnimalRepository):
         BaseRepository.__init__(self, db_client=db_client)
         AbstractAnimalRepository.__init__(self)
 
-    def select(
+    def __make_select_query(
         self,
         animal_query: AnimalQuery,
-        limit: int = 200,
-        offset: int = 0,
-    ) -> List[Animal]:
+    ) -> Tuple[str, List]:
         parameters = []
 
         query = f"""
@@ -214,6 +235,19 @@ class AnimalRepository(BaseRepository, AbstractAnimalRepository):
                     {self.animal_table}.id IN ({ids})
                 """
 
+        query += f"""
+            ORDER BY
+                {self.animal_table}.id
+        """
+        return query, parameters
+
+    def select(
+        self,
+        animal_query: AnimalQuery,
+        limit: int = 200,
+        offset: int = 0,
+    ) -> List[Animal]:
+        query, parameters = self.__make_select_query(animal_query=animal_query)
         query += f"""
             LIMIT
                 {limit}
@@ -229,6 +263,19 @@ class AnimalRepository(BaseRepository, AbstractAnimalRepository):
         data = [Animal(**r) for r in records]
         return data
 
+    def stream(
+        self,
+        animal_query: AnimalQuery,
+        itersize: int = 1000,
+    ) -> Iterator[Animal]:
+        query, parameters = self.__make_select_query(animal_query=animal_query)
+        for r in self.execute_select_query_stream(
+            query=query,
+            parameters=tuple(parameters),
+            itersize=itersize,
+        ):
+            yield Animal(**r)
+
     def update_deactivated(
         self,
         animal_id: str,
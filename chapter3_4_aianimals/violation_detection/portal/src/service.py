@@ -72,20 +72,7 @@ class AnimalService(BaseService, AbstractAnimalService):
         ids: Optional[List[str]] = None,
     ) -> pd.DataFrame:
         query = AnimalQuery(ids=ids)
-        limit: int = 200
-        offset: int = 0
-        animals = []
-        while True:
-            _animals = self.animal_repository.select(
-                animal_query=query,
-                limit=limit,
-                offset=offset,
-            )
-            if len(_animals) == 0:
-                break
-            animals.extend(_animals)
-            offset += limit
-        animal_dicts = [animal.dict() for animal in animals]
+        animal_dicts = [animal.dict() for animal in self.animal_repository.stream(animal_query=query)]
         dataframe = pd.DataFrame(animal_dicts)
         return dataframe
 